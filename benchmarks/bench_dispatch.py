@@ -0,0 +1,68 @@
+"""Routing latency of component events from 10 to 10,000 registered handlers.
+
+`legacy` registers one Starlette route per component/trigger pair, as the
+`on_change` prototype in tests2.py does; `dispatcher` is FluidFrame's single
+event route with a dict lookup. Requests go straight through the ASGI interface.
+"""
+import time
+import asyncio
+from starlette.applications import Starlette
+from starlette.responses import HTMLResponse
+from fluidframe_test.config import EVENT_PREFIX
+from fluidframe_test.core.fluidframe import FluidFrame
+
+
+def handler() -> str:
+    return "ok"
+
+
+async def legacy_endpoint(request):
+    return HTMLResponse(handler())
+
+
+def legacy_app(count: int) -> Starlette:
+    app = Starlette()
+    for n in range(count):
+        app.add_route(f"/component-{n}/click", legacy_endpoint)
+    return app
+
+
+def dispatcher_app(count: int) -> FluidFrame:
+    app = FluidFrame(reload=False)
+    for n in range(count):
+        app.add_event_handler(f"component-{n}", "click", handler)
+    return app
+
+
+async def call(app, path: str) -> None:
+    scope = {
+        "type": "http", "method": "GET", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": [], "scheme": "http", "http_version": "1.1",
+        "server": ("bench", 80), "client": ("bench", 1),
+    }
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    async def send(message):
+        pass
+    await app(scope, receive, send)
+
+
+async def measure(app, path: str, requests: int) -> float:
+    await call(app, path)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call(app, path)
+    return (time.perf_counter() - start) / requests
+
+
+async def run(requests: int = 500) -> None:
+    print(f"{'handlers':>9} | {'legacy (us)':>12} | {'dispatcher (us)':>15}")
+    for count in (10, 100, 1000, 10000):
+        # The last registered handler is the worst case for a linear route scan.
+        legacy = await measure(legacy_app(count), f"/component-{count - 1}/click", requests)
+        single = await measure(dispatcher_app(count), f"{EVENT_PREFIX}/component-{count - 1}/click", requests)
+        print(f"{count:>9} | {legacy * 1e6:>12.1f} | {single * 1e6:>15.1f}")
+
+
+if __name__ == '__main__':
+    asyncio.run(run())
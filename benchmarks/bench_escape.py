@@ -0,0 +1,27 @@
+"""Compare the tag engine's built-in `escape` with `html.escape`.
+
+Clean strings are the common case in rendered pages and take the scan-only fast path.
+"""
+import html
+import timeit
+from fluidframe_test.core import escape
+
+SAMPLES = {
+    "clean short": "Increment",
+    "clean tailwind": "bg-blue-500 m-5 hover:bg-blue-700 text-white font-bold py-2 px-4 rounded",
+    "clean paragraph": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20,
+    "dirty short": "a < b & c",
+    "dirty paragraph": "<p class=\"x\">Tom & Jerry's</p> " * 20,
+}
+
+
+def main(number: int = 200_000) -> None:
+    for name, text in SAMPLES.items():
+        assert escape(text) == html.escape(text)
+        ours = min(timeit.repeat(lambda: escape(text), number=number, repeat=5)) / number
+        stdlib = min(timeit.repeat(lambda: html.escape(text), number=number, repeat=5)) / number
+        print(f"{name:16}: escape {ours * 1e9:8.1f} ns | html.escape {stdlib * 1e9:8.1f} ns | {stdlib / ours:5.2f}x")
+
+
+if __name__ == '__main__':
+    main()
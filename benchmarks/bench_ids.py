@@ -0,0 +1,74 @@
+"""Benchmark `UniqueIDGenerator` over 100k component paths.
+
+`LegacyUniqueIDGenerator` is the previous implementation, which hashed every
+segment on every call, base-36 encoded the full SHA1 digest and probed for free
+suffixes from zero.
+"""
+import time
+import string
+import hashlib
+from fluidframe_test.utilities.helper import UniqueIDGenerator, segment_code
+
+
+class LegacyUniqueIDGenerator:
+    def __init__(self):
+        self.generated_ids = set()
+        self.base_chars = string.ascii_lowercase + string.digits
+
+    def base_encode(self, number, base_chars):
+        if number == 0:
+            return base_chars[0]
+        base = len(base_chars)
+        encoded = []
+        while number:
+            number, rem = divmod(number, base)
+            encoded.append(base_chars[rem])
+        return ''.join(reversed(encoded))
+
+    def generate_base_code(self, name, length=4):
+        hash_object = hashlib.sha1(name.encode())
+        hash_code = int(hash_object.hexdigest(), 16)
+        return self.base_encode(hash_code, self.base_chars)[:length]
+
+    def generate_unique_id(self, component_path):
+        if len(component_path) == 1:
+            unique_id = component_path[0]
+        else:
+            base_codes = [self.generate_base_code(name) for name in component_path]
+            base_id = '-'.join(base_codes)
+            unique_id = f'{base_id}-{component_path[-1]}'
+        extra_index = 0
+        while unique_id in self.generated_ids:
+            extra_code = self.base_encode(extra_index, self.base_chars)
+            unique_id = f"{base_id}-{extra_code}"
+            extra_index += 1
+        self.generated_ids.add(unique_id)
+        return unique_id
+
+
+def make_paths(count: int = 100_000):
+    # Wide apps repeat the same component types under the same containers, so many
+    # paths collide and exercise the suffix counter.
+    return [["root", f"column{n % 20}", f"container{n % 7}", ("button", "text", "slider")[n % 3]] for n in range(count)]
+
+
+def run(generator_class, paths) -> float:
+    generator = generator_class()
+    start = time.perf_counter()
+    for path in paths:
+        generator.generate_unique_id(path)
+    return time.perf_counter() - start
+
+
+def main(count: int = 100_000) -> None:
+    paths = make_paths(count)
+    before = run(LegacyUniqueIDGenerator, paths)
+    segment_code.cache_clear()
+    after = run(UniqueIDGenerator, paths)
+    print(f"legacy generator : {before * 1e3:9.2f} ms / {count} paths")
+    print(f"memoized counter : {after * 1e3:9.2f} ms / {count} paths")
+    print(f"speedup          : {before / after:9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Micro-benchmark for the tag engine on a 10k-node tree, a 2k-level deep page and
+a 100k-row table.
+
+`legacy_element` reproduces the previous closure-based `create_element` so the
+before/after numbers can be compared from a single build of the extension.
+"""
+import timeit
+from fluidframe_test.core import div, span, li, ul, p, section, table, tbody, tr, td
+
+
+def legacy_element(tag: str, closing_tag: bool = True):
+    starting_tag, end_tag = f"<{tag} ", f"</{tag}>"
+
+    def element(*args, **kwargs):
+        attributes, content_items = [], []
+        i = kwargs.pop('i', None)
+        content = kwargs.pop('content', None)
+        content = i or content
+        if content is not None:
+            if isinstance(content, list):
+                content_items.extend([str(c) for c in content])
+            else:
+                content_items.append(str(content))
+        for arg in args:
+            if isinstance(arg, list):
+                content_items.extend([str(ar) for ar in arg])
+            else:
+                content_items.append(str(arg))
+        for key, value in kwargs.items():
+            key = 'class' if key == 'cls' else key
+            attributes.extend([key.replace('_', '-'), '="', value, '" '])
+        attr_str = ''.join(attributes)
+        content_str = ''.join(content_items)
+        if not closing_tag:
+            return ''.join([starting_tag, attr_str, ' />'])
+        return ''.join([starting_tag, attr_str, ">", content_str, end_tag])
+
+    def factory(*args, **kwargs):
+        return element(*args, **kwargs)
+    return factory
+
+
+def build_tree(div, span, li, ul, p, rows: int = 2000) -> str:
+    # 5 elements per row -> 10k nodes in total.
+    return div(
+        ul(i=[
+            li(span(f"item {n}", cls="text-sm font-bold"), p("detail", data_row=str(n)), cls="py-2 px-4 border")
+            for n in range(rows)
+        ], cls="list-none"),
+        id="root",
+    )
+
+
+def build_deep(element, depth: int = 2000) -> str:
+    # Each level wraps the previous one, so eager strings copy the payload `depth` times.
+    tree = "x" * 1000
+    for level in range(depth):
+        tree = element(tree, cls="nested", data_level=str(level))
+    return str(tree)
+
+
+def main(number: int = 20) -> None:
+    legacy = [legacy_element(tag) for tag in ("div", "span", "li", "ul", "p")]
+    assert build_tree(*legacy) == build_tree(div, span, li, ul, p)
+
+    before = min(timeit.repeat(lambda: build_tree(*legacy), number=number, repeat=5)) / number
+    after = min(timeit.repeat(lambda: build_tree(div, span, li, ul, p), number=number, repeat=5)) / number
+    print(f"legacy closure : {before * 1e3:8.3f} ms / 10k nodes")
+    print(f"compiled path  : {after * 1e3:8.3f} ms / 10k nodes")
+    print(f"speedup        : {before / after:8.2f}x")
+
+    assert build_deep(section) == build_deep(section.node)
+    eager = min(timeit.repeat(lambda: build_deep(section), number=5, repeat=3)) / 5
+    lazy = min(timeit.repeat(lambda: build_deep(section.node), number=5, repeat=3)) / 5
+    print(f"deep eager str : {eager * 1e3:8.3f} ms / 2k levels")
+    print(f"deep node tree : {lazy * 1e3:8.3f} ms / 2k levels")
+
+    rows = [(n, f"name {n}", n * 1.5) for n in range(100_000)]
+    per_call = lambda: table(tbody([tr([td(cell) for cell in row]) for row in rows]))
+    bulk = lambda: table(tbody.map(rows, tr, td))
+    assert per_call() == bulk()
+    comprehension = min(timeit.repeat(per_call, number=3, repeat=3)) / 3
+    mapped = min(timeit.repeat(bulk, number=3, repeat=3)) / 3
+    print(f"table per call : {comprehension * 1e3:8.3f} ms / 100k rows")
+    print(f"table .map     : {mapped * 1e3:8.3f} ms / 100k rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Import-time budget for the core modules.
+
+Each target is imported in fresh interpreters under `python -X importtime`, and the
+median cumulative time must stay within its budget. Independently of timing, the
+optional heavy dependencies must not be imported by the core at all, which is the
+machine-independent part of the check.
+
+    python -m benchmarks.import_budget
+    python -m benchmarks.import_budget --scale 1.5   # slower machine
+"""
+import sys, argparse
+import statistics, subprocess
+from typing import Dict, List, Set, Tuple
+
+# Module -> budget in ms for its cumulative import time, measured with some headroom
+# on the development machine. asyncio and Starlette are most of it.
+BUDGETS: Dict[str, float] = {
+    "fluidframe_test.core.components": 140.0,
+    "fluidframe_test.core.fluidframe": 220.0,
+}
+
+# Loaded on first use only: markdown rendering, the markdown process pool, the SQLite
+# state store, the hot reloader and response compression (imported by FluidFrame itself).
+LAZY_MODULES = ("markdown_it", "mdit_py_plugins", "bs4", "multiprocessing", "concurrent.futures.process", "sqlite3", "fluidframe_test.core.reload")
+
+
+def import_profile(module: str) -> Tuple[float, Set[str]]:
+    """Cumulative import time of `module` in ms and every module imported along with it."""
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True).stderr
+    cumulative, imported = 0.0, set()
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        name = name.strip()
+        if not total.strip().isdigit():
+            continue
+        imported.add(name)
+        if name == module:
+            cumulative = int(total) / 1000
+    return cumulative, imported
+
+
+def check(scale: float, runs: int) -> List[str]:
+    failures = []
+    for module, budget in BUDGETS.items():
+        timings, imported = [], set()
+        for _ in range(runs):
+            cumulative, imported = import_profile(module)
+            timings.append(cumulative)
+        median = statistics.median(timings)
+        limit = budget * scale
+        eager = [name for name in LAZY_MODULES if name in imported]
+        status = "ok" if median <= limit and not eager else "FAIL"
+        print(f"{module:<36} {median:8.1f} ms  (budget {limit:.0f} ms)  {status}")
+        if median > limit:
+            failures.append(f"{module} took {median:.1f} ms, over its {limit:.0f} ms budget")
+        for name in eager:
+            failures.append(f"{module} imports {name} eagerly")
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget, for slower machines")
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+    failures = check(args.scale, args.runs)
+    for failure in failures:
+        print(failure)
+    sys.exit(1 if failures else 0)
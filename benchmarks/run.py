@@ -0,0 +1,298 @@
+"""Benchmark suite with fixed synthetic workloads, JSON results and a stored baseline.
+
+    python -m benchmarks.run                      # run everything, compare with baseline.json
+    python -m benchmarks.run -k asgi -k tags      # only workloads whose name contains a filter
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --save-baseline      # record this machine's numbers as the baseline
+
+Each workload runs once to warm up and then `repeat` times; the median is compared
+with the baseline and a workload slower by more than `--threshold` fails the run.
+The cost of render metrics is checked against `--metrics-budget` on every run, by
+alternating page renders with metrics on and off on the same app; the run fails when
+the whole confidence interval of the cost is above the budget.
+Baselines are machine specific and are not committed: record one on the machine that runs
+the comparison. A baseline recorded on another CPU or Python is reported and skipped.
+Everything runs offline and in process.
+"""
+import gc, sys, json, math, time
+import asyncio, argparse, platform, statistics
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from fluidframe_test.core import div, span, li, ul, p, a, h2, section
+from fluidframe_test.core.cache import RENDER_CACHE
+from fluidframe_test.core.metrics import METRICS
+from fluidframe_test.core.components import Root, StatelessComponent
+from fluidframe_test.core.fluidframe import FluidFrame
+from fluidframe_test.utilities import helper
+from fluidframe_test.utilities.helper import UniqueIDGenerator, segment_code, markdown_to_html
+from benchmarks.bench_tags import build_tree, build_deep
+from benchmarks.bench_ids import make_paths
+from benchmarks.bench_dispatch import call
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+class Card(StatelessComponent):
+    # Not cacheable, so every page render pays for every component.
+    cacheable = False
+
+    def __init__(self, parent, title: str, body: str, key=None):
+        super().__init__(parent, key, title=title, body=body)
+
+    def render(self):
+        return div(
+            p(self.title, cls="text-lg font-semibold text-gray-900 dark:text-white"),
+            span(self.body, cls="text-sm text-gray-500 dark:text-gray-400"),
+            id=self.id, cls="flex flex-col gap-2 p-4 rounded-lg border border-gray-200 shadow-sm",
+        )
+
+
+class Article(StatelessComponent):
+    # About 20 elements, the size of a typical card or list entry.
+    cacheable = False
+
+    def __init__(self, parent, n: int, key=None):
+        super().__init__(parent, key, n=n)
+
+    def render(self):
+        return section(
+            h2(f"Article {self.n}", cls="text-xl font-bold"),
+            p("Some text about the article, long enough to wrap once or twice.", cls="text-gray-600"),
+            ul([li(a(f"Link {m}", href=f"/articles/{self.n}/{m}"), cls="py-1") for m in range(8)], cls="list-disc"),
+            div(span("tag"), span("other tag"), cls="flex gap-2"),
+            id=self.id, cls="p-4 border rounded",
+        )
+
+
+def make_root(children: int) -> Root:
+    root = Root(reload=False)
+    root.add_children([Card(root, f"Card {n}", f"Body of card {n}") for n in range(children)])
+    return root
+
+
+def make_markdown(sections: int = 40) -> str:
+    # Headings, paragraphs with inline markup, lists, a table and code, like a typical docs page.
+    parts = []
+    for n in range(sections):
+        parts.append(f"## Section {n}\n\nSome *emphasis*, **strong text**, `inline code` and a [link](https://example.com/{n}).\n")
+        parts.append("\n".join(f"- item {n}.{m} with some words" for m in range(5)) + "\n")
+        parts.append("| name | value |\n| --- | --- |\n" + "\n".join(f"| row {m} | {m * n} |" for m in range(4)) + "\n")
+        parts.append(f"```python\ndef section_{n}():\n    return {n}\n```\n")
+    return "\n".join(parts)
+
+
+def make_app(children: int) -> Tuple[FluidFrame, str]:
+    app = FluidFrame(reload=False)
+    cards = [app.child(Card(app, f"Card {n}", f"Body of card {n}")) for n in range(children)]
+    cards[0].on_change("click", cards[0], "outerHTML")(lambda: cards[0].render())
+    return app, f"/_event/{cards[0].id}/click"
+
+
+def make_articles(children: int) -> FluidFrame:
+    app = FluidFrame(reload=False)
+    for n in range(children):
+        app.child(Article(app, n))
+    return app
+
+
+def workloads() -> Dict[str, Callable[[], Callable[[], object]]]:
+    """Workload name -> setup returning the function to time."""
+    def tags_wide():
+        return lambda: build_tree(div, span, li, ul, p)
+
+    def tags_deep():
+        return lambda: build_deep(section)
+
+    def tags_deep_node():
+        return lambda: build_deep(section.node)
+
+    def root_render(children):
+        def setup():
+            root = make_root(children)
+            return root.render
+        return setup
+
+    def ids():
+        paths = make_paths(100_000)
+        def run():
+            segment_code.cache_clear()
+            generator = UniqueIDGenerator()
+            for path in paths:
+                generator.generate_unique_id(path)
+        return run
+
+    def markdown():
+        document = make_markdown()
+        def run():
+            # Cleared so every run renders instead of hitting the markdown cache.
+            helper.MARKDOWN_CACHE.clear()
+            markdown_to_html(document)
+        return run
+
+    def asgi(children, route):
+        def setup():
+            app, event = make_app(children)
+            path = "/" if route == "page" else event
+            loop = asyncio.new_event_loop()
+            return lambda: loop.run_until_complete(call(app, path))
+        return setup
+
+    def articles(children):
+        def setup():
+            app = make_articles(children)
+            loop = asyncio.new_event_loop()
+            return lambda: loop.run_until_complete(call(app, "/"))
+        return setup
+
+    return {
+        "tags_wide_10k": tags_wide,
+        "tags_deep_2k": tags_deep,
+        "tags_deep_2k_node": tags_deep_node,
+        "root_render_1k": root_render(1_000),
+        "root_render_10k": root_render(10_000),
+        "ids_100k": ids,
+        "markdown_doc": markdown,
+        "asgi_page_1k": asgi(1_000, "page"),
+        "asgi_articles_300": articles(300),
+        "asgi_event": asgi(1_000, "event"),
+    }
+
+
+def measure(run: Callable[[], object], repeat: int) -> List[float]:
+    run()
+    timings = []
+    for _ in range(repeat):
+        RENDER_CACHE.clear()
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def processor() -> str:
+    # platform.processor() is empty on most Linux systems, the CPU model is in /proc/cpuinfo.
+    try:
+        for line in Path("/proc/cpuinfo").read_text().splitlines():
+            if line.startswith("model name"):
+                return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "processor": processor(),
+    }
+
+
+def metrics_overhead(pairs: int, children: int=300) -> Tuple[float, float, float]:
+    """Relative cost of render metrics on a page of `children` articles, with a 95% interval.
+
+    Each pair renders the page with metrics on and off, in alternating order, so drift in
+    the machine's speed cancels out. Returns the median of the pairs' ratios and the
+    bounds of its confidence interval, taken from the order statistics of the ratios.
+    """
+    app = make_articles(children)
+    loop = asyncio.new_event_loop()
+    run = lambda: loop.run_until_complete(call(app, "/"))
+    enabled, per_id = METRICS.enabled, METRICS.per_id
+    ratios = []
+    try:
+        METRICS.per_id = False
+        for on in (True, False):
+            METRICS.enabled = on
+            run()
+        for n in range(pairs):
+            timings = {}
+            for on in ((True, False) if n % 2 else (False, True)):
+                METRICS.enabled = on
+                gc.collect()
+                start = time.perf_counter()
+                run()
+                timings[on] = time.perf_counter() - start
+            ratios.append(timings[True] / timings[False] - 1)
+    finally:
+        METRICS.enabled, METRICS.per_id = enabled, per_id
+        METRICS.reset()
+        loop.close()
+    ratios.sort()
+    spread = 1.96 * math.sqrt(pairs) / 2
+    low, high = max(int(pairs / 2 - spread), 0), min(math.ceil(pairs / 2 + spread), pairs - 1)
+    return statistics.median(ratios), ratios[low], ratios[high]
+
+
+def run_suite(filters: List[str], repeat: int) -> Dict:
+    results = {}
+    for name, setup in workloads().items():
+        if filters and not any(f in name for f in filters):
+            continue
+        timings = measure(setup(), repeat)
+        results[name] = {"median": statistics.median(timings), "min": min(timings), "repeat": repeat}
+        print(f"{name:<20} median {results[name]['median'] * 1e3:10.3f} ms   min {results[name]['min'] * 1e3:10.3f} ms")
+    return {**environment(), "results": results}
+
+
+def compare(report: Dict, baseline: Dict, threshold: float) -> List[str]:
+    regressions = []
+    print(f"\n{'workload':<20} {'baseline (ms)':>14} {'now (ms)':>10} {'ratio':>7}")
+    for name, result in report["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            print(f"{name:<20} {'-':>14} {result['median'] * 1e3:>10.3f}")
+            continue
+        ratio = result["median"] / before["median"]
+        flag = "  REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{name:<20} {before['median'] * 1e3:>14.3f} {result['median'] * 1e3:>10.3f} {ratio:>6.2f}x{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="FluidFrame benchmark suite")
+    parser.add_argument("-k", dest="filters", action="append", default=[], help="Only run workloads whose name contains this")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", default=str(BASELINE), help="Baseline JSON to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown of the median before failing")
+    parser.add_argument("--metrics-budget", type=float, default=0.02, help="Allowed cost of render metrics on a page render")
+    args = parser.parse_args()
+
+    report = run_suite(args.filters, args.repeat)
+    over_budget = False
+    if not args.filters or any(f in "metrics_overhead" for f in args.filters):
+        overhead, low, high = metrics_overhead(args.repeat * 20)
+        report["metrics_overhead"] = {"median": overhead, "low": low, "high": high}
+        # Only an interval entirely above the budget fails, noise alone never does.
+        over_budget = low > args.metrics_budget
+        flag = "  OVER BUDGET" if over_budget else ""
+        print(f"{'metrics_overhead':<20} {overhead:+.1%} (95% interval {low:+.1%} to {high:+.1%}, budget {args.metrics_budget:.0%}){flag}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        Path(args.baseline).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+        return int(over_budget)
+    if not Path(args.baseline).exists():
+        print(f"No baseline at {args.baseline}, run with --save-baseline first")
+        return int(over_budget)
+    baseline = json.loads(Path(args.baseline).read_text())
+    mismatched = [key for key in environment() if baseline.get(key) != report[key]]
+    if mismatched:
+        print(f"Baseline at {args.baseline} was recorded with a different {', '.join(mismatched)}, skipping the comparison")
+        return int(over_budget)
+    regressions = compare(report, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} workloads regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return int(over_budget)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
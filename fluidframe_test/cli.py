@@ -1,6 +1,12 @@
 import argparse
 from fluidframe_test.utilities.node_utils import init_project, install
 from fluidframe_test.utilities.tailwind_utils import tailwind_build
+from fluidframe_test.core.assets import build_assets
+
+
+def build_static(args):
+    summary = build_assets(args.directories or None)
+    print(f"Fingerprinted {summary['files']} assets, precompressed {summary['compressed']}")
 
 
 def main():
@@ -21,6 +27,11 @@ def main():
     watch_parser = subparsers.add_parser('tailwind_build', help='Start Tailwind CSS build process')
     watch_parser.set_defaults(func=tailwind_build)
 
+    # Precompress static assets and write their content hash manifests
+    assets_parser = subparsers.add_parser('build_assets', help='Precompress static assets and write their hash manifests')
+    assets_parser.add_argument('directories', nargs='*', help='Asset directories (defaults to the FluidFrame public and module folders)')
+    assets_parser.set_defaults(func=build_static)
+
     args = parser.parse_args()
     if hasattr(args, 'func'):
         args.func(args)
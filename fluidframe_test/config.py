@@ -23,4 +23,71 @@ SCRIPTS = [
 
 HOT_RELOAD_SCRIPT = f"{PUBLIC_DIR}/scripts/hot_reload.js"
 
+# Static assets: file types stored precompressed and the max-age of fingerprinted URLs.
+COMPRESSIBLE_ASSETS = (".js", ".mjs", ".css", ".svg", ".json", ".map", ".html", ".txt", ".xml")
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+# Response compression: smallest body worth compressing, zlib level, body size compressed
+# in a worker thread rather than on the event loop, and number and total compressed bytes
+# of the shared bodies cached.
+COMPRESS_MIN_SIZE = 500
+COMPRESS_LEVEL = 6
+COMPRESS_THREAD_THRESHOLD = 256 * 1024
+COMPRESSION_CACHE_SIZE = 256
+COMPRESSION_CACHE_BYTES = 8 * 1024 * 1024
+
+# Dependencies declared with `requires()` during a page render are served as one bundle
+# per dependency set from `{BUNDLE_PREFIX}/{hash}.js|css?files=...`, keeping up to BUNDLE_CACHE_SIZE built.
+BUNDLE_PREFIX = "/_fluid/bundle"
+BUNDLE_CACHE_SIZE = 64
+
+# Route of the Prometheus metrics exposed by `FluidFrame(metrics=True)`, and the
+# upper bounds in seconds of its latency histogram buckets.
+METRICS_PATH = "/_fluid/metrics"
+METRICS_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# Component renders recorded before they are added to their series.
+METRICS_BATCH = 4096
+
+# Later windows of a windowed `LayoutComponent` are served from `{WINDOW_PREFIX}/{component_id}?start=n`.
+WINDOW_PREFIX = "/_fluid/window"
+
+# Every component event is served by a single route: `{EVENT_PREFIX}/{component_id}/{trigger}`.
+EVENT_PREFIX = "/_event"
+
+# Maximum number of components rendered concurrently for a single page.
+RENDER_CONCURRENCY = 16
+
+# Maximum number of rendered component fragments kept in the render cache.
+RENDER_CACHE_SIZE = 1024
+
+# Maximum number of (page, component) fragment hashes remembered for out-of-band updates,
+# and the request header carrying the id of the page load an event comes from.
+FRAGMENT_TRACKER_SIZE = 100_000
+PAGE_HEADER = "X-Fluid-Page"
+
+# Server push: pending messages per WebSocket before it counts as a slow consumer, and send timeout in seconds.
+PUSH_QUEUE_SIZE = 256
+PUSH_SEND_TIMEOUT = 5.0
+
+# Seconds between source file scans of the in-process hot reloader.
+WATCH_INTERVAL = 0.25
+
+# Prefork workers exiting within WORKER_MIN_UPTIME seconds of their start are restarted after
+# a delay that doubles from WORKER_RESTART_DELAY up to WORKER_RESTART_MAX_DELAY seconds.
+WORKER_MIN_UPTIME = 5.0
+WORKER_RESTART_DELAY = 0.5
+WORKER_RESTART_MAX_DELAY = 30.0
+
+# Per-client component state: the client id cookie, idle expiry and in-memory store limits.
+STATE_COOKIE = "fluidframe_client"
+STATE_TTL = 24 * 60 * 60
+STATE_MAX_ENTRIES = 100_000
+STATE_MAX_BYTES = 64 * 1024 * 1024
+
+# Maximum number of rendered markdown documents kept in memory.
+MARKDOWN_CACHE_SIZE = 512
+
+# `markdown_to_html_many` only fans out to worker processes for at least this many uncached texts.
+MARKDOWN_PARALLEL_THRESHOLD = 64
+
 
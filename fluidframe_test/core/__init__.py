@@ -1,4 +1,5 @@
 from fluidframe_test.core.tags.tags import (
+    Element, Node, Markup, create_element, escape, fragment, set_node_mode, reset_node_mode, get_node_mode, set_autoescape, reset_autoescape, get_autoescape,
     i, a, b, p, s, u, h1, h2, h3, h4, h5, h6, dd, dl, dt, em, li, rp, rt, ol, 
     ul, td, th, tr, var, nav, sub, sup, svg, ins, kbd, dfn, div, pre, del_, map_, ruby, samp, slot, span, html, 
     form, head, abbr, main, mark, math, menu, body, cite, code, data, time_, aside, audio, style, table, tbody, video, small, label, 
@@ -8,6 +9,7 @@ from fluidframe_test.core.tags.tags import (
 )
   
 __all__ = [
+    'Element', 'Node', 'Markup', 'create_element', 'escape', 'fragment', 'set_node_mode', 'reset_node_mode', 'get_node_mode', 'set_autoescape', 'reset_autoescape', 'get_autoescape',
     'i', 'a', 'b', 'p', 's', 'u', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'dd', 'dl', 'dt', 'em', 'li', 'rp', 'rt', 'ol', 'ul', 'td', 'th', 'tr', 'var', 'nav', 'sub', 'sup', 'svg', 'ins',
     'kbd', 'dfn', 'div', 'pre', 'del_', 'map_', 'ruby', 'samp', 'slot', 'span', 'html', 'form', 'head', 'abbr', 'main', 'mark', 'math', 'menu', 'body', 'cite', 'code', 'data', 'time_', 'aside',
     'audio', 'style', 'table', 'tbody', 'video', 'small', 'label', 'meter', 'tfoot', 'thead', 'title', 'hgroup', 'select', 'strong', 'legend', 'option', 'output', 'button', 'canvas', 'dialog',
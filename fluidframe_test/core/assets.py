@@ -0,0 +1,121 @@
+import os, re
+import json, hashlib
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from fluidframe_test import get_lib_path
+from fluidframe_test.config import PUBLIC_DIR, MODULES_DIR, COMPRESSIBLE_ASSETS
+
+# `name.<hash>.ext`, the form `asset_url` gives fingerprinted files.
+HASHED_NAME = re.compile(r"^(.*)\.([0-9a-f]{12})(\.[^./]+)$")
+MANIFEST_NAME = "manifest.json"
+
+# URL prefix -> directory served under it.
+ASSET_DIRS: Dict[str, str] = {
+    PUBLIC_DIR: str(get_lib_path() / "public"),
+    MODULES_DIR: str(get_lib_path() / "node_modules"),
+}
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=6)
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class AssetManifest:
+    """Content hashes of asset files, recomputed only when a file's mtime changes.
+
+    A `manifest.json` written by `build_assets` prefills the hashes, so a built
+    deployment does not read every file on first use.
+    """
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.hashes: Dict[str, Tuple[int, str]] = {}
+        self.loaded: set = set()
+
+    def load(self, directory: str) -> None:
+        with self.lock:
+            if directory in self.loaded:
+                return
+            self.loaded.add(directory)
+        try:
+            with open(os.path.join(directory, MANIFEST_NAME)) as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return
+        with self.lock:
+            for name, (mtime, digest) in entries.items():
+                self.hashes.setdefault(os.path.join(directory, name), (mtime, digest))
+
+    def hash_of(self, path: str) -> Optional[str]:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        entry = self.hashes.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        digest = file_hash(path)
+        with self.lock:
+            self.hashes[path] = (mtime, digest)
+        return digest
+
+
+
+MANIFEST = AssetManifest()
+
+def resolve(url: str) -> Optional[Tuple[str, str, str]]:
+    """Split an asset URL into (prefix, relative path, file path) if it is served by FluidFrame."""
+    prefix, _, relative = url.lstrip("/").partition("/")
+    directory = ASSET_DIRS.get(prefix)
+    if directory is None or not relative:
+        return None
+    path = os.path.normpath(os.path.join(directory, relative))
+    # URLs can come from requests, so `..` must not lead out of the asset directory.
+    if not path.startswith(os.path.join(directory, "")):
+        return None
+    return prefix, relative, path
+
+def asset_url(url: str) -> str:
+    """Return the fingerprinted form of a FluidFrame asset URL, or `url` itself for anything else."""
+    resolved = resolve(url)
+    if resolved is None:
+        return url
+    prefix, relative, path = resolved
+    MANIFEST.load(ASSET_DIRS[prefix])
+    digest = MANIFEST.hash_of(path)
+    if digest is None:
+        return url
+    stem, ext = os.path.splitext(url)
+    return f"{stem}.{digest}{ext}"
+
+def asset_urls(urls: Iterable[str]) -> List[str]:
+    return [asset_url(url) for url in urls]
+
+def build_assets(directories: Optional[Iterable[str]]=None, level: int=9) -> Dict[str, int]:
+    """Write a `.gz` next to every compressible asset and a `manifest.json` of content hashes per directory."""
+    import gzip
+    summary = {"files": 0, "compressed": 0}
+    for directory in directories or ASSET_DIRS.values():
+        if not os.path.isdir(directory):
+            continue
+        entries = {}
+        for folder, _, files in os.walk(directory):
+            for name in files:
+                path = os.path.join(folder, name)
+                if name == MANIFEST_NAME or name.endswith(".gz"):
+                    continue
+                info = os.stat(path)
+                entries[os.path.relpath(path, directory)] = (info.st_mtime_ns, file_hash(path))
+                summary["files"] += 1
+                if name.endswith(COMPRESSIBLE_ASSETS):
+                    target = path + ".gz"
+                    if not os.path.exists(target) or os.stat(target).st_mtime_ns < info.st_mtime_ns:
+                        with open(path, "rb") as source, gzip.open(target, "wb", compresslevel=level) as compressed:
+                            compressed.write(source.read())
+                        summary["compressed"] += 1
+        with open(os.path.join(directory, MANIFEST_NAME), "w") as file:
+            json.dump(entries, file)
+    return summary
@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Set, Tuple
+from fluidframe_test.config import RENDER_CACHE_SIZE
+
+
+class RenderCache:
+    """LRU cache of rendered component fragments.
+
+    Entries are keyed on `(component_id, inputs)`, with the render inputs themselves
+    rather than their hash, so a component whose render inputs change simply misses
+    even when the old and new inputs hash the same. `invalidate` drops every entry of
+    a component whose output depends on something outside its inputs (e.g. its state).
+
+    `version` is bumped on every invalidation, so it changes whenever rendered
+    output may have changed and can be used as a cheap page fingerprint.
+    """
+    def __init__(self, maxsize: int=RENDER_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+        self.lock = threading.Lock()
+        self.entries: 'OrderedDict[Tuple[str, Hashable], str]' = OrderedDict()
+        self.keys_by_id: Dict[str, Set[Tuple[str, Hashable]]] = {}
+
+    def get(self, component_id: str, inputs: Hashable) -> Optional[str]:
+        key = (component_id, inputs)
+        with self.lock:
+            html = self.entries.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return html
+
+    def set(self, component_id: str, inputs: Hashable, html: str) -> None:
+        key = (component_id, inputs)
+        with self.lock:
+            self.entries[key] = html
+            self.entries.move_to_end(key)
+            self.keys_by_id.setdefault(component_id, set()).add(key)
+            while len(self.entries) > self.maxsize:
+                evicted, _ = self.entries.popitem(last=False)
+                self.forget(evicted)
+
+    def bump(self) -> int:
+        with self.lock:
+            self.version += 1
+            return self.version
+
+    def invalidate(self, component_id: str) -> None:
+        with self.lock:
+            self.version += 1
+            for key in self.keys_by_id.pop(component_id, ()):
+                self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.keys_by_id.clear()
+            self.hits = self.misses = 0
+            self.version += 1
+
+    def forget(self, key: Tuple[str, Hashable]) -> None:
+        keys = self.keys_by_id.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.keys_by_id[key[0]]
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries), "maxsize": self.maxsize, "version": self.version}
+
+
+
+RENDER_CACHE = RenderCache()
@@ -1,36 +1,96 @@
-import os
+import os, asyncio, inspect
+from time import perf_counter
+from contextvars import ContextVar
+from operator import attrgetter
 from typing import List, Optional
 from abc import ABC, abstractmethod
-from starlette.routing import Route
-from fluidframe_test.core.dependency import requires
+from typing import TYPE_CHECKING
+from fluidframe_test.core.assets import asset_urls
+from fluidframe_test.core.dependency import Fragment, collecting, replay, requires
 from fluidframe_test.utilities.helper import UniqueIDGenerator
-from typing import Optional, Any, Callable, Dict, Tuple, Union
-from fluidframe_test.config import TITLE, SCRIPTS, STYLES, HOT_RELOAD_SCRIPT
-from fluidframe_test.core import html, body, meta, script, link, div, head, title
+from fluidframe_test.core.cache import RENDER_CACHE
+from fluidframe_test.core.metrics import METRICS
+from fluidframe_test.core.template import Template
+from fluidframe_test.core.state import CLIENT_ID, get_state_store
+from fluidframe_test.core.updates import PAGE_ID, SENT_FRAGMENTS, swap_oob
+from typing import Optional, Any, Callable, Dict, Hashable, Iterable, Tuple, Union
+from fluidframe_test.config import TITLE, SCRIPTS, STYLES, HOT_RELOAD_SCRIPT, RENDER_CONCURRENCY, EVENT_PREFIX, WINDOW_PREFIX
+from fluidframe_test.core import Markup, Node, create_element, fragment, html, body, meta, script, link, div, head, title, td
+
+if TYPE_CHECKING:
+    from starlette.routing import Route
+
+# (layout, rendered children) while an async render runs the layout's `render`, which can't await its children.
+PRERENDERED_CHILDREN: ContextVar[Optional[Tuple['LayoutComponent', List[str]]]] = ContextVar("fluidframe_prerendered_children", default=None)
 
 class State:
-    def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+    """Values of one component, kept per client in the configured `StateStore`.
+
+    Outside of a request there is no client, and the values set then are the
+    defaults every client starts from.
+    """
+    def __init__(self, owner: Optional['Component'] = None, **kwargs):
+        self.owner = owner
+        self.defaults: Dict[str, Any] = dict(kwargs)
+
+    def changed(self) -> None:
+        # Drops the owner's cached renders and bumps the render version the page ETag is built from.
+        if self.owner is None:
+            RENDER_CACHE.bump()
+        else:
+            RENDER_CACHE.invalidate(self.owner.id)
+
+    def scope(self) -> Optional[Tuple[str, str]]:
+        client_id = CLIENT_ID.get()
+        if client_id is None or self.owner is None:
+            return None
+        return client_id, self.owner.id
+
+    def values(self) -> Dict[str, Any]:
+        scope = self.scope()
+        if scope is None:
+            return self.defaults
+        values = get_state_store().get(*scope)
+        return self.defaults if values is None else values
+
+    def update(self, new_state: Dict[str, Any]):
+        scope = self.scope()
+        if scope is None:
+            self.defaults.update(new_state)
+        else:
+            values = dict(self.values())
+            values.update(new_state)
+            get_state_store().set(*scope, values)
+        self.changed()
 
     def set_state(self, key, value):
-        setattr(self, key, value)
+        self.update({key: value})
         
     def get_state(self, key, default=None):
-        return getattr(self, key, default)
+        return self.values().get(key, default)
 
     def remove_state(self, key):
-        if hasattr(self, key):
-            delattr(self, key)
+        scope = self.scope()
+        if scope is None:
+            self.defaults.pop(key, None)
+        else:
+            values = self.values()
+            if key not in values:
+                return
+            values = dict(values)
+            del values[key]
+            get_state_store().set(*scope, values)
+        self.changed()
   
   
   
 class Root:
-    def __init__(self, title: Optional[str]=None, reload: bool=True) -> None:
+    def __init__(self, title: Optional[str]=None, reload: bool=True, concurrency: int=RENDER_CONCURRENCY) -> None:
         self.path = "root"
         self.reload = reload
+        self.concurrency = concurrency
         self.title = title or TITLE
-        self.routes: Dict[str, Route] = {}
+        self.routes: Dict[str, 'Route'] = {}
         self.children: List[Component] = []
         self.id_generator = UniqueIDGenerator()
         
@@ -49,33 +109,67 @@ class Root:
     def register_route(self, route: str, handler: Callable):
         self.routes[route] = handler
         
-    def get_routes(self) -> Dict[str, Route]:
+    def get_routes(self) -> Dict[str, 'Route']:
         return self.routes
     
-    def render(self) -> str:
-        return ''.join(["<!DOCTYPE html>",
-            html(lang="eng",
+    def render_node(self, rendered_children: Optional[List[str]]=None) -> Node:
+        if rendered_children is None:
+            rendered_children = [render_component(child) for child in self.children]
+        root = div.node(id="root")
+        # Component output is already HTML, so it is attached without escaping.
+        root.children.extend(rendered_children)
+        return fragment(Markup("<!DOCTYPE html>"),
+            html.node(lang="eng",
                 i=[
-                    head(
+                    head.node(
                         title(self.title),
                         meta(charset="UTF-8"),
-                        [script(src=s) for s in SCRIPTS],
+                        [script(src=s) for s in asset_urls(SCRIPTS)],
                         requires(HOT_RELOAD_SCRIPT) if self.reload else "",
-                        [link(href=stl, rel="stylesheet") for stl in STYLES],
+                        [link(href=stl, rel="stylesheet") for stl in asset_urls(STYLES)],
                     ),
-                    body(
-                        div(id="root",
-                            i=[child.render() for child in self.children]
-                        ),
+                    body.node(
+                        root,
                         cls="relative dark:bg-gray-800 bg-white text-sm text-gray-900 dark: text-white"
                     )
                 ]
             )
-        ])
+        )
+
+    def render(self) -> str:
+        start = perf_counter()
+        content = self.render_node().render()
+        if METRICS.enabled:
+            METRICS.observe("page", "root", self.path, perf_counter() - start, len(content))
+        return content
+
+    async def render_async(self) -> str:
+        start = perf_counter()
+        content = self.render_node(await render_children(self.children, self.concurrency)).render()
+        if METRICS.enabled:
+            METRICS.observe("page", "root", self.path, perf_counter() - start, len(content))
+        return content
 
 
 
+# Instance attributes managed by the framework rather than passed in by the user,
+# these never count as render inputs for the render cache.
+FRAMEWORK_ATTRIBUTES = frozenset({
+    "path", "key", "root", "styles", "scripts", "id_generator", "type", "id", "parent", "state", "on_change", "children",
+    "htmx_attributes", "state_callback", "window", "windowed",
+})
+
 class Component(ABC):
+    # Set to True on components whose synchronous `render` is CPU heavy, so page
+    # renders run it in a worker thread instead of blocking the event loop.
+    cpu_bound: bool = False
+    # Set to True on components whose output depends only on `render_inputs`,
+    # so page renders can reuse the fragment from the render cache.
+    cacheable: bool = False
+    # Attributes that are the only dynamic values of `render`. When set, the render is
+    # traced once per class into a `Template` and later renders just splice the values.
+    template_slots: Tuple[str, ...] = ()
+
     def __init__(self, key: Optional[str] = None, **kwargs) -> None:
         self.path = []
         self.key = key
@@ -83,6 +177,7 @@ class Component(ABC):
         self.styles = []
         self.scripts = []
         self.id_generator = UniqueIDGenerator()
+        self.htmx_attributes: Dict[str, str] = {}
         self.type = self.__class__.__name__.lower()
         self.id = key if key is not None else 'undefined'
         self.parent: Optional[Union['Component', Root]] = None
@@ -107,9 +202,79 @@ class Component(ABC):
     def set_parent(self, parent: Union['Component', Root]):
         self.parent = parent
         self.path.append(self.type)
+
+    def attach(self, parent: Union['Component', Root], root) -> None:
+        """Place the component in the tree and derive its id from its position.
+
+        Ids depend only on the tree path and the order components are added, so every
+        process that builds the same app assigns the same ids.
+        """
+        self.root = root
+        self.parent = parent
+        self.path = [*parent.path, self.type] if isinstance(parent.path, list) else [parent.path, self.type]
+        if self.key is None:
+            self.id = parent.get_id(self.path)
     
+    def render_inputs(self) -> Tuple:
+        return tuple((k, v) for k, v in vars(self).items() if k not in FRAMEWORK_ATTRIBUTES)
+
+    def render_key(self) -> Hashable:
+        # The inputs themselves, compared on lookup, so inputs whose hashes collide never
+        # share an entry. Types are part of the key since 1 == 1.0 == True render differently.
+        inputs = tuple((k, type(v), v) for k, v in self.render_inputs())
+        try:
+            hash(inputs)
+        except TypeError:
+            return repr(inputs)
+        return inputs
+
+    def on_change(self, trigger: str, target: Union['Component', List['Component']], action: str, cache: bool = False) -> Callable:
+        """Register the decorated function as the handler of `trigger` events on this component.
+
+        The handler's output replaces `target` using the HTMX swap `action`. The component
+        must already be attached to a `FluidFrame`, which dispatches every event through
+        a single route.
+        """
+        def decorator(func: Callable) -> Callable:
+            if self.root is None:
+                raise RuntimeError(f"Component `{self.id}` must be attached to an app before registering `{trigger}` handlers")
+            targets = target if isinstance(target, list) else [target]
+            self.htmx_attributes.update({
+                "hx-swap": action,
+                "hx-get": f"{EVENT_PREFIX}/{self.id}/{trigger}",
+                "hx-trigger": f"{trigger} once" if cache else trigger,
+                "hx-target": ', '.join([f'#{t.id}' for t in targets]),
+            })
+            self.root.add_event_handler(self.id, trigger, func, self.type)
+            return func
+        return decorator
+
+    @classmethod
+    def template(cls) -> Template:
+        template = cls.__dict__.get("compiled_template")
+        if template is None:
+            def trace(**markers: str) -> str:
+                tracer = object.__new__(cls)
+                tracer.__dict__.update(markers)
+                return cls.render(tracer)
+            template = Template.compile(trace, cls.template_slots)
+            cls.compiled_template = template
+        return template
+
+    def render_template(self) -> str:
+        return self.template().render([getattr(self, name) for name in self.template_slots])
+
+    @classmethod
+    def render_many(cls, components: Iterable['Component']) -> str:
+        """Render many instances of this component with a single join over its template."""
+        values = attrgetter(*cls.template_slots)
+        if len(cls.template_slots) == 1:
+            return cls.template().render_many([(values(component),) for component in components])
+        return cls.template().render_many(map(values, components))
+
     @abstractmethod
     def render(self, **kwargs) -> str:
+        """Render the component to HTML. May also be declared as `async def`."""
         pass
     
     
@@ -130,8 +295,11 @@ class StatelessComponent(Component):
     - video
     - diagram
     """
+    cacheable = True
+
     def __init__(self, parent: Union[Component, Root], key: Optional[str] = None, **kwargs) -> None:
-        super().__init__(parent, key, **kwargs)
+        super().__init__(key, **kwargs)
+        self.parent = parent
 
 
 
@@ -158,18 +326,23 @@ class StatefulComponent(Component):
     - status
     """
     def __init__(self, parent: Union[Component, Root], key: Optional[str] = None, on_change: Optional[Callable] = None, **kwargs) -> None:
-        super().__init__(parent, key, **kwargs)
-        self.state = State()
-        self.on_change = on_change
+        super().__init__(key, **kwargs)
+        self.parent = parent
+        self.state = State(self)
+        # Kept apart from `on_change`, which is the event handler decorator.
+        self.state_callback = on_change
        
     def get_route_id(self, path: List[str]) -> str:
         return self.root_component.get_route_id(path)
         
+    def render_inputs(self) -> Tuple:
+        # State is per client, so the current client's values are part of the cache key.
+        return super().render_inputs() + tuple(sorted(self.state.values().items()))
+
     def set_state(self, new_state: Dict[str, Any]):
-        for key, value in new_state.items():
-            self.state.set_state(key, value)
-        if self.on_change:
-            self.on_change(self)
+        self.state.update(new_state)
+        if self.state_callback:
+            self.state_callback(self)
 
     def get_state(self, key: str, default: Any = None) -> Any:
         return self.state.get_state(key, default)
@@ -188,10 +361,24 @@ class LayoutComponent(StatelessComponent):
     - expander
     - container
     - empty
+
+    With `window` set, `render_children` renders only the first `window` children and a
+    sentinel that fetches the next window once it is scrolled into view, so the first
+    paint costs the same however long the list is. The cursor travels in the sentinel's
+    URL, so the server keeps nothing per client. Windowing needs a root that serves the
+    later windows (`FluidFrame`); under any other root every child is rendered.
     """
-    def __init__(self, parent: Union[Component, Root], key: Optional[str] = None, children: List[Component] = None, **kwargs) -> None:
+    # The output embeds the children's renders, which can change independently.
+    cacheable = False
+    # Tag of the sentinel, which must be valid among the children: "li" in a list, "tr" in a table.
+    window_sentinel_tag: str = "div"
+
+    def __init__(self, parent: Union[Component, Root], key: Optional[str] = None, children: List[Component] = None, window: Optional[int] = None, **kwargs) -> None:
         super().__init__(parent, key, **kwargs)
         self.children = children or []
+        self.window = window
+        # Set once a root that serves windows has registered the layout.
+        self.windowed = False
         
     def __enter__(self):
         # Any setup code if needed
@@ -201,7 +388,50 @@ class LayoutComponent(StatelessComponent):
         # Any teardown code if needed
         pass
 
+    def attach(self, parent: Union[Component, Root], root) -> None:
+        super().attach(parent, root)
+        for child in self.children:
+            child.attach(self, root)
+        if self.window and hasattr(root, "register_window"):
+            root.register_window(self)
+            self.windowed = True
+
+    def window_sentinel(self, start: int) -> str:
+        # A row without cells takes no space in a table, so it would never be revealed.
+        cell = td() if self.window_sentinel_tag == "tr" else ""
+        return create_element(self.window_sentinel_tag)(
+            cell, hx_get=f"{WINDOW_PREFIX}/{self.id}?start={start}", hx_trigger="revealed", hx_swap="outerHTML",
+        )
+
+    def close_window(self, rendered: List[str], end: int) -> str:
+        if end < len(self.children):
+            rendered.append(self.window_sentinel(end))
+        return Markup(''.join(rendered))
+
+    def visible_children(self) -> List[Component]:
+        return self.children[:self.window] if self.windowed else self.children
+
+    def render_children(self) -> str:
+        """Render the children, or only the first window of them when `window` is set.
+
+        Async renders have already rendered the children concurrently, async ones
+        included, and they are spliced in here.
+        """
+        prerendered = PRERENDERED_CHILDREN.get()
+        if prerendered is not None and prerendered[0] is self:
+            rendered = list(prerendered[1])
+        else:
+            rendered = [render_component(child) for child in self.visible_children()]
+        return self.close_window(rendered, len(rendered))
+
+    async def render_window(self, start: int, limit: int=RENDER_CONCURRENCY) -> str:
+        """Render the window of children starting at `start`, followed by the next sentinel if any remain."""
+        end = start + self.window
+        return self.close_window(await render_children(self.children[start:end], limit), end)
+
     def add_child(self, child: Component):
+        if self.root is not None:
+            child.attach(self, self.root)
         self.children.append(child)
         
     def get_childrens(self):
@@ -224,3 +454,133 @@ class LayoutComponent(StatelessComponent):
  
 
 
+
+def wrap_events(child: Component, result: str) -> str:
+    # Components with event handlers are wrapped in an element carrying the HTMX attributes.
+    if not child.htmx_attributes:
+        return result
+    return div(Markup(result), **child.htmx_attributes)
+
+def track(child: Component, fragment: str) -> bool:
+    """Remember `fragment` as the last one sent to the current page and return whether it changed.
+
+    Without a page id, e.g. while rendering the page itself, every fragment counts as
+    changed, so the first update of a component after a page load is always sent.
+    """
+    page_id = PAGE_ID.get()
+    if page_id is None:
+        return True
+    return SENT_FRAGMENTS.update(page_id, child.id, fragment)
+
+def remember_dependencies(result: str, dependencies) -> str:
+    # Cached fragments skip the render, so they carry the `requires` calls it made.
+    if not dependencies:
+        return result
+    result = Fragment(result)
+    result.dependencies = dependencies
+    return result
+
+def as_html(result: Union[str, Node]) -> str:
+    # Renders made in node mode return a `Node`, but fragments are hashed, measured and spliced as strings.
+    return Markup(result.render()) if isinstance(result, Node) else result
+
+def build_fragment(child: Component) -> Tuple[str, Optional[bool]]:
+    """Render `child` through the render cache, returning the HTML and whether it was a cache hit."""
+    render = child.render_template if child.template_slots else child.render
+    if not child.cacheable:
+        return as_html(render()), None
+    key = child.render_key()
+    result = RENDER_CACHE.get(child.id, key)
+    if result is not None:
+        replay(getattr(result, "dependencies", None))
+        return result, True
+    with collecting() as dependencies:
+        result = as_html(render())
+    result = remember_dependencies(result, dependencies)
+    RENDER_CACHE.set(child.id, key, result)
+    return result, False
+
+def render_fragment(child: Component) -> str:
+    if not METRICS.enabled:
+        return build_fragment(child)[0]
+    start = perf_counter()
+    result, cached = build_fragment(child)
+    METRICS.observe_component(child, perf_counter() - start, len(result), cached)
+    return result
+
+def render_component(child: Component) -> str:
+    result = render_fragment(child)
+    track(child, result)
+    return wrap_events(child, result)
+
+async def build_fragment_async(child: Component) -> Tuple[str, Optional[bool]]:
+    if isinstance(child, StatefulComponent) and get_state_store().blocking and not inspect.iscoroutinefunction(child.render):
+        # Both the cache key and the render read the store, so the whole build runs in a thread.
+        return await asyncio.to_thread(build_fragment, child)
+    if child.cacheable:
+        key = child.render_key()
+        result = RENDER_CACHE.get(child.id, key)
+        if result is not None:
+            replay(getattr(result, "dependencies", None))
+            return result, True
+    render = child.render_template if child.template_slots else child.render
+    with collecting() as dependencies:
+        token = None
+        if isinstance(child, LayoutComponent):
+            token = PRERENDERED_CHILDREN.set((child, await render_children(child.visible_children())))
+        try:
+            if child.cpu_bound and not inspect.iscoroutinefunction(child.render):
+                result = await asyncio.to_thread(render)
+            else:
+                result = render()
+            if inspect.isawaitable(result):
+                result = await result
+        finally:
+            if token is not None:
+                PRERENDERED_CHILDREN.reset(token)
+    result = as_html(result)
+    if not child.cacheable:
+        return result, None
+    result = remember_dependencies(result, dependencies)
+    RENDER_CACHE.set(child.id, key, result)
+    return result, False
+
+async def render_fragment_async(child: Component) -> str:
+    if not METRICS.enabled:
+        return (await build_fragment_async(child))[0]
+    start = perf_counter()
+    result, cached = await build_fragment_async(child)
+    METRICS.observe_component(child, perf_counter() - start, len(result), cached)
+    return result
+
+async def render_child(child: Component) -> str:
+    result = await render_fragment_async(child)
+    track(child, result)
+    return wrap_events(child, result)
+
+async def render_updates(components: Iterable[Component]) -> str:
+    """Render `components` as out-of-band swaps, leaving out those the client already has.
+
+    Each component's root element must carry its id, as it is swapped in place of `#id`.
+    """
+    components = list(dict.fromkeys(components))
+    fragments = await asyncio.gather(*[render_fragment_async(child) for child in components])
+    return ''.join([
+        swap_oob(fragment, child.id)
+        for child, fragment in zip(components, fragments) if track(child, fragment)
+    ])
+
+def schedule_children(children: List[Component], limit: int=RENDER_CONCURRENCY) -> List[asyncio.Task]:
+    """Start rendering every child concurrently, at most `limit` at a time.
+
+    The returned tasks are in the same order as `children`, so awaiting them in
+    sequence preserves the output order.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    async def bounded(child: Component) -> str:
+        async with semaphore:
+            return await render_child(child)
+    return [asyncio.ensure_future(bounded(child)) for child in children]
+
+async def render_children(children: List[Component], limit: int=RENDER_CONCURRENCY) -> List[str]:
+    return await asyncio.gather(*schedule_children(children, limit))
@@ -0,0 +1,197 @@
+import zlib, hashlib
+from collections import OrderedDict
+from typing import Dict, Optional
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from fluidframe_test.config import COMPRESS_MIN_SIZE, COMPRESS_LEVEL, COMPRESS_THREAD_THRESHOLD, COMPRESSION_CACHE_SIZE, COMPRESSION_CACHE_BYTES
+
+# Content-Encoding -> zlib wbits of its container format.
+ENCODINGS: Dict[str, int] = {"gzip": 31, "deflate": 15}
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "application/xml", "image/svg+xml")
+# Scope key set through `share` by endpoints whose body is the same for every client.
+SHARED_BODY = "fluidframe.shared_body"
+
+
+def accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Map each coding named in an Accept-Encoding header to its q-value."""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name.strip():
+            accepted[name.strip()] = quality
+    return accepted
+
+def accepts(accepted: Dict[str, float], encoding: str) -> float:
+    """The q-value of `encoding`, falling back to `*`; 0 means not acceptable."""
+    return accepted.get(encoding, accepted.get("*", 0.0))
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """Pick the preferred of gzip and deflate from an Accept-Encoding header, or None."""
+    accepted = accepted_encodings(accept_encoding)
+    # max keeps the first of equally preferred codings, so ties go to ENCODINGS order.
+    encoding = max(ENCODINGS, key=lambda encoding: accepts(accepted, encoding))
+    return encoding if accepts(accepted, encoding) > 0 else None
+
+def share(scope: Scope) -> None:
+    """Mark the response to `scope` as one many clients receive, so its compressed body is cached.
+
+    Only static files, bundles and responses built from cacheable fragments are marked:
+    caching per-client pages would just fill the cache with bodies never sent again.
+    """
+    scope[SHARED_BODY] = True
+
+def compress(body: bytes, encoding: str, level: int=COMPRESS_LEVEL) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, ENCODINGS[encoding])
+    return compressor.compress(body) + compressor.flush()
+
+
+class CompressionMiddleware:
+    """Compress HTML, script and style responses with gzip or deflate.
+
+    Bodies marked with `share` are cached by content digest, up to `cache_size`
+    entries and `cache_bytes` compressed bytes, so the same bundle or fragment sent
+    to many clients is compressed once. Other bodies are compressed on every response.
+    Streamed bodies are compressed chunk by chunk with a sync flush, so the browser
+    can still render them progressively; shared ones small enough to compress on the
+    event loop, such as static files, are gathered and go through the cache instead.
+    """
+    def __init__(self, app: ASGIApp, minimum_size: int=COMPRESS_MIN_SIZE, level: int=COMPRESS_LEVEL,
+                 thread_threshold: int=COMPRESS_THREAD_THRESHOLD, cache_size: int=COMPRESSION_CACHE_SIZE,
+                 cache_bytes: int=COMPRESSION_CACHE_BYTES) -> None:
+        self.app = app
+        self.level = level
+        self.cache_size = cache_size
+        self.cache_bytes = cache_bytes
+        self.minimum_size = minimum_size
+        self.thread_threshold = thread_threshold
+        # Only touched from the event loop, so it needs no lock.
+        self.cache: 'OrderedDict[tuple[str, bytes], bytes]' = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = CompressionResponder(self, encoding, scope, send)
+        await self.app(scope, receive, responder.send)
+
+    async def compress_body(self, body: bytes, encoding: str, shared: bool) -> bytes:
+        if not shared:
+            return await self.compress(body, encoding)
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        compressed = self.cache.get(key)
+        if compressed is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return compressed
+        self.misses += 1
+        compressed = await self.compress(body, encoding)
+        if len(compressed) <= self.cache_bytes:
+            self.cache[key] = compressed
+            self.size += len(compressed)
+            while len(self.cache) > self.cache_size or self.size > self.cache_bytes:
+                self.size -= len(self.cache.popitem(last=False)[1])
+        return compressed
+
+    async def compress(self, body: bytes, encoding: str) -> bytes:
+        if len(body) >= self.thread_threshold:
+            return await anyio.to_thread.run_sync(compress, body, encoding, self.level)
+        return compress(body, encoding, self.level)
+
+
+
+class CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, scope: Scope, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.scope = scope
+        self.downstream = send
+        self.start: Optional[Message] = None
+        self.active = False
+        self.passthrough = False
+        self.compressor = None
+        self.gathered: Optional[list] = None
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self.downstream(message)
+            return
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message.get("headers", []))
+            content_type = headers.get("content-type", "")
+            if "content-encoding" in headers or message["status"] in (204, 304) or not content_type.startswith(COMPRESSIBLE_TYPES):
+                self.passthrough = True
+                await self.downstream(message)
+                return
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.gathered is not None:
+            self.gathered.append(body)
+            if more_body:
+                return
+            body = b"".join(self.gathered)
+        elif not self.active and more_body and self.gathers():
+            self.gathered = [body]
+            return
+        if not self.active:
+            self.active = True
+            if not more_body:
+                if len(body) < self.middleware.minimum_size:
+                    self.passthrough = True
+                    await self.downstream(self.start)
+                    await self.downstream({"type": "http.response.body", "body": body})
+                    return
+                compressed = await self.middleware.compress_body(body, self.encoding, self.scope.get(SHARED_BODY, False))
+                headers = self.encoded_headers()
+                headers["Content-Length"] = str(len(compressed))
+                await self.downstream(self.start)
+                await self.downstream({"type": "http.response.body", "body": compressed})
+                return
+            self.compressor = zlib.compressobj(self.middleware.level, zlib.DEFLATED, ENCODINGS[self.encoding])
+            headers = self.encoded_headers()
+            del headers["Content-Length"]
+            await self.downstream(self.start)
+
+        chunk = self.compressor.compress(body)
+        # A sync flush on every chunk lets streamed pages render as they arrive.
+        chunk += self.compressor.flush(zlib.Z_SYNC_FLUSH) if more_body else self.compressor.flush()
+        await self.downstream({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def gathers(self) -> bool:
+        # Shared bodies of a known, small size are worth waiting for, to compress them once.
+        if not self.scope.get(SHARED_BODY, False):
+            return False
+        length = Headers(raw=self.start.get("headers", [])).get("content-length")
+        return length is not None and length.isdigit() and int(length) < self.middleware.thread_threshold
+
+    def encoded_headers(self) -> MutableHeaders:
+        headers = MutableHeaders(scope=self.start)
+        headers["Content-Encoding"] = self.encoding
+        if "accept-encoding" not in [name.strip().lower() for name in headers.get("vary", "").split(",")]:
+            headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            # The encoded body differs byte for byte, so a strong validator becomes weak.
+            headers["ETag"] = f"W/{etag}"
+        return headers
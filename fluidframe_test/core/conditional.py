@@ -0,0 +1,47 @@
+import os, hashlib
+from uuid import uuid4
+from typing import Optional
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, Response
+
+# Distinguishes versions across process restarts, where the counters start over.
+BOOT_TOKEN = uuid4().hex[:8]
+
+def new_boot_token() -> None:
+    global BOOT_TOKEN
+    BOOT_TOKEN = uuid4().hex[:8]
+
+# Forked workers count versions independently, so each one needs its own token.
+os.register_at_fork(after_in_child=new_boot_token)
+
+DEFAULT_CACHE_CONTROL = "no-cache"
+
+
+def content_etag(content: str) -> str:
+    return f'W/"{hashlib.blake2b(content.encode(), digest_size=12).hexdigest()}"'
+
+def version_etag(version: int, shared: Optional[int]=None) -> str:
+    """ETag of this process's render `version`, plus the `shared` version of a state store other processes write to."""
+    if shared is None:
+        return f'W/"{BOOT_TOKEN}-{version}"'
+    return f'W/"{BOOT_TOKEN}-{version}-{shared}"'
+
+def is_fresh(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as required for If-None-Match.
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+def not_modified(etag: str, cache_control: str=DEFAULT_CACHE_CONTROL) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+def conditional_html(request: Request, content: str, cache_control: str=DEFAULT_CACHE_CONTROL) -> Response:
+    """Answer with `304 Not Modified` when the client already holds `content`."""
+    etag = content_etag(content)
+    if is_fresh(request, etag):
+        return not_modified(etag, cache_control)
+    return HTMLResponse(content, headers={"ETag": etag, "Cache-Control": cache_control})
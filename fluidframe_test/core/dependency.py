@@ -1,26 +1,191 @@
-import json
-from typing import Optional, List
-from fluidframe_test.core import script
+import os, re, json
+import hashlib, threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from urllib.parse import quote
+from typing import Iterator, List, Optional, Set, Tuple
+from fluidframe_test.core import Markup, script, link
+from fluidframe_test.core.assets import HASHED_NAME, asset_urls, resolve
+from fluidframe_test.config import BUNDLE_PREFIX, BUNDLE_CACHE_SIZE
+
+# Extensions of the files a bundle of each kind may contain.
+BUNDLE_EXTENSIONS = {"js": (".js", ".mjs"), "css": (".css",)}
+# Relative `url(...)` references in a stylesheet, which must be rebased once it is bundled.
+CSS_URL = re.compile(r"""url\(\s*(['"]?)(?!data:|[a-z]+://|/|#)([^'")]+)\1\s*\)""")
+
+
+class Dependencies:
+    """Script and style groups declared with `requires` while rendering a page.
+
+    Each group keeps the order it was declared in. Groups are sorted before they are
+    flattened, so the same set of declarations always gives the same bundle whatever
+    order the components rendered in.
+    """
+    __slots__ = ("scripts", "styles")
+
+    def __init__(self) -> None:
+        self.scripts: Set[Tuple[str, ...]] = set()
+        self.styles: Set[Tuple[str, ...]] = set()
+
+    def add(self, scripts: List[str], styles: List[str]) -> None:
+        if scripts:
+            self.scripts.add(tuple(scripts))
+        if styles:
+            self.styles.add(tuple(styles))
+
+    def update(self, other: 'Dependencies') -> None:
+        self.scripts.update(other.scripts)
+        self.styles.update(other.styles)
+
+    def __bool__(self) -> bool:
+        return bool(self.scripts or self.styles)
+
+    @staticmethod
+    def flatten(groups: Set[Tuple[str, ...]]) -> List[str]:
+        return list(dict.fromkeys(url for group in sorted(groups) for url in group))
+
+
+
+class Fragment(Markup):
+    """Rendered HTML that keeps the dependencies its render declared, for reuse from a cache."""
+    dependencies: Optional[Dependencies] = None
+
+
+
+# The `Dependencies` of the page being rendered, if any.
+DEPENDENCIES: ContextVar[Optional[Dependencies]] = ContextVar("fluidframe_dependencies", default=None)
+
+@contextmanager
+def collecting() -> Iterator[Dependencies]:
+    """Collect the `requires` calls made in this block instead of emitting them inline.
+
+    Whatever is collected is also added to an enclosing collection.
+    """
+    dependencies = Dependencies()
+    outer = DEPENDENCIES.get()
+    token = DEPENDENCIES.set(dependencies)
+    try:
+        yield dependencies
+    finally:
+        DEPENDENCIES.reset(token)
+        if outer is not None:
+            outer.update(dependencies)
+
+def replay(dependencies: Optional[Dependencies]) -> None:
+    """Declare again the dependencies of a fragment reused from a cache."""
+    collector = DEPENDENCIES.get()
+    if collector is not None and dependencies:
+        collector.update(dependencies)
+
+def as_list(urls: Optional[List[str]|str]) -> List[str]:
+    if urls is None:
+        return []
+    if isinstance(urls, str):
+        return [urls]
+    return list(urls)
 
 def requires(scripts: Optional[List[str]|str]=None, styles: Optional[List[str]|str]=None) -> str:
-    if styles is None:
-        styles = []
-    elif isinstance(styles, str):
-        styles = [styles]
-    if scripts is None:
-        scripts = []
-    elif isinstance(scripts, str):
-        scripts = [scripts]
-    return script(f"loadDependencies({{scripts: {json.dumps(scripts)}, styles: {json.dumps(styles)}}});")
+    scripts, styles = as_list(scripts), as_list(styles)
+    collector = DEPENDENCIES.get()
+    if collector is not None:
+        # Part of a page render: the page links a single bundle instead.
+        collector.add(scripts, styles)
+        return Markup("")
+    return script(f"loadDependencies({{scripts: {json.dumps(asset_urls(scripts))}, styles: {json.dumps(asset_urls(styles))}}});")
 
 def set_dependancies(scripts: Optional[List[str]|str]=None, styles: Optional[List[str]|str]=None) -> str:
-    if styles is None:
-        styles = []
-    elif isinstance(styles, str):
-        styles = [styles]
-    if scripts is None:
-        scripts = []
-    elif isinstance(scripts, str):
-        scripts = [scripts]
-    return json.dumps({"scripts": scripts, "styles": styles})
-    
\ No newline at end of file
+    return json.dumps({"scripts": as_list(scripts), "styles": as_list(styles)})
+
+
+
+class Bundles:
+    """Concatenated local dependencies, served from a URL that lists the fingerprinted files.
+
+    The bundle name is a hash of that list, so a file edit gives a new URL and bundles
+    can be served as immutable. Any process can rebuild a bundle from its URL alone;
+    built contents are kept in an LRU.
+    """
+    def __init__(self, maxsize: int=BUNDLE_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.contents: 'OrderedDict[str, bytes]' = OrderedDict()
+
+    @staticmethod
+    def name(fingerprinted: List[str], kind: str) -> str:
+        return f"{hashlib.blake2b(json.dumps(fingerprinted).encode(), digest_size=8).hexdigest()}.{kind}"
+
+    def url(self, urls: List[str], kind: str) -> Tuple[str, List[str]]:
+        """Return the bundle URL for `urls` and their fingerprinted URLs."""
+        fingerprinted = asset_urls(urls)
+        files = quote(",".join(fingerprinted), safe="/,.-_~")
+        return f"{BUNDLE_PREFIX}/{self.name(fingerprinted, kind)}?files={files}", fingerprinted
+
+    def content(self, name: str, files: List[str]) -> Optional[Tuple[bytes, bool]]:
+        """Return the bundle `name` of the fingerprinted `files` and whether it matches their fingerprints.
+
+        None if `name` is not the bundle of `files` or one of them is not a local asset
+        of the bundle's kind. A file edited since the page was rendered is bundled as
+        it is now, which is then not cacheable.
+        """
+        kind = name.rpartition(".")[2]
+        if kind not in BUNDLE_EXTENSIONS or not files or name != self.name(files, kind):
+            return None
+        with self.lock:
+            content = self.contents.get(name)
+            if content is not None:
+                self.contents.move_to_end(name)
+                return content, True
+        urls = []
+        for url in files:
+            match = HASHED_NAME.match(url)
+            original = f"{match[1]}{match[3]}" if match else url
+            resolved = resolve(original)
+            if resolved is None or not original.endswith(BUNDLE_EXTENSIONS[kind]) or not os.path.isfile(resolved[2]):
+                return None
+            urls.append(original)
+        current = asset_urls(urls) == files
+        content = self.build(urls, kind == "css")
+        if current:
+            with self.lock:
+                self.contents[name] = content
+                while len(self.contents) > self.maxsize:
+                    self.contents.popitem(last=False)
+        return content, current
+
+    def build(self, urls: List[str], is_css: bool) -> bytes:
+        parts = []
+        for url in urls:
+            with open(resolve(url)[2], encoding="utf-8") as file:
+                text = file.read()
+            if is_css:
+                base = "/" + url.lstrip("/").rsplit("/", 1)[0]
+                text = CSS_URL.sub(lambda match: f"url({match[1]}{base}/{match[2]}{match[1]})", text)
+            parts.append(f"/* {url} */\n{text}")
+        # The separator keeps a file without a trailing semicolon from merging into the next.
+        return ("\n" if is_css else "\n;\n").join(parts).encode()
+
+
+
+BUNDLES = Bundles()
+
+def bundle_tags(dependencies: Dependencies) -> List[str]:
+    """Tags loading everything in `dependencies`: local files bundled, remote ones linked directly."""
+    tags = []
+    for kind, urls in (("css", Dependencies.flatten(dependencies.styles)), ("js", Dependencies.flatten(dependencies.scripts))):
+        local = [url for url in urls if resolve(url) is not None]
+        remote = [url for url in urls if resolve(url) is None]
+        if kind == "css":
+            tags.extend(link(href=url, rel="stylesheet") for url in remote)
+        else:
+            tags.extend(script(src=url, defer=True) for url in remote)
+        if not local:
+            continue
+        url, fingerprinted = BUNDLES.url(local, kind)
+        # The loader reads `data-bundled` so later fragments don't load these files again.
+        bundled = json.dumps(fingerprinted)
+        if kind == "css":
+            tags.append(link(href=url, rel="stylesheet", data_bundled=bundled))
+        else:
+            tags.append(script(src=url, defer=True, data_bundled=bundled))
+    return tags
@@ -1,49 +1,255 @@
 from starlette.applications import Starlette
-from starlette.responses import HTMLResponse
-from starlette.staticfiles import StaticFiles
-from typing import Union, List, Callable, Optional
-from starlette.routing import Route, WebSocketRoute
-from starlette.websockets import WebSocketDisconnect
-from fluidframe_test.core.dependency import requires
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, PlainTextResponse, Response, StreamingResponse
+import asyncio, inspect
+from time import perf_counter
+from typing import Union, List, Callable, AsyncIterator, Dict, Optional, Tuple
+from starlette.websockets import WebSocket, WebSocketDisconnect
+from fluidframe_test.core.cache import RENDER_CACHE
+from fluidframe_test.core.push import PushHub
+from fluidframe_test.core.metrics import METRICS
+from fluidframe_test.core.assets import ASSET_DIRS, asset_url
+from fluidframe_test.core.static import HashedStaticFiles
+from fluidframe_test.core.compression import CompressionMiddleware, share
+from fluidframe_test.core.updates import PAGE_ID
+from fluidframe_test.core.state import CLIENT_ID, ClientMiddleware, StateStore, get_state_store, set_state_store
+from fluidframe_test.core.dependency import BUNDLES, Dependencies, bundle_tags, collecting, requires
+from fluidframe_test.core.conditional import DEFAULT_CACHE_CONTROL, conditional_html, is_fresh, not_modified, version_etag
 from fluidframe_test.utilities.helper import UniqueIDGenerator
-from fluidframe_test.config import PUBLIC_DIR, HOT_RELOAD_SCRIPT
-from fluidframe_test.core import html, body, meta, script, link, div, head, title
-from fluidframe_test.core.components import Component, StatefulComponent, StatelessComponent, Root
+from fluidframe_test.config import PUBLIC_DIR, HOT_RELOAD_SCRIPT, RENDER_CONCURRENCY, EVENT_PREFIX, WINDOW_PREFIX, BUNDLE_PREFIX, ASSET_MAX_AGE, METRICS_PATH
+from fluidframe_test.core import Markup, Node, fragment, html, body, meta, script, link, div, head, title
+from fluidframe_test.core.components import Component, LayoutComponent, render_component, render_children, render_fragment_async, render_updates, schedule_children
 
 
 
 class FluidFrame(Starlette):
-    def __init__(self, reload: bool=True, **kwargs):
+    def __init__(self, reload: bool=True, stream: bool=False, concurrency: int=RENDER_CONCURRENCY, etag: bool=False, state_store: Optional[StateStore]=None, push: bool=False, watch: bool=False, compression: bool=True, metrics: bool=False, metrics_per_id: bool=False, **kwargs):
         super().__init__(**kwargs)
+        if state_store is not None:
+            set_state_store(state_store)
+        self.add_middleware(ClientMiddleware)
+        if compression:
+            self.add_middleware(CompressionMiddleware)
         self.path = "root"
+        self.etag = etag
+        self.push_enabled = push
         self.reload = reload
+        self.stream = stream
+        self.concurrency = concurrency
         self.add_route("/", self.render)
+        self.add_route(f"{EVENT_PREFIX}/{{component_id}}/{{trigger}}", self.dispatch_event, methods=["GET", "POST"])
+        self.add_route(f"{WINDOW_PREFIX}/{{component_id}}", self.serve_window)
+        self.add_route(f"{BUNDLE_PREFIX}/{{name}}", self.serve_bundle)
+        self.add_websocket_route("/ws", self.socket)
+        if metrics:
+            METRICS.enabled = True
+            METRICS.per_id = metrics_per_id
+            self.add_route(METRICS_PATH, self.metrics)
+        for prefix, directory in ASSET_DIRS.items():
+            self.mount(f"/{prefix}", HashedStaticFiles(directory=directory, check_dir=False))
+        self.hub = PushHub()
+        self.reloader = None
+        if watch:
+            from fluidframe_test.core.reload import HotReloader
+            self.reloader = HotReloader(self)
+            # Starlette skips `on_startup` handlers when a `lifespan` is given, so the lifespan itself is wrapped.
+            self.router.lifespan_context = self.reloader.lifespan(self.router.lifespan_context)
         self.childrens: List[Component] = []
         self.id_generator = UniqueIDGenerator()
+        # (component id, trigger) -> (handler, whether the handler takes the request, component type)
+        self.event_handlers: Dict[Tuple[str, str], Tuple[Callable, bool, str]] = {}
+        # Windowed layouts by id, for the route serving their later windows.
+        self.windows: Dict[str, LayoutComponent] = {}
+
+    def get_id(self, path: List[str]) -> str:
+        return self.id_generator.generate_unique_id(path)
+
+    def child(self, component: Component) -> Component:
+        component.attach(self, self)
+        self.childrens.append(component)
+        return component
+
+    def register_window(self, layout: LayoutComponent) -> None:
+        self.windows[layout.id] = layout
+
+    async def serve_window(self, request: Request) -> Response:
+        layout = self.windows.get(request.path_params["component_id"])
+        if layout is None:
+            return PlainTextResponse("No windowed layout with this id", status_code=404)
+        try:
+            start = int(request.query_params.get("start", "0"))
+        except ValueError:
+            start = -1
+        if start < 0:
+            return PlainTextResponse("`start` must be a non-negative integer", status_code=400)
+        if all(child.cacheable for child in layout.children[start:start + layout.window]):
+            share(request.scope)
+        return HTMLResponse(await layout.render_window(start, self.concurrency))
+
+    def add_event_handler(self, component_id: str, trigger: str, handler: Callable, component_type: str="handler") -> None:
+        takes_request = len(inspect.signature(handler).parameters) > 0
+        self.event_handlers[(component_id, trigger)] = (handler, takes_request, component_type)
+
+    async def dispatch_event(self, request: Request) -> Response:
+        params = request.path_params
+        entry = self.event_handlers.get((params["component_id"], params["trigger"]))
+        if entry is None:
+            return PlainTextResponse("No handler registered for this event", status_code=404)
+        handler, takes_request, component_type = entry
+        start = perf_counter()
+        args = (request,) if takes_request else ()
+        if get_state_store().blocking and not inspect.iscoroutinefunction(handler):
+            # Sync handlers usually read or write state, which would block the event loop.
+            result = await asyncio.to_thread(handler, *args)
+        else:
+            result = handler(*args)
+        if inspect.isawaitable(result):
+            result = await result
+        if isinstance(result, Node):
+            result = result.render()
+        if METRICS.enabled:
+            # Handlers returning components are timed up to the components; their renders are counted on their own.
+            METRICS.observe("event", component_type, params["component_id"], perf_counter() - start, len(result) if isinstance(result, str) else 0)
+        if isinstance(result, Response):
+            return result
+        if isinstance(result, Component) or (isinstance(result, (list, tuple, set, frozenset)) and result and all(isinstance(item, Component) for item in result)):
+            # The fragments carry their own targets, so the triggering swap itself is skipped.
+            components = [result] if isinstance(result, Component) else result
+            updates = await render_updates(components)
+            if not updates:
+                return Response(status_code=204)
+            if all(child.cacheable for child in components):
+                share(request.scope)
+            return HTMLResponse(updates, headers={"HX-Reswap": "none"})
+        if self.etag:
+            return conditional_html(request, result)
+        return HTMLResponse(result)
         
-    def __render__(self) -> str:
-        return ''.join(["<!DOCTYPE html>",
-            html(lang="eng",
-                i=[
-                    head(
-                        title("Fluidframe App"),
-                        meta(charset="UTF-8"),
-                        script(src=f"{PUBLIC_DIR}/scripts/dependency_manager.js"),
-                        script(src="https://cdnjs.cloudflare.com/ajax/libs/htmx/2.0.2/htmx.min.js"),
-                        link(href="https://cdnjs.cloudflare.com/ajax/libs/tailwindcss/2.2.19/tailwind.min.css", rel="stylesheet"),
-                        requires(HOT_RELOAD_SCRIPT) if self.reload else "",
-                    ),
-                    body(
-                        div(id=self.path,
-                            i=[child.render() for child in self.childrens]
-                        ),
-                        cls="relative dark:bg-gray-800 bg-white text-sm text-gray-900 dark: text-white"
-                    )
-                ]
-            )
-        ])
-        
-    def render(self) -> HTMLResponse:
-        return HTMLResponse(self.__render__())
+    async def socket(self, websocket: WebSocket) -> None:
+        await websocket.accept()
+        connection = self.hub.connect(websocket, CLIENT_ID.get(), PAGE_ID.get())
+        sender = asyncio.ensure_future(connection.run())
+        try:
+            while not connection.closed:
+                if await websocket.receive_text() == "ping":
+                    connection.offer(("pong",), "pong")
+        except WebSocketDisconnect:
+            pass
+        finally:
+            self.hub.disconnect(connection)
+            sender.cancel()
+
+    async def push(self, component: Component, client_id: Optional[str]=None, group: Optional[str]=None) -> int:
+        """Render `component` and push it to one client, a group or every connected browser.
 
+        A push to one client is rendered with that client's state. Pages that already
+        show the same fragment are skipped. Returns the number of sockets it was queued on.
+        """
+        token = CLIENT_ID.set(client_id)
+        try:
+            html = await render_fragment_async(component)
+        finally:
+            CLIENT_ID.reset(token)
+        return self.hub.publish(component.id, html, client_id, group)
 
+    async def metrics(self, request: Request) -> Response:
+        return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4")
+
+    async def serve_bundle(self, request: Request) -> Response:
+        name = request.path_params["name"]
+        files = request.query_params.get("files", "")
+        bundle = await asyncio.to_thread(BUNDLES.content, name, files.split(",") if files else [])
+        if bundle is None:
+            return PlainTextResponse("Unknown bundle", status_code=404)
+        content, current = bundle
+        media_type = "text/css" if name.endswith(".css") else "text/javascript"
+        share(request.scope)
+        cache_control = f"public, max-age={ASSET_MAX_AGE}, immutable" if current else "no-cache"
+        return Response(content, media_type=media_type, headers={"Cache-Control": cache_control})
+
+    def __head__(self, dependencies: Optional[Dependencies]=None) -> str:
+        # Declared first, so that while collecting it joins the page bundle.
+        reload_script = requires(HOT_RELOAD_SCRIPT) if self.reload or self.push_enabled or self.reloader else ""
+        return head(
+            title("Fluidframe App"),
+            meta(charset="UTF-8"),
+            script(src=asset_url(f"{PUBLIC_DIR}/scripts/dependency_manager.js")),
+            script(src="https://cdnjs.cloudflare.com/ajax/libs/htmx/2.0.2/htmx.min.js"),
+            link(href="https://cdnjs.cloudflare.com/ajax/libs/tailwindcss/2.2.19/tailwind.min.css", rel="stylesheet"),
+            # The same socket client handles reloads and pushed updates.
+            reload_script,
+            bundle_tags(dependencies) if dependencies else "",
+        )
+
+    def __shell__(self) -> List[Node]:
+        return [
+            html.node(lang="eng"),
+            body.node(cls="relative dark:bg-gray-800 bg-white text-sm text-gray-900 dark: text-white"),
+            div.node(id=self.path),
+        ]
+
+    def __document__(self, rendered_children: Optional[List[str]]=None, dependencies: Optional[Dependencies]=None) -> Node:
+        if rendered_children is None:
+            rendered_children = [render_component(child) for child in self.childrens]
+        page, page_body, root = self.__shell__()
+        root.children.extend(rendered_children)
+        page_body.children.append(root)
+        page.children.extend([self.__head__(dependencies), page_body])
+        return fragment(Markup("<!DOCTYPE html>"), page)
+
+    def __render__(self) -> str:
+        with collecting() as dependencies:
+            return self.__document__(None, dependencies).render()
+
+    async def __stream__(self) -> AsyncIterator[str]:
+        # The head goes out before any component renders so the browser can start
+        # fetching scripts and styles while the body is still being produced.
+        start = perf_counter()
+        page, page_body, root = self.__shell__()
+        yield "<!DOCTYPE html>"
+        # The start tag is plain text, adding `Markup` to it would escape it.
+        yield page.start
+        yield self.__head__()
+        # The tasks copy the context as they are created, so they all collect into `dependencies`.
+        with collecting() as dependencies:
+            pending = schedule_children(self.childrens, self.concurrency)
+        try:
+            yield page_body.start + root.start
+            size = 0
+            for task in pending:
+                chunk = await task
+                size += len(chunk)
+                yield chunk
+        finally:
+            for task in pending:
+                task.cancel()
+        # The head is already sent, so the bundle is linked at the end of the body.
+        yield root.end + ''.join(bundle_tags(dependencies)) + page_body.end + page.end
+        if METRICS.enabled:
+            METRICS.observe("page", "root", "stream", perf_counter() - start, size)
+        
+    async def render(self, request: Request) -> Union[HTMLResponse, StreamingResponse, Response]:
+        headers = {}
+        if self.etag:
+            # The page only changes through state changes, which bump the render
+            # version, so a matching version answers 304 without rendering anything.
+            # A store shared with other workers counts their changes in its own version.
+            store = get_state_store()
+            shared = await asyncio.to_thread(store.version) if store.blocking else store.version()
+            etag = version_etag(RENDER_CACHE.version, shared)
+            if is_fresh(request, etag):
+                return not_modified(etag)
+            headers = {"ETag": etag, "Cache-Control": DEFAULT_CACHE_CONTROL}
+        if self.stream:
+            return StreamingResponse(self.__stream__(), media_type="text/html", headers=headers)
+        start = perf_counter()
+        with collecting() as dependencies:
+            rendered_children = await render_children(self.childrens, self.concurrency)
+            document = self.__document__(rendered_children, dependencies)
+        content = document.render()
+        if all(child.cacheable for child in self.childrens):
+            # Only fragments from the render cache, so every client gets the same page.
+            share(request.scope)
+        if METRICS.enabled:
+            METRICS.observe("page", "root", request.scope["path"], perf_counter() - start, len(content))
+        return HTMLResponse(content, headers=headers)
@@ -0,0 +1,114 @@
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from fluidframe_test.config import METRICS_BUCKETS, METRICS_BATCH
+
+if TYPE_CHECKING:
+    from fluidframe_test.core.components import Component
+
+
+class Series:
+    """Counters of one (kind, type[, id]): latency histogram, output size and cache results.
+
+    The call count is the sum of the buckets, so recording does not keep it separately.
+    """
+    __slots__ = ("seconds", "size", "cache", "buckets")
+
+    def __init__(self, buckets: int) -> None:
+        self.seconds = 0.0
+        self.size = 0
+        # [misses, hits], indexed by the cache hit flag.
+        self.cache = [0, 0]
+        self.buckets = [0] * (buckets + 1)
+
+
+
+class Metrics:
+    """Render metrics, recorded only while `enabled`.
+
+    Series are aggregated by component type. With `per_id` each component id gets its
+    own series as well, which is only reasonable for apps with a bounded number of
+    components: a windowed list of 50k rows would otherwise export 50k histograms.
+
+    Component renders, by far the most frequent, are only appended to a list and
+    added to their series every `batch` renders and whenever the metrics are read.
+    Nothing takes a lock: updates from worker threads can race, which may lose a
+    sample but never breaks a render.
+    """
+    def __init__(self, buckets: Tuple[float, ...]=METRICS_BUCKETS, per_id: bool=False, batch: int=METRICS_BATCH) -> None:
+        self.enabled = False
+        self.per_id = per_id
+        self.bounds = buckets
+        self.first_bound = buckets[0]
+        self.batch = batch
+        self.pending: List[Tuple['Component', float, int, Optional[bool]]] = []
+        self.series: Dict[Tuple[str, str, Optional[str]], Series] = {}
+
+    def observe(self, kind: str, type: str, id: str, seconds: float, size: int, cached: Optional[bool]=None) -> None:
+        key = (kind, type, id if self.per_id else None)
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = Series(len(self.bounds))
+        series.seconds += seconds
+        series.size += size
+        series.buckets[0 if seconds <= self.first_bound else bisect_left(self.bounds, seconds)] += 1
+        if cached is not None:
+            series.cache[cached] += 1
+
+    def observe_component(self, component: 'Component', seconds: float, size: int, cached: Optional[bool]=None) -> None:
+        pending = self.pending
+        pending.append((component, seconds, size, cached))
+        if len(pending) >= self.batch:
+            self.flush()
+
+    def flush(self) -> None:
+        samples, self.pending = self.pending, []
+        series_by_key, bounds, first_bound, per_id = self.series, self.bounds, self.first_bound, self.per_id
+        for component, seconds, size, cached in samples:
+            key = ("component", component.type, component.id if per_id else None)
+            series = series_by_key.get(key)
+            if series is None:
+                series = series_by_key[key] = Series(len(bounds))
+            series.seconds += seconds
+            series.size += size
+            # Most component renders fall in the first bucket, which needs no search.
+            series.buckets[0 if seconds <= first_bound else bisect_left(bounds, seconds)] += 1
+            if cached is not None:
+                series.cache[cached] += 1
+
+    def reset(self) -> None:
+        self.pending = []
+        self.series.clear()
+
+    def render(self) -> str:
+        """Prometheus text exposition format."""
+        lines: List[str] = [
+            "# HELP fluidframe_render_seconds Time spent rendering, per component, page or event handler.",
+            "# TYPE fluidframe_render_seconds histogram",
+        ]
+        sizes = ["# HELP fluidframe_render_output_size_total Characters of HTML produced.", "# TYPE fluidframe_render_output_size_total counter"]
+        caches = ["# HELP fluidframe_render_cache_total Render cache lookups by result.", "# TYPE fluidframe_render_cache_total counter"]
+        self.flush()
+        for (kind, type, id), series in list(self.series.items()):
+            labels = f'kind="{kind}",type="{label(type)}"' if id is None else f'kind="{kind}",type="{label(type)}",id="{label(id)}"'
+            cumulative = 0
+            for bound, count in zip(self.bounds, series.buckets):
+                cumulative += count
+                lines.append(f'fluidframe_render_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            count = cumulative + series.buckets[-1]
+            lines.append(f'fluidframe_render_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"fluidframe_render_seconds_sum{{{labels}}} {series.seconds}")
+            lines.append(f"fluidframe_render_seconds_count{{{labels}}} {count}")
+            sizes.append(f"fluidframe_render_output_size_total{{{labels}}} {series.size}")
+            misses, hits = series.cache
+            if hits or misses:
+                caches.append(f'fluidframe_render_cache_total{{{labels},result="hit"}} {hits}')
+                caches.append(f'fluidframe_render_cache_total{{{labels},result="miss"}} {misses}')
+        return "\n".join(lines + sizes + caches) + "\n"
+
+
+
+def label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+METRICS = Metrics()
@@ -0,0 +1,139 @@
+import json, asyncio
+from contextlib import suppress
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Set
+from starlette.websockets import WebSocket
+from fluidframe_test.core.updates import SENT_FRAGMENTS
+from fluidframe_test.config import PUSH_QUEUE_SIZE, PUSH_SEND_TIMEOUT
+
+
+class Connection:
+    """One browser socket with its own bounded queue of pending messages.
+
+    Messages are keyed, and a newer message replaces a pending one with the same key,
+    so a component updated many times before the socket catches up is sent once.
+    A connection whose queue overflows or whose send times out is dropped; the
+    browser reconnects and reloads the page to catch up.
+    """
+    __slots__ = ("websocket", "client_id", "page_id", "groups", "pending", "ready", "closed", "maxsize", "timeout")
+
+    def __init__(self, websocket: WebSocket, client_id: Optional[str], page_id: Optional[str]=None, maxsize: int=PUSH_QUEUE_SIZE, timeout: float=PUSH_SEND_TIMEOUT) -> None:
+        self.websocket = websocket
+        self.client_id = client_id
+        self.page_id = page_id
+        self.groups: Set[str] = set()
+        self.pending: 'OrderedDict[Hashable, str]' = OrderedDict()
+        self.ready = asyncio.Event()
+        self.closed = False
+        self.maxsize = maxsize
+        self.timeout = timeout
+
+    def offer(self, key: Hashable, message: str) -> bool:
+        if self.closed:
+            return False
+        if key in self.pending:
+            self.pending[key] = message
+            self.pending.move_to_end(key)
+        elif len(self.pending) >= self.maxsize:
+            self.closed = True
+            self.pending.clear()
+            self.ready.set()
+            return False
+        else:
+            self.pending[key] = message
+        self.ready.set()
+        return True
+
+    async def run(self) -> None:
+        """Send queued messages until the connection is closed."""
+        try:
+            while not self.closed:
+                await self.ready.wait()
+                self.ready.clear()
+                while self.pending and not self.closed:
+                    _, message = self.pending.popitem(last=False)
+                    await asyncio.wait_for(self.websocket.send_text(message), self.timeout)
+        except Exception:
+            # Timed out or the socket is gone, either way this consumer is dropped.
+            self.closed = True
+        with suppress(Exception):
+            # 1013: try again later
+            await self.websocket.close(code=1013)
+
+
+
+class PushHub:
+    """Fan-out of messages to connected browsers, by client id, by group or to everyone.
+
+    Publishing only enqueues on each connection, so it never waits on a socket.
+    """
+    def __init__(self, maxsize: int=PUSH_QUEUE_SIZE, timeout: float=PUSH_SEND_TIMEOUT) -> None:
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.connections: Set[Connection] = set()
+        self.clients: Dict[str, Set[Connection]] = {}
+        self.groups: Dict[str, Set[Connection]] = {}
+
+    def connect(self, websocket: WebSocket, client_id: Optional[str], page_id: Optional[str]=None) -> Connection:
+        connection = Connection(websocket, client_id, page_id, self.maxsize, self.timeout)
+        self.connections.add(connection)
+        if client_id is not None:
+            self.clients.setdefault(client_id, set()).add(connection)
+        return connection
+
+    def disconnect(self, connection: Connection) -> None:
+        connection.closed = True
+        connection.ready.set()
+        self.connections.discard(connection)
+        self.discard(self.clients, connection.client_id, connection)
+        for group in connection.groups:
+            self.discard(self.groups, group, connection)
+
+    def discard(self, index: Dict[str, Set[Connection]], key: Optional[str], connection: Connection) -> None:
+        connections = index.get(key)
+        if connections is not None:
+            connections.discard(connection)
+            if not connections:
+                del index[key]
+
+    def join(self, client_id: str, group: str) -> None:
+        for connection in self.clients.get(client_id, ()):
+            connection.groups.add(group)
+            self.groups.setdefault(group, set()).add(connection)
+
+    def leave(self, client_id: str, group: str) -> None:
+        for connection in self.clients.get(client_id, ()):
+            connection.groups.discard(group)
+            self.discard(self.groups, group, connection)
+
+    def targets(self, client_id: Optional[str]=None, group: Optional[str]=None) -> Iterable[Connection]:
+        if client_id is not None:
+            return list(self.clients.get(client_id, ()))
+        if group is not None:
+            return list(self.groups.get(group, ()))
+        return list(self.connections)
+
+    def send(self, key: Hashable, message: str, client_id: Optional[str]=None, group: Optional[str]=None, connections: Optional[Iterable[Connection]]=None) -> int:
+        """Queue `message` on the target connections and return how many accepted it."""
+        delivered = 0
+        for connection in self.targets(client_id, group) if connections is None else connections:
+            if connection.offer(key, message):
+                delivered += 1
+            else:
+                self.disconnect(connection)
+        return delivered
+
+    def publish(self, component_id: str, html: str, client_id: Optional[str]=None, group: Optional[str]=None) -> int:
+        """Queue a swap of the element `#component_id` with `html`.
+
+        Pages that already show the same fragment are skipped.
+        """
+        connections = [
+            connection for connection in self.targets(client_id, group)
+            if connection.page_id is None or SENT_FRAGMENTS.update(connection.page_id, component_id, html)
+        ]
+        message = json.dumps({"type": "swap", "id": component_id, "html": str(html)})
+        return self.send(("swap", component_id), message, connections=connections)
+
+    def reload(self, client_id: Optional[str]=None, group: Optional[str]=None) -> int:
+        return self.send(("reload",), json.dumps({"type": "reload"}), client_id, group)
@@ -0,0 +1,192 @@
+import os, sys, asyncio
+import runpy, importlib, logging
+from types import ModuleType
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+from fluidframe_test.config import WATCH_INTERVAL
+from fluidframe_test.core.cache import RENDER_CACHE
+from fluidframe_test.core.components import Component, StatefulComponent
+from fluidframe_test.core.fluidframe import FluidFrame
+
+logger = logging.getLogger("fluidframe.reload")
+
+FRAMEWORK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+# Installed packages are not reloaded, so their directories are never scanned.
+IGNORED_DIRS = frozenset({"__pycache__", "node_modules", "venv", "env", "site-packages", "dist-packages"})
+
+
+class FileWatcher:
+    """Polls the modification times of source files under `paths`."""
+    def __init__(self, paths: Sequence[str], suffixes: Sequence[str]=(".py",), interval: float=WATCH_INTERVAL) -> None:
+        self.paths = [os.path.abspath(path) for path in paths]
+        self.suffixes = tuple(suffixes)
+        self.interval = interval
+        self.mtimes = self.snapshot()
+
+    def snapshot(self) -> Dict[str, int]:
+        mtimes: Dict[str, int] = {}
+        stack = list(self.paths)
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not ignored_dir(entry):
+                            stack.append(entry.path)
+                    elif entry.name.endswith(self.suffixes):
+                        try:
+                            mtimes[entry.path] = entry.stat().st_mtime_ns
+                        except OSError:
+                            pass
+        return mtimes
+
+    def changes(self) -> List[str]:
+        mtimes = self.snapshot()
+        changed = [path for path, mtime in mtimes.items() if self.mtimes.get(path) != mtime]
+        self.mtimes = mtimes
+        return changed
+
+    async def watch(self, callback: Callable[[List[str]], Awaitable[None]]) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            changed = await asyncio.to_thread(self.changes)
+            if changed:
+                try:
+                    await callback(changed)
+                except Exception:
+                    logger.exception("Hot reload failed")
+
+
+
+def ignored_dir(entry: os.DirEntry) -> bool:
+    # Virtual environments under any other name are recognised by their `pyvenv.cfg`.
+    return (entry.name.startswith(".") or entry.name in IGNORED_DIRS
+            or os.path.exists(os.path.join(entry.path, "pyvenv.cfg")))
+
+def module_files() -> Dict[str, ModuleType]:
+    files = {}
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path:
+            files[os.path.abspath(path)] = module
+    return files
+
+def walk(components: Iterable[Component]) -> Iterable[Component]:
+    stack = list(components)
+    while stack:
+        component = stack.pop()
+        yield component
+        stack.extend(getattr(component, "children", None) or ())
+
+class HotReloader:
+    """Reloads changed user modules in place and pushes the affected components.
+
+    Live components whose class comes from a reloaded module are switched to the new
+    class and re-rendered; only their fragments are sent over `/ws`.
+
+    A change to the module that builds the app (or `__main__`, for single-file apps)
+    runs that module again, without its `if __name__ == "__main__"` block, and the
+    server switches to the routes and components of the app it builds; every page is
+    then told to reload in full. Open sockets and the state store carry over, unless
+    the module passes a new `state_store=`. If the module fails to run, the previous
+    app keeps serving and the error is logged.
+    """
+    def __init__(self, app, paths: Optional[Sequence[str]]=None, interval: float=WATCH_INTERVAL) -> None:
+        # `served` is the app the server calls, `app` the one currently answering for it.
+        self.app = app
+        self.served = app
+        self.watcher = FileWatcher(paths or [os.getcwd()], interval=interval)
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self.task is None:
+            self.task = asyncio.ensure_future(self.watcher.watch(self.apply))
+
+    def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def lifespan(self, inner: Callable[[Any], AsyncContextManager]) -> Callable[[Any], AsyncContextManager]:
+        """Wrap the app's lifespan so the watcher runs with it, whether or not the app passed `lifespan=`."""
+        @asynccontextmanager
+        async def lifespan(app):
+            self.start()
+            try:
+                async with inner(app) as state:
+                    yield state
+            finally:
+                self.stop()
+        return lifespan
+
+    def is_app_module(self, module: ModuleType) -> bool:
+        return module.__name__ == "__main__" or any(value is self.served or value is self.app for value in vars(module).values())
+
+    def rebuild(self, module: ModuleType) -> None:
+        """Run the app module again and serve the app it builds."""
+        if module.__name__ == "__main__":
+            namespace = runpy.run_path(module.__file__, run_name="__fluidframe_reload__")
+        else:
+            namespace = vars(importlib.reload(module))
+        app = next((value for value in namespace.values() if isinstance(value, FluidFrame) and value is not self.app), None)
+        if app is None:
+            logger.warning("App module %s no longer builds an app, keeping the running one", module.__name__)
+            return
+        # The reloader of the new app never starts, this one keeps watching.
+        app.hub = self.app.hub
+        app.reloader = self
+        served = self.served
+        served.router = app.router
+        served.user_middleware = app.user_middleware
+        served.exception_handlers = app.exception_handlers
+        # Rebuilt around the new router on the next request.
+        served.middleware_stack = None
+        self.app = app
+        RENDER_CACHE.clear()
+
+    async def apply(self, paths: List[str]) -> None:
+        modules = module_files()
+        reloaded: List[ModuleType] = []
+        app_module: Optional[ModuleType] = None
+        for path in paths:
+            module = modules.get(path)
+            if module is None or path.startswith(FRAMEWORK_DIR):
+                continue
+            if self.is_app_module(module):
+                app_module = module
+                continue
+            reloaded.append(importlib.reload(module))
+        if app_module is not None:
+            # After the other modules, so the app is built from their new code.
+            self.rebuild(app_module)
+            logger.info("Rebuilt the app from %s", app_module.__name__)
+            self.app.hub.reload()
+            return
+        if not reloaded:
+            return
+        names = {module.__name__: module for module in reloaded}
+        affected = []
+        for component in walk(self.app.childrens):
+            module = names.get(type(component).__module__)
+            if module is None:
+                continue
+            new_class = getattr(module, type(component).__qualname__, None)
+            if isinstance(new_class, type) and issubclass(new_class, Component):
+                component.__class__ = new_class
+                RENDER_CACHE.invalidate(component.id)
+                affected.append(component)
+        logger.info("Reloaded %s, re-rendering %d components", ", ".join(names), len(affected))
+        await self.push(affected)
+
+    async def push(self, components: List[Component]) -> None:
+        clients = list(self.app.hub.clients)
+        for component in components:
+            if isinstance(component, StatefulComponent):
+                # Each client sees its own state, so each gets its own render.
+                for client_id in clients:
+                    await self.app.push(component, client_id)
+            else:
+                await self.app.push(component)
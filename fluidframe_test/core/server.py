@@ -0,0 +1,125 @@
+import os, gc, sys, time
+import signal, socket, logging
+from typing import Callable, Dict, Union
+import uvicorn
+from starlette.applications import Starlette
+from fluidframe_test.config import WORKER_MIN_UPTIME, WORKER_RESTART_DELAY, WORKER_RESTART_MAX_DELAY
+from fluidframe_test.core.state import MemoryStateStore, get_state_store
+
+logger = logging.getLogger("fluidframe.server")
+
+
+def bind(host: str, port: int, backlog: int=2048) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+def run_worker(app: Starlette, sock: socket.socket, **config) -> None:
+    server = uvicorn.Server(uvicorn.Config(app, **config))
+    server.run(sockets=[sock])
+
+def describe_exit(status: int) -> str:
+    code = os.waitstatus_to_exitcode(status)
+    if code < 0:
+        return f"was killed by {signal.Signals(-code).name}"
+    return f"exited with code {code}"
+
+
+def serve(app: Union[Starlette, Callable[[], Starlette]], host: str="127.0.0.1", port: int=8000, workers: int=os.cpu_count() or 1, **config) -> None:
+    """Build the app once, then fork `workers` uvicorn processes sharing its listening socket.
+
+    The component tree, ids and event routes are built before the fork, so every worker
+    serves the same routes and shares the tree's memory copy-on-write. Render caches,
+    pushed sockets and the in-memory state store stay per worker; use a shared store
+    such as `SQLiteStateStore` when running more than one. It can be created in the
+    app factory, as it opens its connection in each worker on first use.
+
+    Workers that exit are restarted; a worker exiting soon after it started is restarted
+    after a delay that doubles with each such exit, so a broken app does not fork in a loop.
+    """
+    if callable(app) and not isinstance(app, Starlette):
+        app = app()
+    if workers > 1 and isinstance(get_state_store(), MemoryStateStore):
+        logger.warning("The in-memory state store is per worker, clients will see different state across %d workers", workers)
+    sock = bind(host, port)
+    # Objects allocated so far are never collected in the workers, so the collector
+    # does not write to (and copy) the pages holding the shared tree.
+    gc.freeze()
+
+    children: Dict[int, int] = {}
+    # Start time, consecutive early exits and pending restart time of each worker slot.
+    started: Dict[int, float] = {}
+    crashes: Dict[int, int] = {}
+    restarts: Dict[int, float] = {}
+    stopping = False
+
+    def spawn(index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            code = 1
+            try:
+                run_worker(app, sock, **config)
+                code = 0
+            except BaseException:
+                logger.exception("Worker %d failed", os.getpid())
+            finally:
+                os._exit(code)
+        children[pid] = index
+        started[index] = time.monotonic()
+
+    def schedule(index: int) -> float:
+        # Workers failing right after they start are restarted ever more slowly, not in a tight loop.
+        if time.monotonic() - started[index] < WORKER_MIN_UPTIME:
+            crashes[index] = crashes.get(index, 0) + 1
+        else:
+            crashes[index] = 0
+        delay = 0.0 if not crashes[index] else min(WORKER_RESTART_DELAY * 2 ** (crashes[index] - 1), WORKER_RESTART_MAX_DELAY)
+        restarts[index] = time.monotonic() + delay
+        return delay
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        restarts.clear()
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    for index in range(workers):
+        spawn(index)
+    logger.info("Serving on %s:%d with %d workers", host, port, workers)
+
+    while children or (restarts and not stopping):
+        now = time.monotonic()
+        for index, at in list(restarts.items()):
+            if at <= now and not stopping:
+                del restarts[index]
+                spawn(index)
+        try:
+            # Polled while restarts are pending, so they are not held up by the other workers.
+            pid, status = os.waitpid(-1, os.WNOHANG if restarts else 0)
+        except ChildProcessError:
+            if restarts and not stopping:
+                time.sleep(max(min(restarts.values()) - time.monotonic(), 0))
+                continue
+            break
+        except InterruptedError:
+            continue
+        if pid == 0:
+            time.sleep(min(max(min(restarts.values()) - time.monotonic(), 0), 0.1))
+            continue
+        index = children.pop(pid, None)
+        if index is not None and not stopping:
+            delay = schedule(index)
+            logger.warning("Worker %d %s, restarting in %.1fs", pid, describe_exit(status), delay)
+    sock.close()
+    sys.exit(0)
@@ -0,0 +1,270 @@
+import os, sys, json, time
+import threading
+from uuid import uuid4
+from urllib.parse import parse_qs
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from fluidframe_test.core.updates import PAGE_ID
+from fluidframe_test.config import STATE_COOKIE, STATE_TTL, STATE_MAX_ENTRIES, STATE_MAX_BYTES, PAGE_HEADER
+
+# Id of the browser the current request comes from, set by `ClientMiddleware`.
+CLIENT_ID: ContextVar[Optional[str]] = ContextVar("fluidframe_client_id", default=None)
+
+
+class StateRecord:
+    __slots__ = ("values", "expires_at", "size")
+
+    def __init__(self, values: Dict[str, Any], expires_at: float, size: int) -> None:
+        self.values = values
+        self.expires_at = expires_at
+        self.size = size
+
+
+
+class StateStore(ABC):
+    """Storage for component state, one record per client per component.
+
+    Records expire once they have not been read or written for the store's TTL, so a
+    client keeps its state for as long as it keeps using it.
+    """
+    # Set to True on stores whose calls wait on I/O, so renders and event handlers that
+    # read or write state run in a worker thread instead of blocking the event loop.
+    blocking: bool = False
+
+    def version(self) -> Optional[int]:
+        """A counter bumped on every change, for stores shared between processes.
+
+        Page ETags include it, so a change made through another worker is not answered
+        with `304 Not Modified`. None for stores only this process can change.
+        """
+        return None
+
+    @abstractmethod
+    def get(self, client_id: str, component_id: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def set(self, client_id: str, component_id: str, values: Dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, client_id: str, component_id: str) -> None:
+        pass
+
+
+
+class MemoryStateStore(StateStore):
+    """In-process store with LRU eviction, an idle TTL and an approximate memory cap.
+
+    Every access renews a record's expiry and moves it to the end of the LRU order,
+    so the LRU order is also the expiry order and expired records are always at the front.
+    """
+    def __init__(self, max_entries: int=STATE_MAX_ENTRIES, ttl: float=STATE_TTL, max_bytes: int=STATE_MAX_BYTES) -> None:
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.size = 0
+        self.lock = threading.Lock()
+        self.records: 'OrderedDict[Tuple[str, str], StateRecord]' = OrderedDict()
+
+    def get(self, client_id: str, component_id: str) -> Optional[Dict[str, Any]]:
+        key = (client_id, component_id)
+        now = time.monotonic()
+        with self.lock:
+            record = self.records.get(key)
+            if record is None:
+                return None
+            if record.expires_at <= now:
+                self.remove(key)
+                return None
+            record.expires_at = now + self.ttl
+            self.records.move_to_end(key)
+            return record.values
+
+    def set(self, client_id: str, component_id: str, values: Dict[str, Any]) -> None:
+        key = (client_id, component_id)
+        now = time.monotonic()
+        size = sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in values.items())
+        with self.lock:
+            self.remove(key)
+            self.records[key] = StateRecord(values, now + self.ttl, size)
+            self.size += size
+            self.evict(now)
+
+    def delete(self, client_id: str, component_id: str) -> None:
+        with self.lock:
+            self.remove((client_id, component_id))
+
+    def remove(self, key: Tuple[str, str]) -> None:
+        record = self.records.pop(key, None)
+        if record is not None:
+            self.size -= record.size
+
+    def evict(self, now: float) -> None:
+        records = self.records
+        while records and (len(records) > self.max_entries or self.size > self.max_bytes or next(iter(records.values())).expires_at <= now):
+            _, record = records.popitem(last=False)
+            self.size -= record.size
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+
+class SQLiteStateStore(StateStore):
+    """Store backed by a local SQLite file, shared by worker processes and kept across restarts.
+
+    Values are stored as JSON, so they must be JSON serializable. A SQLite connection
+    must not be used across `fork`, so each process opens its own on first use: the
+    store can be created before `serve` forks its workers.
+
+    Reads renew a record's expiry like writes do, but at most once per tenth of the TTL,
+    so that reading state does not turn into a write on every render.
+    """
+    blocking = True
+
+    def __init__(self, path: str="fluidframe_state.sqlite3", ttl: float=STATE_TTL, purge_every: int=1000) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.writes = 0
+        self.purge_every = purge_every
+        self.lock = threading.Lock()
+        self.pid: Optional[int] = None
+        self.db = None
+
+    @property
+    def connection(self):
+        # Called with `lock` held.
+        if self.pid != os.getpid():
+            import sqlite3
+            self.db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS state ("
+                "client_id TEXT NOT NULL, component_id TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (client_id, component_id)) WITHOUT ROWID"
+            )
+            self.db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL) WITHOUT ROWID")
+            self.pid = os.getpid()
+        return self.db
+
+    def bump(self, connection) -> None:
+        # After the write, so a reader never pairs the new version with the old values.
+        connection.execute("INSERT INTO meta (key, value) VALUES ('version', 1) ON CONFLICT (key) DO UPDATE SET value = value + 1")
+
+    def version(self) -> Optional[int]:
+        with self.lock:
+            row = self.connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return row[0] if row is not None else 0
+
+    def get(self, client_id: str, component_id: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self.lock:
+            connection = self.connection
+            row = connection.execute(
+                "SELECT value, expires_at FROM state WHERE client_id = ? AND component_id = ? AND expires_at > ?",
+                (client_id, component_id, now),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now + self.ttl * 0.9:
+                connection.execute(
+                    "UPDATE state SET expires_at = ? WHERE client_id = ? AND component_id = ?",
+                    (now + self.ttl, client_id, component_id),
+                )
+        return json.loads(row[0])
+
+    def set(self, client_id: str, component_id: str, values: Dict[str, Any]) -> None:
+        with self.lock:
+            connection = self.connection
+            connection.execute(
+                "INSERT OR REPLACE INTO state (client_id, component_id, value, expires_at) VALUES (?, ?, ?, ?)",
+                (client_id, component_id, json.dumps(values), time.time() + self.ttl),
+            )
+            self.writes += 1
+            if self.writes % self.purge_every == 0:
+                connection.execute("DELETE FROM state WHERE expires_at <= ?", (time.time(),))
+            self.bump(connection)
+
+    def delete(self, client_id: str, component_id: str) -> None:
+        with self.lock:
+            connection = self.connection
+            connection.execute("DELETE FROM state WHERE client_id = ? AND component_id = ?", (client_id, component_id))
+            self.bump(connection)
+
+    def close(self) -> None:
+        with self.lock:
+            if self.db is not None and self.pid == os.getpid():
+                self.db.close()
+            self.db = self.pid = None
+
+
+
+STATE_STORE: StateStore = MemoryStateStore()
+
+def get_state_store() -> StateStore:
+    return STATE_STORE
+
+def set_state_store(store: StateStore) -> None:
+    global STATE_STORE
+    STATE_STORE = store
+
+
+
+class ClientMiddleware:
+    """Identify each browser by a cookie and expose its id through `CLIENT_ID`.
+
+    The page load a request comes from, sent by htmx in the `PAGE_HEADER` header and
+    by the socket client as the `page` query parameter, is exposed through `PAGE_ID`.
+    """
+    def __init__(self, app: ASGIApp, cookie: str=STATE_COOKIE, max_age: int=STATE_TTL) -> None:
+        self.app = app
+        self.cookie = cookie
+        self.max_age = max_age
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        client_id = self.read_cookie(scope)
+        is_new = client_id is None
+        if is_new:
+            client_id = uuid4().hex
+        token = CLIENT_ID.set(client_id)
+        page_token = PAGE_ID.set(self.read_page(scope))
+
+        async def send_with_cookie(message: Message) -> None:
+            if is_new and message["type"] == "http.response.start":
+                cookie = f"{self.cookie}={client_id}; Path=/; Max-Age={self.max_age}; HttpOnly; SameSite=Lax"
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            CLIENT_ID.reset(token)
+            PAGE_ID.reset(page_token)
+
+    def read_page(self, scope: Scope) -> Optional[str]:
+        if scope["type"] == "websocket":
+            return parse_qs(scope["query_string"].decode("latin-1")).get("page", [None])[0]
+        header = PAGE_HEADER.lower().encode("latin-1")
+        for name, value in scope["headers"]:
+            if name == header:
+                return value.decode("latin-1") or None
+        return None
+
+    def read_cookie(self, scope: Scope) -> Optional[str]:
+        prefix = f"{self.cookie}="
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                for part in value.decode("latin-1").split(";"):
+                    part = part.strip()
+                    if part.startswith(prefix):
+                        return part[len(prefix):] or None
+        return None
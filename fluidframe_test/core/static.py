@@ -0,0 +1,51 @@
+import os, stat
+import anyio
+from starlette.types import Scope
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from fluidframe_test.config import COMPRESSIBLE_ASSETS, ASSET_MAX_AGE
+from fluidframe_test.core.assets import HASHED_NAME, MANIFEST
+from fluidframe_test.core.compression import accepted_encodings, accepts, share
+
+
+class HashedStaticFiles(StaticFiles):
+    """`StaticFiles` that understands fingerprinted names and precompressed files.
+
+    `name.<hash>.ext` serves `name.ext` and, when the hash matches the current content,
+    marks it immutable. A fresh `name.ext.gz` is served instead of `name.ext` to
+    clients that accept gzip.
+    """
+    def __init__(self, *args, max_age: int=ASSET_MAX_AGE, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_age = max_age
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        match = HASHED_NAME.match(path)
+        original = f"{match[1]}{match[3]}" if match else path
+        try:
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, original)
+        except OSError:
+            full_path, stat_result = "", None
+        if scope["method"] not in ("GET", "HEAD") or stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return await super().get_response(path, scope)
+
+        immutable = match is not None and match[2] == await anyio.to_thread.run_sync(MANIFEST.hash_of, full_path)
+        headers = {"Cache-Control": f"public, max-age={self.max_age}, immutable" if immutable else "no-cache"}
+        if full_path.endswith(COMPRESSIBLE_ASSETS):
+            headers["Vary"] = "Accept-Encoding"
+            share(scope)
+            if accepts(accepted_encodings(Headers(scope=scope).get("accept-encoding", "")), "gzip") > 0:
+                compressed = full_path + ".gz"
+                try:
+                    compressed_stat = os.stat(compressed)
+                except OSError:
+                    compressed_stat = None
+                if compressed_stat is not None and compressed_stat.st_mtime_ns >= stat_result.st_mtime_ns:
+                    response = self.file_response(compressed, compressed_stat, scope)
+                    headers["Content-Encoding"] = "gzip"
+                    response.headers.update(headers)
+                    return response
+        response = self.file_response(full_path, stat_result, scope)
+        response.headers.update(headers)
+        return response
@@ -1,1976 +1,1936 @@
-from typing import Callable
+from contextvars import Token
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Protocol, Union
 
-def create_element(tag: str, closing_tag: bool = True) -> Callable: 
-    """
-    Create a function that generates an HTML element with the given tag name.
 
-    When the returned function is called with arguments, it will generate an HTML
-    element with the given tag name, using the arguments as the content and attributes
-    of the element.
+class _Writable(Protocol):
+    def write(self, chunk: str, /) -> Any: ...
 
-    **Args:**
-        - `tag` (str): The name of the HTML tag that the returned function will generate.
-        - `closing_tag` (bool, optional): Whether the HTML tag has a closing tag. Defaults to True.
 
-    **Returns:**
-        Callable: A function that generates an HTML element with the given tag name.
+class Markup(str):
     """
-    ...
-    
-########
-# Tags #
-########
+    A string of HTML that tags insert as is instead of escaping it. Every tag returns
+    `Markup` while autoescaping is on, so rendered fragments nest without being escaped
+    twice. Wrap pre-rendered HTML from other sources in `Markup` to insert it verbatim.
 
-def i(*args, **kwargs) -> str: 
-    """**Generate an HTML <i> element.**
+    Concatenating with a plain `str` escapes the plain operand and keeps the result safe.
+    """
+    def __html__(self) -> "Markup": ...
+    def __add__(self, other: str) -> "Markup": ...
+    def __radd__(self, other: str) -> "Markup": ...
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
 
-    For example, `i('Hello, world!', id='i-id', cls='greeting-class')` will generate
-    an HTML element like `<i id="i-id" class="greeting-class">Hello, world!</i>`.
+def escape(value: Any) -> str:
+    """
+    Escape `<`, `>`, `&`, `"` and `'` for use in HTML text or attribute values.
 
-    **Returns:**
-    
-        str: The generated HTML element.
+    Strings without any of those characters are returned unchanged (the very same
+    object), `Markup` is returned as is and objects with an `__html__` method are trusted.
     """
     ...
-    
 
-def a(*args, **kwargs) -> str: 
-    """**Generate an HTML <a> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
-
-    For example, `a('Hello, world!', id='a-id', cls='greeting-class')` will generate
-    an HTML element like `<a id="a-id" class="greeting-class">Hello, world!</a>`.
+def set_autoescape(enabled: bool) -> Token[bool]:
+    """
+    Turn escaping of attribute values and text content on (the default) or off in the
+    current context, i.e. for this task or thread and those it starts afterwards.
+    The content of `<script>` and `<style>` is raw text and is never escaped.
 
     **Returns:**
-    
-        str: The generated HTML element.
+
+        Token: Pass it to `reset_autoescape` to restore the previous setting.
     """
     ...
-    
 
-def b(*args, **kwargs) -> str: 
-    """**Generate an HTML <b> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+def reset_autoescape(token: Token[bool]) -> None: ...
 
-    For example, `b('Hello, world!', id='b-id', cls='greeting-class')` will generate
-    an HTML element like `<b id="b-id" class="greeting-class">Hello, world!</b>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
+def get_autoescape() -> bool: ...
+
+
+class Node:
     """
-    ...
-    
+    A lazily serialized HTML element returned by `Element.node` (or by every tag once
+    `set_node_mode(True)` is active). Children are kept as references and the whole tree
+    is serialized exactly once, so nested pages render in linear time and memory.
 
-def p(*args, **kwargs) -> str: 
-    """**Generate an HTML <p> element.**
+    **Attributes:**
+        - `start` (str): The rendered start tag, empty for fragments.
+        - `children` (list): Child strings and nodes, in output order.
+        - `end` (str): The rendered end tag, empty for void elements and fragments.
+    """
+    start: str
+    children: List[Union[str, "Node"]]
+    end: str
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    def __init__(self, start: str = '', children: List[Union[str, "Node"]] | None = None, end: str = '') -> None: ...
+    def __iter__(self) -> Iterator[str]:
+        """Yield the serialized HTML in chunks, depth first."""
+        ...
+    def render(self) -> str:
+        """Serialize the whole tree into a single string."""
+        ...
+    def write_to(self, buffer: _Writable, indent: int | None = None) -> None:
+        """
+        Write the serialized HTML chunk by chunk to any object with a `write` method,
+        pretty-printed on the fly when `indent` is given.
+        """
+        ...
+    def pretty(self, indent: int = 2) -> str:
+        """Serialize the tree pretty-printed, in the same single pass as `render`."""
+        ...
+    def __html__(self) -> Markup: ...
 
-    For example, `p('Hello, world!', id='p-id', cls='greeting-class')` will generate
-    an HTML element like `<p id="p-id" class="greeting-class">Hello, world!</p>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
+class Prettifier:
     """
-    ...
-    
+    Single-pass, streaming HTML indenter. Every tag, comment and text run goes on its
+    own line, indented by nesting depth; the content of `<pre>`/`<textarea>` is kept
+    verbatim and `<script>`/`<style>` content is never tokenized.
 
-def s(*args, **kwargs) -> str: 
-    """**Generate an HTML <s> element.**
+    Tag names are lowercased and elements nest as in an `html.parser` tree: an end tag
+    also closes the elements still open inside it, stray end tags are dropped and
+    elements left open are closed by `close`.
+    """
+    def __init__(self, indent: int = 2) -> None: ...
+    def feed(self, chunk: str) -> str:
+        """Consume the next chunk of HTML and return the output completed so far."""
+        ...
+    def close(self) -> str:
+        """Flush and return the remaining output."""
+        ...
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
 
-    For example, `s('Hello, world!', id='s-id', cls='greeting-class')` will generate
-    an HTML element like `<s id="s-id" class="greeting-class">Hello, world!</s>`.
+def prettify(html: str, indent: int = 2) -> str:
+    """
+    Pretty-print `html` with one tag or text run per line, indented by `indent` spaces
+    per level of nesting.
 
-    **Returns:**
-    
-        str: The generated HTML element.
+    The nesting matches BeautifulSoup's `html.parser` prettify, but nothing is
+    re-serialized: attributes and entities stay as written (`<input disabled>` does not
+    become `disabled=""`) and `<pre>`/`<textarea>` content is copied byte for byte.
     """
     ...
-    
 
-def u(*args, **kwargs) -> str: 
-    """**Generate an HTML <u> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+def fragment(*children: Any) -> Node:
+    """
+    Group children into a tag-less `Node`, e.g. `fragment("<!DOCTYPE html>", html.node(...))`.
+    """
+    ...
+
 
-    For example, `u('Hello, world!', id='u-id', cls='greeting-class')` will generate
-    an HTML element like `<u id="u-id" class="greeting-class">Hello, world!</u>`.
+def set_node_mode(enabled: bool) -> Token[bool]:
+    """
+    Opt in (or out) of node mode in the current context, i.e. for this task or thread
+    and those it starts afterwards. While enabled, every tag call returns a `Node`
+    instead of a `str`; `str(node)` gives back the same HTML as the string mode.
+    Components may return a `Node` from `render`, which the framework serializes.
 
     **Returns:**
-    
-        str: The generated HTML element.
+
+        Token: Pass it to `reset_node_mode` to restore the previous setting.
     """
     ...
-    
 
-def h1(*args, **kwargs) -> str: 
-    """**Generate an HTML <h1> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+def reset_node_mode(token: Token[bool]) -> None: ...
 
-    For example, `h1('Hello, world!', id='h1-id', cls='greeting-class')` will generate
-    an HTML element like `<h1 id="h1-id" class="greeting-class">Hello, world!</h1>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+def get_node_mode() -> bool: ...
 
-def h2(*args, **kwargs) -> str: 
-    """**Generate an HTML <h2> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+class Element:
+    """
+    Compiled HTML tag factory. Every tag exported by this module is an `Element`
+    instance, so calling it goes straight into the extension without a Python hop.
 
-    For example, `h2('Hello, world!', id='h2-id', cls='greeting-class')` will generate
-    an HTML element like `<h2 id="h2-id" class="greeting-class">Hello, world!</h2>`.
+    **Attributes:**
+        - `tag` (str): The name of the HTML tag.
+        - `closing_tag` (bool): Whether the HTML tag has a closing tag.
+        - `starting_tag` (str): The pre-baked opening prefix, e.g. `"<div "`.
+        - `end_tag` (str): The pre-baked closing tag, e.g. `"</div>"`.
+        - `raw_text` (bool): Whether the content is raw text (`<script>`, `<style>`) and never escaped.
 
-    **Returns:**
-    
-        str: The generated HTML element.
+    Attribute values and text content are escaped unless they are `Markup`, a `Node`
+    or the element is raw text; see `set_autoescape`. An attribute set to `True` is
+    written as a bare boolean attribute (`defer`), one set to `False` or `None` is
+    left out.
     """
-    ...
-    
+    tag: str
+    closing_tag: bool
+    raw_text: bool
+    end_tag: str
+    starting_tag: str
 
-def h3(*args, **kwargs) -> str: 
-    """**Generate an HTML <h3> element.**
+    def __init__(self, tag: str, closing_tag: bool = True) -> None: ...
+    def __call__(self, *args: Any, **kwargs: Any) -> Markup: ...
+    def node(self, *args: Any, **kwargs: Any) -> Node:
+        """Same arguments as calling the element, but always returns a lazy `Node`."""
+        ...
+    def map(
+        self,
+        items: Iterable[Any],
+        row: Union["Element", Callable[[Any], Any]],
+        cell: "Element | None" = None,
+        row_attrs: Dict[str, Any] | None = None,
+        cell_attrs: Dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Markup:
+        """
+        Render every item as a `row` element inside this element in a single C-level loop.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+        For example, `ul.map(["a", "b"], li, cls="list")` generates
+        `<ul class="list"><li>a</li><li>b</li></ul>`, and `tbody.map(rows, tr, td)` renders
+        each row of `rows` as a `<tr>` with one `<td>` per value. `row_attrs`/`cell_attrs`
+        are applied to every row/cell, keyword arguments to the container itself. `row`
+        may also be any callable returning HTML, which is then called once per item.
 
-    For example, `h3('Hello, world!', id='h3-id', cls='greeting-class')` will generate
-    an HTML element like `<h3 id="h3-id" class="greeting-class">Hello, world!</h3>`.
+        **Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+            Markup: The generated HTML element (a `Node` while node mode is on).
+        """
+        ...
 
-def h4(*args, **kwargs) -> str: 
-    """**Generate an HTML <h4> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+def create_element(tag: str, closing_tag: bool = True) -> Element: 
+    """
+    Create an `Element` that generates an HTML element with the given tag name.
+
+    When the returned element is called with arguments, it will generate an HTML
+    element with the given tag name, using the arguments as the content and attributes
+    of the element.
 
-    For example, `h4('Hello, world!', id='h4-id', cls='greeting-class')` will generate
-    an HTML element like `<h4 id="h4-id" class="greeting-class">Hello, world!</h4>`.
+    **Args:**
+        - `tag` (str): The name of the HTML tag that the returned element will generate.
+        - `closing_tag` (bool, optional): Whether the HTML tag has a closing tag. Defaults to True.
 
     **Returns:**
-    
-        str: The generated HTML element.
+        Element: A callable that generates an HTML element with the given tag name.
     """
     ...
     
+########
+# Tags #
+########
 
-def h5(*args, **kwargs) -> str: 
-    """**Generate an HTML <h5> element.**
+i: Element
+"""**Generate an HTML <i> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `h5('Hello, world!', id='h5-id', cls='greeting-class')` will generate
-    an HTML element like `<h5 id="h5-id" class="greeting-class">Hello, world!</h5>`.
+For example, `i('Hello, world!', id='i-id', cls='greeting-class')` will generate
+an HTML element like `<i id="i-id" class="greeting-class">Hello, world!</i>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def h6(*args, **kwargs) -> str: 
-    """**Generate an HTML <h6> element.**
+    Markup: The generated HTML element. `i.node(...)` returns a lazy `Node`
+    instead and `i.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+a: Element
+"""**Generate an HTML <a> element.**
 
-    For example, `h6('Hello, world!', id='h6-id', cls='greeting-class')` will generate
-    an HTML element like `<h6 id="h6-id" class="greeting-class">Hello, world!</h6>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `a('Hello, world!', id='a-id', cls='greeting-class')` will generate
+an HTML element like `<a id="a-id" class="greeting-class">Hello, world!</a>`.
 
-def dd(*args, **kwargs) -> str: 
-    """**Generate an HTML <dd> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `a.node(...)` returns a lazy `Node`
+    instead and `a.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `dd('Hello, world!', id='dd-id', cls='greeting-class')` will generate
-    an HTML element like `<dd id="dd-id" class="greeting-class">Hello, world!</dd>`.
+b: Element
+"""**Generate an HTML <b> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def dl(*args, **kwargs) -> str: 
-    """**Generate an HTML <dl> element.**
+For example, `b('Hello, world!', id='b-id', cls='greeting-class')` will generate
+an HTML element like `<b id="b-id" class="greeting-class">Hello, world!</b>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `dl('Hello, world!', id='dl-id', cls='greeting-class')` will generate
-    an HTML element like `<dl id="dl-id" class="greeting-class">Hello, world!</dl>`.
+    Markup: The generated HTML element. `b.node(...)` returns a lazy `Node`
+    instead and `b.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+p: Element
+"""**Generate an HTML <p> element.**
 
-def dt(*args, **kwargs) -> str: 
-    """**Generate an HTML <dt> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `p('Hello, world!', id='p-id', cls='greeting-class')` will generate
+an HTML element like `<p id="p-id" class="greeting-class">Hello, world!</p>`.
 
-    For example, `dt('Hello, world!', id='dt-id', cls='greeting-class')` will generate
-    an HTML element like `<dt id="dt-id" class="greeting-class">Hello, world!</dt>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `p.node(...)` returns a lazy `Node`
+    instead and `p.map(...)` renders a list of rows inside it.
+"""
 
-def em(*args, **kwargs) -> str: 
-    """**Generate an HTML <em> element.**
+s: Element
+"""**Generate an HTML <s> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `em('Hello, world!', id='em-id', cls='greeting-class')` will generate
-    an HTML element like `<em id="em-id" class="greeting-class">Hello, world!</em>`.
+For example, `s('Hello, world!', id='s-id', cls='greeting-class')` will generate
+an HTML element like `<s id="s-id" class="greeting-class">Hello, world!</s>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def li(*args, **kwargs) -> str: 
-    """**Generate an HTML <li> element.**
+    Markup: The generated HTML element. `s.node(...)` returns a lazy `Node`
+    instead and `s.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+u: Element
+"""**Generate an HTML <u> element.**
 
-    For example, `li('Hello, world!', id='li-id', cls='greeting-class')` will generate
-    an HTML element like `<li id="li-id" class="greeting-class">Hello, world!</li>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `u('Hello, world!', id='u-id', cls='greeting-class')` will generate
+an HTML element like `<u id="u-id" class="greeting-class">Hello, world!</u>`.
 
-def rp(*args, **kwargs) -> str: 
-    """**Generate an HTML <rp> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `u.node(...)` returns a lazy `Node`
+    instead and `u.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `rp('Hello, world!', id='rp-id', cls='greeting-class')` will generate
-    an HTML element like `<rp id="rp-id" class="greeting-class">Hello, world!</rp>`.
+h1: Element
+"""**Generate an HTML <h1> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def rt(*args, **kwargs) -> str: 
-    """**Generate an HTML <rt> element.**
+For example, `h1('Hello, world!', id='h1-id', cls='greeting-class')` will generate
+an HTML element like `<h1 id="h1-id" class="greeting-class">Hello, world!</h1>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `rt('Hello, world!', id='rt-id', cls='greeting-class')` will generate
-    an HTML element like `<rt id="rt-id" class="greeting-class">Hello, world!</rt>`.
+    Markup: The generated HTML element. `h1.node(...)` returns a lazy `Node`
+    instead and `h1.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+h2: Element
+"""**Generate an HTML <h2> element.**
 
-def ol(*args, **kwargs) -> str: 
-    """**Generate an HTML <ol> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `h2('Hello, world!', id='h2-id', cls='greeting-class')` will generate
+an HTML element like `<h2 id="h2-id" class="greeting-class">Hello, world!</h2>`.
 
-    For example, `ol('Hello, world!', id='ol-id', cls='greeting-class')` will generate
-    an HTML element like `<ol id="ol-id" class="greeting-class">Hello, world!</ol>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `h2.node(...)` returns a lazy `Node`
+    instead and `h2.map(...)` renders a list of rows inside it.
+"""
 
-def ul(*args, **kwargs) -> str: 
-    """**Generate an HTML <ul> element.**
+h3: Element
+"""**Generate an HTML <h3> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `ul('Hello, world!', id='ul-id', cls='greeting-class')` will generate
-    an HTML element like `<ul id="ul-id" class="greeting-class">Hello, world!</ul>`.
+For example, `h3('Hello, world!', id='h3-id', cls='greeting-class')` will generate
+an HTML element like `<h3 id="h3-id" class="greeting-class">Hello, world!</h3>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def td(*args, **kwargs) -> str: 
-    """**Generate an HTML <td> element.**
+    Markup: The generated HTML element. `h3.node(...)` returns a lazy `Node`
+    instead and `h3.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+h4: Element
+"""**Generate an HTML <h4> element.**
 
-    For example, `td('Hello, world!', id='td-id', cls='greeting-class')` will generate
-    an HTML element like `<td id="td-id" class="greeting-class">Hello, world!</td>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `h4('Hello, world!', id='h4-id', cls='greeting-class')` will generate
+an HTML element like `<h4 id="h4-id" class="greeting-class">Hello, world!</h4>`.
 
-def th(*args, **kwargs) -> str: 
-    """**Generate an HTML <th> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `h4.node(...)` returns a lazy `Node`
+    instead and `h4.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `th('Hello, world!', id='th-id', cls='greeting-class')` will generate
-    an HTML element like `<th id="th-id" class="greeting-class">Hello, world!</th>`.
+h5: Element
+"""**Generate an HTML <h5> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def tr(*args, **kwargs) -> str: 
-    """**Generate an HTML <tr> element.**
+For example, `h5('Hello, world!', id='h5-id', cls='greeting-class')` will generate
+an HTML element like `<h5 id="h5-id" class="greeting-class">Hello, world!</h5>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `tr('Hello, world!', id='tr-id', cls='greeting-class')` will generate
-    an HTML element like `<tr id="tr-id" class="greeting-class">Hello, world!</tr>`.
+    Markup: The generated HTML element. `h5.node(...)` returns a lazy `Node`
+    instead and `h5.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+h6: Element
+"""**Generate an HTML <h6> element.**
 
-def var(*args, **kwargs) -> str: 
-    """**Generate an HTML <var> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `h6('Hello, world!', id='h6-id', cls='greeting-class')` will generate
+an HTML element like `<h6 id="h6-id" class="greeting-class">Hello, world!</h6>`.
 
-    For example, `var('Hello, world!', id='var-id', cls='greeting-class')` will generate
-    an HTML element like `<var id="var-id" class="greeting-class">Hello, world!</var>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `h6.node(...)` returns a lazy `Node`
+    instead and `h6.map(...)` renders a list of rows inside it.
+"""
 
-def nav(*args, **kwargs) -> str: 
-    """**Generate an HTML <nav> element.**
+dd: Element
+"""**Generate an HTML <dd> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `nav('Hello, world!', id='nav-id', cls='greeting-class')` will generate
-    an HTML element like `<nav id="nav-id" class="greeting-class">Hello, world!</nav>`.
+For example, `dd('Hello, world!', id='dd-id', cls='greeting-class')` will generate
+an HTML element like `<dd id="dd-id" class="greeting-class">Hello, world!</dd>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def sub(*args, **kwargs) -> str: 
-    """**Generate an HTML <sub> element.**
+    Markup: The generated HTML element. `dd.node(...)` returns a lazy `Node`
+    instead and `dd.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+dl: Element
+"""**Generate an HTML <dl> element.**
 
-    For example, `sub('Hello, world!', id='sub-id', cls='greeting-class')` will generate
-    an HTML element like `<sub id="sub-id" class="greeting-class">Hello, world!</sub>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `dl('Hello, world!', id='dl-id', cls='greeting-class')` will generate
+an HTML element like `<dl id="dl-id" class="greeting-class">Hello, world!</dl>`.
 
-def sup(*args, **kwargs) -> str: 
-    """**Generate an HTML <sup> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `dl.node(...)` returns a lazy `Node`
+    instead and `dl.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `sup('Hello, world!', id='sup-id', cls='greeting-class')` will generate
-    an HTML element like `<sup id="sup-id" class="greeting-class">Hello, world!</sup>`.
+dt: Element
+"""**Generate an HTML <dt> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def svg(*args, **kwargs) -> str: 
-    """**Generate an HTML <svg> element.**
+For example, `dt('Hello, world!', id='dt-id', cls='greeting-class')` will generate
+an HTML element like `<dt id="dt-id" class="greeting-class">Hello, world!</dt>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `svg('Hello, world!', id='svg-id', cls='greeting-class')` will generate
-    an HTML element like `<svg id="svg-id" class="greeting-class">Hello, world!</svg>`.
+    Markup: The generated HTML element. `dt.node(...)` returns a lazy `Node`
+    instead and `dt.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+em: Element
+"""**Generate an HTML <em> element.**
 
-def ins(*args, **kwargs) -> str: 
-    """**Generate an HTML <ins> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `em('Hello, world!', id='em-id', cls='greeting-class')` will generate
+an HTML element like `<em id="em-id" class="greeting-class">Hello, world!</em>`.
 
-    For example, `ins('Hello, world!', id='ins-id', cls='greeting-class')` will generate
-    an HTML element like `<ins id="ins-id" class="greeting-class">Hello, world!</ins>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `em.node(...)` returns a lazy `Node`
+    instead and `em.map(...)` renders a list of rows inside it.
+"""
 
-def kbd(*args, **kwargs) -> str: 
-    """**Generate an HTML <kbd> element.**
+li: Element
+"""**Generate an HTML <li> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `kbd('Hello, world!', id='kbd-id', cls='greeting-class')` will generate
-    an HTML element like `<kbd id="kbd-id" class="greeting-class">Hello, world!</kbd>`.
+For example, `li('Hello, world!', id='li-id', cls='greeting-class')` will generate
+an HTML element like `<li id="li-id" class="greeting-class">Hello, world!</li>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def dfn(*args, **kwargs) -> str: 
-    """**Generate an HTML <dfn> element.**
+    Markup: The generated HTML element. `li.node(...)` returns a lazy `Node`
+    instead and `li.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+rp: Element
+"""**Generate an HTML <rp> element.**
 
-    For example, `dfn('Hello, world!', id='dfn-id', cls='greeting-class')` will generate
-    an HTML element like `<dfn id="dfn-id" class="greeting-class">Hello, world!</dfn>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `rp('Hello, world!', id='rp-id', cls='greeting-class')` will generate
+an HTML element like `<rp id="rp-id" class="greeting-class">Hello, world!</rp>`.
 
-def div(*args, **kwargs) -> str: 
-    """**Generate an HTML <div> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `rp.node(...)` returns a lazy `Node`
+    instead and `rp.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `div('Hello, world!', id='div-id', cls='greeting-class')` will generate
-    an HTML element like `<div id="div-id" class="greeting-class">Hello, world!</div>`.
+rt: Element
+"""**Generate an HTML <rt> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def pre(*args, **kwargs) -> str: 
-    """**Generate an HTML <pre> element.**
+For example, `rt('Hello, world!', id='rt-id', cls='greeting-class')` will generate
+an HTML element like `<rt id="rt-id" class="greeting-class">Hello, world!</rt>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `pre('Hello, world!', id='pre-id', cls='greeting-class')` will generate
-    an HTML element like `<pre id="pre-id" class="greeting-class">Hello, world!<pre>`.
+    Markup: The generated HTML element. `rt.node(...)` returns a lazy `Node`
+    instead and `rt.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
-    
-def del_(*args, **kwargs) -> str: 
-    """**Generate an HTML <del_> element.**
+ol: Element
+"""**Generate an HTML <ol> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `del_('Hello, world!', id='del_-id', cls='greeting-class')` will generate
-    an HTML element like `<del_ id="del_-id" class="greeting-class">Hello, world!</del_>`.
+For example, `ol('Hello, world!', id='ol-id', cls='greeting-class')` will generate
+an HTML element like `<ol id="ol-id" class="greeting-class">Hello, world!</ol>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def map_(*args, **kwargs) -> str: 
-    """**Generate an HTML <map_> element.**
+    Markup: The generated HTML element. `ol.node(...)` returns a lazy `Node`
+    instead and `ol.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+ul: Element
+"""**Generate an HTML <ul> element.**
 
-    For example, `map_('Hello, world!', id='map_-id', cls='greeting-class')` will generate
-    an HTML element like `<map_ id="map_-id" class="greeting-class">Hello, world!</map_>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `ul('Hello, world!', id='ul-id', cls='greeting-class')` will generate
+an HTML element like `<ul id="ul-id" class="greeting-class">Hello, world!</ul>`.
 
-def ruby(*args, **kwargs) -> str: 
-    """**Generate an HTML <ruby> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `ul.node(...)` returns a lazy `Node`
+    instead and `ul.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `ruby('Hello, world!', id='ruby-id', cls='greeting-class')` will generate
-    an HTML element like `<ruby id="ruby-id" class="greeting-class">Hello, world!</ruby>`.
+td: Element
+"""**Generate an HTML <td> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def samp(*args, **kwargs) -> str: 
-    """**Generate an HTML <samp> element.**
+For example, `td('Hello, world!', id='td-id', cls='greeting-class')` will generate
+an HTML element like `<td id="td-id" class="greeting-class">Hello, world!</td>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `samp('Hello, world!', id='samp-id', cls='greeting-class')` will generate
-    an HTML element like `<samp id="samp-id" class="greeting-class">Hello, world!</samp>`.
+    Markup: The generated HTML element. `td.node(...)` returns a lazy `Node`
+    instead and `td.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+th: Element
+"""**Generate an HTML <th> element.**
 
-def slot(*args, **kwargs) -> str: 
-    """**Generate an HTML <slot> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `th('Hello, world!', id='th-id', cls='greeting-class')` will generate
+an HTML element like `<th id="th-id" class="greeting-class">Hello, world!</th>`.
 
-    For example, `slot('Hello, world!', id='slot-id', cls='greeting-class')` will generate
-    an HTML element like `<slot id="slot-id" class="greeting-class">Hello, world!</slot>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `th.node(...)` returns a lazy `Node`
+    instead and `th.map(...)` renders a list of rows inside it.
+"""
 
-def span(*args, **kwargs) -> str: 
-    """**Generate an HTML <span> element.**
+tr: Element
+"""**Generate an HTML <tr> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `span('Hello, world!', id='span-id', cls='greeting-class')` will generate
-    an HTML element like `<span id="span-id" class="greeting-class">Hello, world!</span>`.
+For example, `tr('Hello, world!', id='tr-id', cls='greeting-class')` will generate
+an HTML element like `<tr id="tr-id" class="greeting-class">Hello, world!</tr>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def html(*args, **kwargs) -> str: 
-    """**Generate an HTML <html> element.**
+    Markup: The generated HTML element. `tr.node(...)` returns a lazy `Node`
+    instead and `tr.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+var: Element
+"""**Generate an HTML <var> element.**
 
-    For example, `html('Hello, world!', id='html-id', cls='greeting-class')` will generate
-    an HTML element like `<html id="html-id" class="greeting-class">Hello, world!</html>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `var('Hello, world!', id='var-id', cls='greeting-class')` will generate
+an HTML element like `<var id="var-id" class="greeting-class">Hello, world!</var>`.
 
-def form(*args, **kwargs) -> str: 
-    """**Generate an HTML <form> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `var.node(...)` returns a lazy `Node`
+    instead and `var.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `form('Hello, world!', id='form-id', cls='greeting-class')` will generate
-    an HTML element like `<form id="form-id" class="greeting-class">Hello, world!</form>`.
+nav: Element
+"""**Generate an HTML <nav> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def head(*args, **kwargs) -> str: 
-    """**Generate an HTML <head> element.**
+For example, `nav('Hello, world!', id='nav-id', cls='greeting-class')` will generate
+an HTML element like `<nav id="nav-id" class="greeting-class">Hello, world!</nav>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `head('Hello, world!', id='head-id', cls='greeting-class')` will generate
-    an HTML element like `<head id="head-id" class="greeting-class">Hello, world!</head>`.
+    Markup: The generated HTML element. `nav.node(...)` returns a lazy `Node`
+    instead and `nav.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+sub: Element
+"""**Generate an HTML <sub> element.**
 
-def abbr(*args, **kwargs) -> str: 
-    """**Generate an HTML <abbr> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `sub('Hello, world!', id='sub-id', cls='greeting-class')` will generate
+an HTML element like `<sub id="sub-id" class="greeting-class">Hello, world!</sub>`.
 
-    For example, `abbr('Hello, world!', id='abbr-id', cls='greeting-class')` will generate
-    an HTML element like `<abbr id="abbr-id" class="greeting-class">Hello, world!</abbr>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `sub.node(...)` returns a lazy `Node`
+    instead and `sub.map(...)` renders a list of rows inside it.
+"""
 
-def main(*args, **kwargs) -> str: 
-    """**Generate an HTML <main> element.**
+sup: Element
+"""**Generate an HTML <sup> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `main('Hello, world!', id='main-id', cls='greeting-class')` will generate
-    an HTML element like `<main id="main-id" class="greeting-class">Hello, world!</main>`.
+For example, `sup('Hello, world!', id='sup-id', cls='greeting-class')` will generate
+an HTML element like `<sup id="sup-id" class="greeting-class">Hello, world!</sup>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def mark(*args, **kwargs) -> str: 
-    """**Generate an HTML <mark> element.**
+    Markup: The generated HTML element. `sup.node(...)` returns a lazy `Node`
+    instead and `sup.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+svg: Element
+"""**Generate an HTML <svg> element.**
 
-    For example, `mark('Hello, world!', id='mark-id', cls='greeting-class')` will generate
-    an HTML element like `<mark id="mark-id" class="greeting-class">Hello, world!</mark>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `svg('Hello, world!', id='svg-id', cls='greeting-class')` will generate
+an HTML element like `<svg id="svg-id" class="greeting-class">Hello, world!</svg>`.
 
-def math(*args, **kwargs) -> str: 
-    """**Generate an HTML <math> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `svg.node(...)` returns a lazy `Node`
+    instead and `svg.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `math('Hello, world!', id='math-id', cls='greeting-class')` will generate
-    an HTML element like `<math id="math-id" class="greeting-class">Hello, world!</math>`.
+ins: Element
+"""**Generate an HTML <ins> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def menu(*args, **kwargs) -> str: 
-    """**Generate an HTML <menu> element.**
+For example, `ins('Hello, world!', id='ins-id', cls='greeting-class')` will generate
+an HTML element like `<ins id="ins-id" class="greeting-class">Hello, world!</ins>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `menu('Hello, world!', id='menu-id', cls='greeting-class')` will generate
-    an HTML element like `<menu id="menu-id" class="greeting-class">Hello, world!</menu>`.
+    Markup: The generated HTML element. `ins.node(...)` returns a lazy `Node`
+    instead and `ins.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+kbd: Element
+"""**Generate an HTML <kbd> element.**
 
-def body(*args, **kwargs) -> str: 
-    """**Generate an HTML <body> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `kbd('Hello, world!', id='kbd-id', cls='greeting-class')` will generate
+an HTML element like `<kbd id="kbd-id" class="greeting-class">Hello, world!</kbd>`.
 
-    For example, `body('Hello, world!', id='body-id', cls='greeting-class')` will generate
-    an HTML element like `<body id="body-id" class="greeting-class">Hello, world!</body>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `kbd.node(...)` returns a lazy `Node`
+    instead and `kbd.map(...)` renders a list of rows inside it.
+"""
 
-def cite(*args, **kwargs) -> str: 
-    """**Generate an HTML <cite> element.**
+dfn: Element
+"""**Generate an HTML <dfn> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `cite('Hello, world!', id='cite-id', cls='greeting-class')` will generate
-    an HTML element like `<cite id="cite-id" class="greeting-class">Hello, world!</cite>`.
+For example, `dfn('Hello, world!', id='dfn-id', cls='greeting-class')` will generate
+an HTML element like `<dfn id="dfn-id" class="greeting-class">Hello, world!</dfn>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def code(*args, **kwargs) -> str: 
-    """**Generate an HTML <code> element.**
+    Markup: The generated HTML element. `dfn.node(...)` returns a lazy `Node`
+    instead and `dfn.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+div: Element
+"""**Generate an HTML <div> element.**
 
-    For example, `code('Hello, world!', id='code-id', cls='greeting-class')` will generate
-    an HTML element like `<code id="code-id" class="greeting-class">Hello, world!</code>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `div('Hello, world!', id='div-id', cls='greeting-class')` will generate
+an HTML element like `<div id="div-id" class="greeting-class">Hello, world!</div>`.
 
-def data(*args, **kwargs) -> str: 
-    """**Generate an HTML <data> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `div.node(...)` returns a lazy `Node`
+    instead and `div.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `data('Hello, world!', id='data-id', cls='greeting-class')` will generate
-    an HTML element like `<data id="data-id" class="greeting-class">Hello, world!</data>`.
+pre: Element
+"""**Generate an HTML <pre> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def time_(*args, **kwargs) -> str: 
-    """**Generate an HTML <time> element.**
+For example, `pre('Hello, world!', id='pre-id', cls='greeting-class')` will generate
+an HTML element like `<pre id="pre-id" class="greeting-class">Hello, world!</pre>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `time('Hello, world!', id='time-id', cls='greeting-class')` will generate
-    an HTML element like `<time id="time-id" class="greeting-class">Hello, world!</time>`.
+    Markup: The generated HTML element. `pre.node(...)` returns a lazy `Node`
+    instead and `pre.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+del_: Element
+"""**Generate an HTML <del> element.**
 
-def aside(*args, **kwargs) -> str: 
-    """**Generate an HTML <aside> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `del_('Hello, world!', id='del-id', cls='greeting-class')` will generate
+an HTML element like `<del id="del-id" class="greeting-class">Hello, world!</del>`.
 
-    For example, `aside('Hello, world!', id='aside-id', cls='greeting-class')` will generate
-    an HTML element like `<aside id="aside-id" class="greeting-class">Hello, world!</aside>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `del_.node(...)` returns a lazy `Node`
+    instead and `del_.map(...)` renders a list of rows inside it.
+"""
 
-def audio(*args, **kwargs) -> str: 
-    """**Generate an HTML <audio> element.**
+map_: Element
+"""**Generate an HTML <map> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `audio('Hello, world!', id='audio-id', cls='greeting-class')` will generate
-    an HTML element like `<audio id="audio-id" class="greeting-class">Hello, world!</audio>`.
+For example, `map_('Hello, world!', id='map-id', cls='greeting-class')` will generate
+an HTML element like `<map id="map-id" class="greeting-class">Hello, world!</map>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def style(*args, **kwargs) -> str: 
-    """**Generate an HTML <style> element.**
+    Markup: The generated HTML element. `map_.node(...)` returns a lazy `Node`
+    instead and `map_.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+ruby: Element
+"""**Generate an HTML <ruby> element.**
 
-    For example, `style('Hello, world!', id='style-id', cls='greeting-class')` will generate
-    an HTML element like `<style id="style-id" class="greeting-class">Hello, world!</style>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `ruby('Hello, world!', id='ruby-id', cls='greeting-class')` will generate
+an HTML element like `<ruby id="ruby-id" class="greeting-class">Hello, world!</ruby>`.
 
-def table(*args, **kwargs) -> str: 
-    """**Generate an HTML <table> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `ruby.node(...)` returns a lazy `Node`
+    instead and `ruby.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `table('Hello, world!', id='table-id', cls='greeting-class')` will generate
-    an HTML element like `<table id="table-id" class="greeting-class">Hello, world!</table>`.
+samp: Element
+"""**Generate an HTML <samp> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def tbody(*args, **kwargs) -> str: 
-    """**Generate an HTML <tbody> element.**
+For example, `samp('Hello, world!', id='samp-id', cls='greeting-class')` will generate
+an HTML element like `<samp id="samp-id" class="greeting-class">Hello, world!</samp>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `tbody('Hello, world!', id='tbody-id', cls='greeting-class')` will generate
-    an HTML element like `<tbody id="tbody-id" class="greeting-class">Hello, world!</tbody>`.
+    Markup: The generated HTML element. `samp.node(...)` returns a lazy `Node`
+    instead and `samp.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+slot: Element
+"""**Generate an HTML <slot> element.**
 
-def video(*args, **kwargs) -> str: 
-    """**Generate an HTML <video> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `slot('Hello, world!', id='slot-id', cls='greeting-class')` will generate
+an HTML element like `<slot id="slot-id" class="greeting-class">Hello, world!</slot>`.
 
-    For example, `video('Hello, world!', id='video-id', cls='greeting-class')` will generate
-    an HTML element like `<video id="video-id" class="greeting-class">Hello, world!</video>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `slot.node(...)` returns a lazy `Node`
+    instead and `slot.map(...)` renders a list of rows inside it.
+"""
 
-def small(*args, **kwargs) -> str: 
-    """**Generate an HTML <small> element.**
+span: Element
+"""**Generate an HTML <span> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `small('Hello, world!', id='small-id', cls='greeting-class')` will generate
-    an HTML element like `<small id="small-id" class="greeting-class">Hello, world!</small>`.
+For example, `span('Hello, world!', id='span-id', cls='greeting-class')` will generate
+an HTML element like `<span id="span-id" class="greeting-class">Hello, world!</span>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def label(*args, **kwargs) -> str: 
-    """**Generate an HTML <label> element.**
+    Markup: The generated HTML element. `span.node(...)` returns a lazy `Node`
+    instead and `span.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+html: Element
+"""**Generate an HTML <html> element.**
 
-    For example, `label('Hello, world!', id='label-id', cls='greeting-class')` will generate
-    an HTML element like `<label id="label-id" class="greeting-class">Hello, world!</label>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `html('Hello, world!', id='html-id', cls='greeting-class')` will generate
+an HTML element like `<html id="html-id" class="greeting-class">Hello, world!</html>`.
 
-def meter(*args, **kwargs) -> str: 
-    """**Generate an HTML <meter> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `html.node(...)` returns a lazy `Node`
+    instead and `html.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `meter('Hello, world!', id='meter-id', cls='greeting-class')` will generate
-    an HTML element like `<meter id="meter-id" class="greeting-class">Hello, world!</meter>`.
+form: Element
+"""**Generate an HTML <form> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def tfoot(*args, **kwargs) -> str: 
-    """**Generate an HTML <tfoot> element.**
+For example, `form('Hello, world!', id='form-id', cls='greeting-class')` will generate
+an HTML element like `<form id="form-id" class="greeting-class">Hello, world!</form>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `tfoot('Hello, world!', id='tfoot-id', cls='greeting-class')` will generate
-    an HTML element like `<tfoot id="tfoot-id" class="greeting-class">Hello, world!</tfoot>`.
+    Markup: The generated HTML element. `form.node(...)` returns a lazy `Node`
+    instead and `form.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+head: Element
+"""**Generate an HTML <head> element.**
 
-def thead(*args, **kwargs) -> str: 
-    """**Generate an HTML <thead> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `head('Hello, world!', id='head-id', cls='greeting-class')` will generate
+an HTML element like `<head id="head-id" class="greeting-class">Hello, world!</head>`.
 
-    For example, `thead('Hello, world!', id='thead-id', cls='greeting-class')` will generate
-    an HTML element like `<thead id="thead-id" class="greeting-class">Hello, world!</thead>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `head.node(...)` returns a lazy `Node`
+    instead and `head.map(...)` renders a list of rows inside it.
+"""
 
-def title(*args, **kwargs) -> str: 
-    """**Generate an HTML <title> element.**
+abbr: Element
+"""**Generate an HTML <abbr> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `title('Hello, world!', id='title-id', cls='greeting-class')` will generate
-    an HTML element like `<title id="title-id" class="greeting-class">Hello, world!</title>`.
+For example, `abbr('Hello, world!', id='abbr-id', cls='greeting-class')` will generate
+an HTML element like `<abbr id="abbr-id" class="greeting-class">Hello, world!</abbr>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def hgroup(*args, **kwargs) -> str: 
-    """**Generate an HTML <hgroup> element.**
+    Markup: The generated HTML element. `abbr.node(...)` returns a lazy `Node`
+    instead and `abbr.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+main: Element
+"""**Generate an HTML <main> element.**
 
-    For example, `hgroup('Hello, world!', id='hgroup-id', cls='greeting-class')` will generate
-    an HTML element like `<hgroup id="hgroup-id" class="greeting-class">Hello, world!</hgroup>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `main('Hello, world!', id='main-id', cls='greeting-class')` will generate
+an HTML element like `<main id="main-id" class="greeting-class">Hello, world!</main>`.
 
-def select(*args, **kwargs) -> str: 
-    """**Generate an HTML <select> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `main.node(...)` returns a lazy `Node`
+    instead and `main.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `select('Hello, world!', id='select-id', cls='greeting-class')` will generate
-    an HTML element like `<select id="select-id" class="greeting-class">Hello, world!</select>`.
+mark: Element
+"""**Generate an HTML <mark> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def strong(*args, **kwargs) -> str: 
-    """**Generate an HTML <strong> element.**
+For example, `mark('Hello, world!', id='mark-id', cls='greeting-class')` will generate
+an HTML element like `<mark id="mark-id" class="greeting-class">Hello, world!</mark>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `strong('Hello, world!', id='strong-id', cls='greeting-class')` will generate
-    an HTML element like `<strong id="strong-id" class="greeting-class">Hello, world!</strong>`.
+    Markup: The generated HTML element. `mark.node(...)` returns a lazy `Node`
+    instead and `mark.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+math: Element
+"""**Generate an HTML <math> element.**
 
-def legend(*args, **kwargs) -> str: 
-    """**Generate an HTML <legend> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `math('Hello, world!', id='math-id', cls='greeting-class')` will generate
+an HTML element like `<math id="math-id" class="greeting-class">Hello, world!</math>`.
 
-    For example, `legend('Hello, world!', id='legend-id', cls='greeting-class')` will generate
-    an HTML element like `<legend id="legend-id" class="greeting-class">Hello, world!</legend>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `math.node(...)` returns a lazy `Node`
+    instead and `math.map(...)` renders a list of rows inside it.
+"""
 
-def option(*args, **kwargs) -> str: 
-    """**Generate an HTML <option> element.**
+menu: Element
+"""**Generate an HTML <menu> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `option('Hello, world!', id='option-id', cls='greeting-class')` will generate
-    an HTML element like `<option id="option-id" class="greeting-class">Hello, world!</option>`.
+For example, `menu('Hello, world!', id='menu-id', cls='greeting-class')` will generate
+an HTML element like `<menu id="menu-id" class="greeting-class">Hello, world!</menu>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def output(*args, **kwargs) -> str: 
-    """**Generate an HTML <output> element.**
+    Markup: The generated HTML element. `menu.node(...)` returns a lazy `Node`
+    instead and `menu.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+body: Element
+"""**Generate an HTML <body> element.**
 
-    For example, `output('Hello, world!', id='output-id', cls='greeting-class')` will generate
-    an HTML element like `<output id="output-id" class="greeting-class">Hello, world!</output>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `body('Hello, world!', id='body-id', cls='greeting-class')` will generate
+an HTML element like `<body id="body-id" class="greeting-class">Hello, world!</body>`.
 
-def button(*args, **kwargs) -> str: 
-    """**Generate an HTML <button> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `body.node(...)` returns a lazy `Node`
+    instead and `body.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `button('Hello, world!', id='button-id', cls='greeting-class')` will generate
-    an HTML element like `<button id="button-id" class="greeting-class">Hello, world!</button>`.
+cite: Element
+"""**Generate an HTML <cite> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def canvas(*args, **kwargs) -> str: 
-    """**Generate an HTML <canvas> element.**
+For example, `cite('Hello, world!', id='cite-id', cls='greeting-class')` will generate
+an HTML element like `<cite id="cite-id" class="greeting-class">Hello, world!</cite>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `canvas('Hello, world!', id='canvas-id', cls='greeting-class')` will generate
-    an HTML element like `<canvas id="canvas-id" class="greeting-class">Hello, world!</canvas>`.
+    Markup: The generated HTML element. `cite.node(...)` returns a lazy `Node`
+    instead and `cite.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+code: Element
+"""**Generate an HTML <code> element.**
 
-def dialog(*args, **kwargs) -> str: 
-    """**Generate an HTML <dialog> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `code('Hello, world!', id='code-id', cls='greeting-class')` will generate
+an HTML element like `<code id="code-id" class="greeting-class">Hello, world!</code>`.
 
-    For example, `dialog('Hello, world!', id='dialog-id', cls='greeting-class')` will generate
-    an HTML element like `<dialog id="dialog-id" class="greeting-class">Hello, world!</dialog>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `code.node(...)` returns a lazy `Node`
+    instead and `code.map(...)` renders a list of rows inside it.
+"""
 
-def figure(*args, **kwargs) -> str: 
-    """**Generate an HTML <figure> element.**
+data: Element
+"""**Generate an HTML <data> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `figure('Hello, world!', id='figure-id', cls='greeting-class')` will generate
-    an HTML element like `<figure id="figure-id" class="greeting-class">Hello, world!</figure>`.
+For example, `data('Hello, world!', id='data-id', cls='greeting-class')` will generate
+an HTML element like `<data id="data-id" class="greeting-class">Hello, world!</data>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def footer(*args, **kwargs) -> str: 
-    """**Generate an HTML <footer> element.**
+    Markup: The generated HTML element. `data.node(...)` returns a lazy `Node`
+    instead and `data.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+time_: Element
+"""**Generate an HTML <time> element.**
 
-    For example, `footer('Hello, world!', id='footer-id', cls='greeting-class')` will generate
-    an HTML element like `<footer id="footer-id" class="greeting-class">Hello, world!</footer>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `time_('Hello, world!', id='time-id', cls='greeting-class')` will generate
+an HTML element like `<time id="time-id" class="greeting-class">Hello, world!</time>`.
 
-def header(*args, **kwargs) -> str: 
-    """**Generate an HTML <header> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `time_.node(...)` returns a lazy `Node`
+    instead and `time_.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `header('Hello, world!', id='header-id', cls='greeting-class')` will generate
-    an HTML element like `<header id="header-id" class="greeting-class">Hello, world!</header>`.
+aside: Element
+"""**Generate an HTML <aside> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def iframe(*args, **kwargs) -> str: 
-    """**Generate an HTML <iframe> element.**
+For example, `aside('Hello, world!', id='aside-id', cls='greeting-class')` will generate
+an HTML element like `<aside id="aside-id" class="greeting-class">Hello, world!</aside>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `iframe('Hello, world!', id='iframe-id', cls='greeting-class')` will generate
-    an HTML element like `<iframe id="iframe-id" class="greeting-class">Hello, world!</iframe>`.
+    Markup: The generated HTML element. `aside.node(...)` returns a lazy `Node`
+    instead and `aside.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+audio: Element
+"""**Generate an HTML <audio> element.**
 
-def object_(*args, **kwargs) -> str: 
-    """**Generate an HTML <object_> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `audio('Hello, world!', id='audio-id', cls='greeting-class')` will generate
+an HTML element like `<audio id="audio-id" class="greeting-class">Hello, world!</audio>`.
 
-    For example, `object_('Hello, world!', id='object_-id', cls='greeting-class')` will generate
-    an HTML element like `<object_ id="object_-id" class="greeting-class">Hello, world!</object_>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `audio.node(...)` returns a lazy `Node`
+    instead and `audio.map(...)` renders a list of rows inside it.
+"""
 
-def section(*args, **kwargs) -> str: 
-    """**Generate an HTML <section> element.**
+style: Element
+"""**Generate an HTML <style> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `section('Hello, world!', id='section-id', cls='greeting-class')` will generate
-    an HTML element like `<section id="section-id" class="greeting-class">Hello, world!</section>`.
+For example, `style('Hello, world!', id='style-id', cls='greeting-class')` will generate
+an HTML element like `<style id="style-id" class="greeting-class">Hello, world!</style>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def summary(*args, **kwargs) -> str: 
-    """**Generate an HTML <summary> element.**
+    Markup: The generated HTML element. `style.node(...)` returns a lazy `Node`
+    instead and `style.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+table: Element
+"""**Generate an HTML <table> element.**
 
-    For example, `summary('Hello, world!', id='summary-id', cls='greeting-class')` will generate
-    an HTML element like `<summary id="summary-id" class="greeting-class">Hello, world!</summary>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `table('Hello, world!', id='table-id', cls='greeting-class')` will generate
+an HTML element like `<table id="table-id" class="greeting-class">Hello, world!</table>`.
 
-def caption(*args, **kwargs) -> str: 
-    """**Generate an HTML <caption> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `table.node(...)` returns a lazy `Node`
+    instead and `table.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `caption('Hello, world!', id='caption-id', cls='greeting-class')` will generate
-    an HTML element like `<caption id="caption-id" class="greeting-class">Hello, world!</caption>`.
+tbody: Element
+"""**Generate an HTML <tbody> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def address(*args, **kwargs) -> str: 
-    """**Generate an HTML <address> element.**
+For example, `tbody('Hello, world!', id='tbody-id', cls='greeting-class')` will generate
+an HTML element like `<tbody id="tbody-id" class="greeting-class">Hello, world!</tbody>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `address('Hello, world!', id='address-id', cls='greeting-class')` will generate
-    an HTML element like `<address id="address-id" class="greeting-class">Hello, world!</address>`.
+    Markup: The generated HTML element. `tbody.node(...)` returns a lazy `Node`
+    instead and `tbody.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+video: Element
+"""**Generate an HTML <video> element.**
 
-def article(*args, **kwargs) -> str: 
-    """**Generate an HTML <article> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `video('Hello, world!', id='video-id', cls='greeting-class')` will generate
+an HTML element like `<video id="video-id" class="greeting-class">Hello, world!</video>`.
 
-    For example, `article('Hello, world!', id='article-id', cls='greeting-class')` will generate
-    an HTML element like `<article id="article-id" class="greeting-class">Hello, world!</article>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `video.node(...)` returns a lazy `Node`
+    instead and `video.map(...)` renders a list of rows inside it.
+"""
 
-def details(*args, **kwargs) -> str: 
-    """**Generate an HTML <details> element.**
+small: Element
+"""**Generate an HTML <small> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `details('Hello, world!', id='details-id', cls='greeting-class')` will generate
-    an HTML element like `<details id="details-id" class="greeting-class">Hello, world!</details>`.
+For example, `small('Hello, world!', id='small-id', cls='greeting-class')` will generate
+an HTML element like `<small id="small-id" class="greeting-class">Hello, world!</small>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def fieldset(*args, **kwargs) -> str: 
-    """**Generate an HTML <fieldset> element.**
+    Markup: The generated HTML element. `small.node(...)` returns a lazy `Node`
+    instead and `small.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+label: Element
+"""**Generate an HTML <label> element.**
 
-    For example, `fieldset('Hello, world!', id='fieldset-id', cls='greeting-class')` will generate
-    an HTML element like `<fieldset id="fieldset-id" class="greeting-class">Hello, world!</fieldset>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `label('Hello, world!', id='label-id', cls='greeting-class')` will generate
+an HTML element like `<label id="label-id" class="greeting-class">Hello, world!</label>`.
 
-def colgroup(*args, **kwargs) -> str: 
-    """**Generate an HTML <colgroup> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `label.node(...)` returns a lazy `Node`
+    instead and `label.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `colgroup('Hello, world!', id='colgroup-id', cls='greeting-class')` will generate
-    an HTML element like `<colgroup id="colgroup-id" class="greeting-class">Hello, world!</colgroup>`.
+meter: Element
+"""**Generate an HTML <meter> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def datalist(*args, **kwargs) -> str: 
-    """**Generate an HTML <datalist> element.**
+For example, `meter('Hello, world!', id='meter-id', cls='greeting-class')` will generate
+an HTML element like `<meter id="meter-id" class="greeting-class">Hello, world!</meter>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `datalist('Hello, world!', id='datalist-id', cls='greeting-class')` will generate
-    an HTML element like `<datalist id="datalist-id" class="greeting-class">Hello, world!</datalist>`.
+    Markup: The generated HTML element. `meter.node(...)` returns a lazy `Node`
+    instead and `meter.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+tfoot: Element
+"""**Generate an HTML <tfoot> element.**
 
-def template(*args, **kwargs) -> str: 
-    """**Generate an HTML <template> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `tfoot('Hello, world!', id='tfoot-id', cls='greeting-class')` will generate
+an HTML element like `<tfoot id="tfoot-id" class="greeting-class">Hello, world!</tfoot>`.
 
-    For example, `template('Hello, world!', id='template-id', cls='greeting-class')` will generate
-    an HTML element like `<template id="template-id" class="greeting-class">Hello, world!</template>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `tfoot.node(...)` returns a lazy `Node`
+    instead and `tfoot.map(...)` renders a list of rows inside it.
+"""
 
-def textarea(*args, **kwargs) -> str: 
-    """**Generate an HTML <textarea> element.**
+thead: Element
+"""**Generate an HTML <thead> element.**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    For example, `textarea('Hello, world!', id='textarea-id', cls='greeting-class')` will generate
-    an HTML element like `<textarea id="textarea-id" class="greeting-class">Hello, world!</textarea>`.
+For example, `thead('Hello, world!', id='thead-id', cls='greeting-class')` will generate
+an HTML element like `<thead id="thead-id" class="greeting-class">Hello, world!</thead>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def noscript(*args, **kwargs) -> str: 
-    """**Generate an HTML <noscript> element.**
+    Markup: The generated HTML element. `thead.node(...)` returns a lazy `Node`
+    instead and `thead.map(...)` renders a list of rows inside it.
+"""
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+title: Element
+"""**Generate an HTML <title> element.**
 
-    For example, `noscript('Hello, world!', id='noscript-id', cls='greeting-class')` will generate
-    an HTML element like `<noscript id="noscript-id" class="greeting-class">Hello, world!</noscript>`.
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `title('Hello, world!', id='title-id', cls='greeting-class')` will generate
+an HTML element like `<title id="title-id" class="greeting-class">Hello, world!</title>`.
 
-def optgroup(*args, **kwargs) -> str: 
-    """**Generate an HTML <optgroup> element.**
+**Returns:**
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `title.node(...)` returns a lazy `Node`
+    instead and `title.map(...)` renders a list of rows inside it.
+"""
 
-    For example, `optgroup('Hello, world!', id='optgroup-id', cls='greeting-class')` will generate
-    an HTML element like `<optgroup id="optgroup-id" class="greeting-class">Hello, world!</optgroup>`.
+hgroup: Element
+"""**Generate an HTML <hgroup> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-def figcaption(*args, **kwargs) -> str: 
-    """**Generate an HTML <figcaption> element.**
+For example, `hgroup('Hello, world!', id='hgroup-id', cls='greeting-class')` will generate
+an HTML element like `<hgroup id="hgroup-id" class="greeting-class">Hello, world!</hgroup>`.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `figcaption('Hello, world!', id='figcaption-id', cls='greeting-class')` will generate
-    an HTML element like `<figcaption id="figcaption-id" class="greeting-class">Hello, world!</figcaption>`.
+    Markup: The generated HTML element. `hgroup.node(...)` returns a lazy `Node`
+    instead and `hgroup.map(...)` renders a list of rows inside it.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+script: Element
+"""**Generate an HTML <script> element.**
 
-def blockquote(*args, **kwargs) -> str: 
-    """**Generate an HTML <blockquote> element.**
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
 
-    The arguments to this function will be used as the content and attributes of the
-    HTML element. Positional arguments will be converted to strings and used as the
-    content of the element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `script('Hello, world!', id='script-id', cls='greeting-class')` will generate
+an HTML element like `<script id="script-id" class="greeting-class">Hello, world!</script>`.
 
-    For example, `blockquote('Hello, world!', id='blockquote-id', cls='greeting-class')` will generate
-    an HTML element like `<blockquote id="blockquote-id" class="greeting-class">Hello, world!</blockquote>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `script.node(...)` returns a lazy `Node`
+    instead and `script.map(...)` renders a list of rows inside it.
+"""
+
+select: Element
+"""**Generate an HTML <select> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `select('Hello, world!', id='select-id', cls='greeting-class')` will generate
+an HTML element like `<select id="select-id" class="greeting-class">Hello, world!</select>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `select.node(...)` returns a lazy `Node`
+    instead and `select.map(...)` renders a list of rows inside it.
+"""
+
+strong: Element
+"""**Generate an HTML <strong> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `strong('Hello, world!', id='strong-id', cls='greeting-class')` will generate
+an HTML element like `<strong id="strong-id" class="greeting-class">Hello, world!</strong>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `strong.node(...)` returns a lazy `Node`
+    instead and `strong.map(...)` renders a list of rows inside it.
+"""
+
+legend: Element
+"""**Generate an HTML <legend> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `legend('Hello, world!', id='legend-id', cls='greeting-class')` will generate
+an HTML element like `<legend id="legend-id" class="greeting-class">Hello, world!</legend>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `legend.node(...)` returns a lazy `Node`
+    instead and `legend.map(...)` renders a list of rows inside it.
+"""
+
+option: Element
+"""**Generate an HTML <option> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `option('Hello, world!', id='option-id', cls='greeting-class')` will generate
+an HTML element like `<option id="option-id" class="greeting-class">Hello, world!</option>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `option.node(...)` returns a lazy `Node`
+    instead and `option.map(...)` renders a list of rows inside it.
+"""
+
+output: Element
+"""**Generate an HTML <output> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `output('Hello, world!', id='output-id', cls='greeting-class')` will generate
+an HTML element like `<output id="output-id" class="greeting-class">Hello, world!</output>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `output.node(...)` returns a lazy `Node`
+    instead and `output.map(...)` renders a list of rows inside it.
+"""
+
+button: Element
+"""**Generate an HTML <button> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `button('Hello, world!', id='button-id', cls='greeting-class')` will generate
+an HTML element like `<button id="button-id" class="greeting-class">Hello, world!</button>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `button.node(...)` returns a lazy `Node`
+    instead and `button.map(...)` renders a list of rows inside it.
+"""
+
+canvas: Element
+"""**Generate an HTML <canvas> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `canvas('Hello, world!', id='canvas-id', cls='greeting-class')` will generate
+an HTML element like `<canvas id="canvas-id" class="greeting-class">Hello, world!</canvas>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `canvas.node(...)` returns a lazy `Node`
+    instead and `canvas.map(...)` renders a list of rows inside it.
+"""
+
+dialog: Element
+"""**Generate an HTML <dialog> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `dialog('Hello, world!', id='dialog-id', cls='greeting-class')` will generate
+an HTML element like `<dialog id="dialog-id" class="greeting-class">Hello, world!</dialog>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `dialog.node(...)` returns a lazy `Node`
+    instead and `dialog.map(...)` renders a list of rows inside it.
+"""
+
+figure: Element
+"""**Generate an HTML <figure> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `figure('Hello, world!', id='figure-id', cls='greeting-class')` will generate
+an HTML element like `<figure id="figure-id" class="greeting-class">Hello, world!</figure>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `figure.node(...)` returns a lazy `Node`
+    instead and `figure.map(...)` renders a list of rows inside it.
+"""
+
+footer: Element
+"""**Generate an HTML <footer> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `footer('Hello, world!', id='footer-id', cls='greeting-class')` will generate
+an HTML element like `<footer id="footer-id" class="greeting-class">Hello, world!</footer>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `footer.node(...)` returns a lazy `Node`
+    instead and `footer.map(...)` renders a list of rows inside it.
+"""
+
+header: Element
+"""**Generate an HTML <header> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `header('Hello, world!', id='header-id', cls='greeting-class')` will generate
+an HTML element like `<header id="header-id" class="greeting-class">Hello, world!</header>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `header.node(...)` returns a lazy `Node`
+    instead and `header.map(...)` renders a list of rows inside it.
+"""
+
+iframe: Element
+"""**Generate an HTML <iframe> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `iframe('Hello, world!', id='iframe-id', cls='greeting-class')` will generate
+an HTML element like `<iframe id="iframe-id" class="greeting-class">Hello, world!</iframe>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `iframe.node(...)` returns a lazy `Node`
+    instead and `iframe.map(...)` renders a list of rows inside it.
+"""
+
+object_: Element
+"""**Generate an HTML <object> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `object_('Hello, world!', id='object-id', cls='greeting-class')` will generate
+an HTML element like `<object id="object-id" class="greeting-class">Hello, world!</object>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `object_.node(...)` returns a lazy `Node`
+    instead and `object_.map(...)` renders a list of rows inside it.
+"""
+
+section: Element
+"""**Generate an HTML <section> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `section('Hello, world!', id='section-id', cls='greeting-class')` will generate
+an HTML element like `<section id="section-id" class="greeting-class">Hello, world!</section>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `section.node(...)` returns a lazy `Node`
+    instead and `section.map(...)` renders a list of rows inside it.
+"""
+
+summary: Element
+"""**Generate an HTML <summary> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `summary('Hello, world!', id='summary-id', cls='greeting-class')` will generate
+an HTML element like `<summary id="summary-id" class="greeting-class">Hello, world!</summary>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `summary.node(...)` returns a lazy `Node`
+    instead and `summary.map(...)` renders a list of rows inside it.
+"""
+
+caption: Element
+"""**Generate an HTML <caption> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `caption('Hello, world!', id='caption-id', cls='greeting-class')` will generate
+an HTML element like `<caption id="caption-id" class="greeting-class">Hello, world!</caption>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `caption.node(...)` returns a lazy `Node`
+    instead and `caption.map(...)` renders a list of rows inside it.
+"""
+
+address: Element
+"""**Generate an HTML <address> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `address('Hello, world!', id='address-id', cls='greeting-class')` will generate
+an HTML element like `<address id="address-id" class="greeting-class">Hello, world!</address>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `address.node(...)` returns a lazy `Node`
+    instead and `address.map(...)` renders a list of rows inside it.
+"""
+
+article: Element
+"""**Generate an HTML <article> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `article('Hello, world!', id='article-id', cls='greeting-class')` will generate
+an HTML element like `<article id="article-id" class="greeting-class">Hello, world!</article>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `article.node(...)` returns a lazy `Node`
+    instead and `article.map(...)` renders a list of rows inside it.
+"""
+
+details: Element
+"""**Generate an HTML <details> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `details('Hello, world!', id='details-id', cls='greeting-class')` will generate
+an HTML element like `<details id="details-id" class="greeting-class">Hello, world!</details>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `details.node(...)` returns a lazy `Node`
+    instead and `details.map(...)` renders a list of rows inside it.
+"""
+
+fieldset: Element
+"""**Generate an HTML <fieldset> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `fieldset('Hello, world!', id='fieldset-id', cls='greeting-class')` will generate
+an HTML element like `<fieldset id="fieldset-id" class="greeting-class">Hello, world!</fieldset>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `fieldset.node(...)` returns a lazy `Node`
+    instead and `fieldset.map(...)` renders a list of rows inside it.
+"""
+
+colgroup: Element
+"""**Generate an HTML <colgroup> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `colgroup('Hello, world!', id='colgroup-id', cls='greeting-class')` will generate
+an HTML element like `<colgroup id="colgroup-id" class="greeting-class">Hello, world!</colgroup>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `colgroup.node(...)` returns a lazy `Node`
+    instead and `colgroup.map(...)` renders a list of rows inside it.
+"""
+
+datalist: Element
+"""**Generate an HTML <datalist> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `datalist('Hello, world!', id='datalist-id', cls='greeting-class')` will generate
+an HTML element like `<datalist id="datalist-id" class="greeting-class">Hello, world!</datalist>`.
+
+**Returns:**
 
+    Markup: The generated HTML element. `datalist.node(...)` returns a lazy `Node`
+    instead and `datalist.map(...)` renders a list of rows inside it.
+"""
+
+template: Element
+"""**Generate an HTML <template> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `template('Hello, world!', id='template-id', cls='greeting-class')` will generate
+an HTML element like `<template id="template-id" class="greeting-class">Hello, world!</template>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `template.node(...)` returns a lazy `Node`
+    instead and `template.map(...)` renders a list of rows inside it.
+"""
+
+textarea: Element
+"""**Generate an HTML <textarea> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `textarea('Hello, world!', id='textarea-id', cls='greeting-class')` will generate
+an HTML element like `<textarea id="textarea-id" class="greeting-class">Hello, world!</textarea>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `textarea.node(...)` returns a lazy `Node`
+    instead and `textarea.map(...)` renders a list of rows inside it.
+"""
+
+noscript: Element
+"""**Generate an HTML <noscript> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `noscript('Hello, world!', id='noscript-id', cls='greeting-class')` will generate
+an HTML element like `<noscript id="noscript-id" class="greeting-class">Hello, world!</noscript>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `noscript.node(...)` returns a lazy `Node`
+    instead and `noscript.map(...)` renders a list of rows inside it.
+"""
+
+optgroup: Element
+"""**Generate an HTML <optgroup> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `optgroup('Hello, world!', id='optgroup-id', cls='greeting-class')` will generate
+an HTML element like `<optgroup id="optgroup-id" class="greeting-class">Hello, world!</optgroup>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `optgroup.node(...)` returns a lazy `Node`
+    instead and `optgroup.map(...)` renders a list of rows inside it.
+"""
+
+figcaption: Element
+"""**Generate an HTML <figcaption> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `figcaption('Hello, world!', id='figcaption-id', cls='greeting-class')` will generate
+an HTML element like `<figcaption id="figcaption-id" class="greeting-class">Hello, world!</figcaption>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `figcaption.node(...)` returns a lazy `Node`
+    instead and `figcaption.map(...)` renders a list of rows inside it.
+"""
+
+blockquote: Element
+"""**Generate an HTML <blockquote> element.**
+
+Positional arguments are used as the content of the element and keyword arguments
+as its attributes. Text and attribute values are escaped unless they are `Markup`;
+nested tags and `Node`s are inserted as they are.
+
+For example, `blockquote('Hello, world!', id='blockquote-id', cls='greeting-class')` will generate
+an HTML element like `<blockquote id="blockquote-id" class="greeting-class">Hello, world!</blockquote>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `blockquote.node(...)` returns a lazy `Node`
+    instead and `blockquote.map(...)` renders a list of rows inside it.
+"""
 
 
 #############
 # Void Tags #
 #############
 
-def hr(*args, **kwargs) -> str: 
-    """**Generate an HTML <hr/> element.**
+hr: Element
+"""**Generate an HTML <hr/> element.**
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-    For example, `hr( id='hr-id', cls='specific-class')` will generate
-    an HTML element like `<hr id="hr-id" class="specific-class"/>`.
+For example, `hr(id='hr-id', cls='specific-class')` will generate
+an HTML element like `<hr id="hr-id" class="specific-class"/>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def br(*args, **kwargs) -> str: 
-    """**Generate an HTML <br/> element.**
+    Markup: The generated HTML element. `hr.node(...)` returns a lazy `Node` instead.
+"""
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+br: Element
+"""**Generate an HTML <br/> element.**
 
-    For example, `br( id='br-id', cls='specific-class')` will generate
-    an HTML element like `<br id="br-id" class="specific-class"/>`.
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `br(id='br-id', cls='specific-class')` will generate
+an HTML element like `<br id="br-id" class="specific-class"/>`.
 
-def img(*args, **kwargs) -> str: 
-    """**Generate an HTML <img/> element.**
+**Returns:**
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `br.node(...)` returns a lazy `Node` instead.
+"""
 
-    For example, `img( id='img-id', cls='specific-class')` will generate
-    an HTML element like `<img id="img-id" class="specific-class"/>`.
+img: Element
+"""**Generate an HTML <img/> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-def col(*args, **kwargs) -> str: 
-    """**Generate an HTML <col/> element.**
+For example, `img(id='img-id', cls='specific-class')` will generate
+an HTML element like `<img id="img-id" class="specific-class"/>`.
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `col( id='col-id', cls='specific-class')` will generate
-    an HTML element like `<col id="col-id" class="specific-class"/>`.
+    Markup: The generated HTML element. `img.node(...)` returns a lazy `Node` instead.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+col: Element
+"""**Generate an HTML <col/> element.**
 
-def wbr(*args, **kwargs) -> str: 
-    """**Generate an HTML <wbr/> element.**
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `col(id='col-id', cls='specific-class')` will generate
+an HTML element like `<col id="col-id" class="specific-class"/>`.
 
-    For example, `wbr( id='wbr-id', cls='specific-class')` will generate
-    an HTML element like `<wbr id="wbr-id" class="specific-class"/>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `col.node(...)` returns a lazy `Node` instead.
+"""
 
-def area(*args, **kwargs) -> str: 
-    """**Generate an HTML <area/> element.**
+wbr: Element
+"""**Generate an HTML <wbr/> element.**
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-    For example, `area( id='area-id', cls='specific-class')` will generate
-    an HTML element like `<area id="area-id" class="specific-class"/>`.
+For example, `wbr(id='wbr-id', cls='specific-class')` will generate
+an HTML element like `<wbr id="wbr-id" class="specific-class"/>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def base(*args, **kwargs) -> str: 
-    """**Generate an HTML <base/> element.**
+    Markup: The generated HTML element. `wbr.node(...)` returns a lazy `Node` instead.
+"""
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+area: Element
+"""**Generate an HTML <area/> element.**
 
-    For example, `base( id='base-id', cls='specific-class')` will generate
-    an HTML element like `<base id="base-id" class="specific-class"/>`.
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `area(id='area-id', cls='specific-class')` will generate
+an HTML element like `<area id="area-id" class="specific-class"/>`.
 
-def link(*args, **kwargs) -> str: 
-    """**Generate an HTML <link/> element.**
+**Returns:**
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `area.node(...)` returns a lazy `Node` instead.
+"""
 
-    For example, `link( id='link-id', cls='specific-class')` will generate
-    an HTML element like `<link id="link-id" class="specific-class"/>`.
+base: Element
+"""**Generate an HTML <base/> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-def meta(*args, **kwargs) -> str: 
-    """**Generate an HTML <meta/> element.**
+For example, `base(id='base-id', cls='specific-class')` will generate
+an HTML element like `<base id="base-id" class="specific-class"/>`.
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `meta( id='meta-id', cls='specific-class')` will generate
-    an HTML element like `<meta id="meta-id" class="specific-class"/>`.
+    Markup: The generated HTML element. `base.node(...)` returns a lazy `Node` instead.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+link: Element
+"""**Generate an HTML <link/> element.**
 
-def track(*args, **kwargs) -> str: 
-    """**Generate an HTML <track/> element.**
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `link(id='link-id', cls='specific-class')` will generate
+an HTML element like `<link id="link-id" class="specific-class"/>`.
 
-    For example, `track( id='track-id', cls='specific-class')` will generate
-    an HTML element like `<track id="track-id" class="specific-class"/>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `link.node(...)` returns a lazy `Node` instead.
+"""
 
-def embed(*args, **kwargs) -> str: 
-    """**Generate an HTML <embed/> element.**
+meta: Element
+"""**Generate an HTML <meta/> element.**
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-    For example, `embed( id='embed-id', cls='specific-class')` will generate
-    an HTML element like `<embed id="embed-id" class="specific-class"/>`.
+For example, `meta(id='meta-id', cls='specific-class')` will generate
+an HTML element like `<meta id="meta-id" class="specific-class"/>`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+**Returns:**
 
-def input_(*args, **kwargs) -> str: 
-    """**Generate an HTML <input_/> element.**
+    Markup: The generated HTML element. `meta.node(...)` returns a lazy `Node` instead.
+"""
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+track: Element
+"""**Generate an HTML <track/> element.**
 
-    For example, `input_( id='input_-id', cls='specific-class')` will generate
-    an HTML element like `<input_ id="input_-id" class="specific-class"/>`.
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+For example, `track(id='track-id', cls='specific-class')` will generate
+an HTML element like `<track id="track-id" class="specific-class"/>`.
 
-def source(*args, **kwargs) -> str: 
-    """**Generate an HTML <source/> element.**
+**Returns:**
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+    Markup: The generated HTML element. `track.node(...)` returns a lazy `Node` instead.
+"""
 
-    For example, `source( id='source-id', cls='specific-class')` will generate
-    an HTML element like `<source id="source-id" class="specific-class"/>`.
+embed: Element
+"""**Generate an HTML <embed/> element.**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-def script(*args, **kwargs) -> str: 
-    """**Generate an HTML <script/> element.**
+For example, `embed(id='embed-id', cls='specific-class')` will generate
+an HTML element like `<embed id="embed-id" class="specific-class"/>`.
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+**Returns:**
 
-    For example, `script( id='script-id', cls='specific-class')` will generate
-    an HTML element like `<script id="script-id" class="specific-class"/>`.
+    Markup: The generated HTML element. `embed.node(...)` returns a lazy `Node` instead.
+"""
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+input_: Element
+"""**Generate an HTML <input/> element.**
 
-def menuitem(*args, **kwargs) -> str: 
-    """**Generate an HTML <menuitem/> element.**
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
 
-    The arguments to this function will be used as the attributes of the
-    HTML element. Keyword arguments will be used as the attributes of the
-    element.
+For example, `input_(id='input-id', cls='specific-class')` will generate
+an HTML element like `<input id="input-id" class="specific-class"/>`.
 
-    For example, `menuitem( id='menuitem-id', cls='specific-class')` will generate
-    an HTML element like `<menuitem id="menuitem-id" class="specific-class"/>`.
+**Returns:**
 
-    **Returns:**
-    
-        str: The generated HTML element.
-    """
-    ...
-    
+    Markup: The generated HTML element. `input_.node(...)` returns a lazy `Node` instead.
+"""
+
+source: Element
+"""**Generate an HTML <source/> element.**
+
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
+
+For example, `source(id='source-id', cls='specific-class')` will generate
+an HTML element like `<source id="source-id" class="specific-class"/>`.
+
+**Returns:**
+
+    Markup: The generated HTML element. `source.node(...)` returns a lazy `Node` instead.
+"""
+
+menuitem: Element
+"""**Generate an HTML <menuitem/> element.**
+
+Keyword arguments are used as the attributes of the element. Attribute values are
+escaped unless they are `Markup`.
+
+For example, `menuitem(id='menuitem-id', cls='specific-class')` will generate
+an HTML element like `<menuitem id="menuitem-id" class="specific-class"/>`.
+
+**Returns:**
 
+    Markup: The generated HTML element. `menuitem.node(...)` returns a lazy `Node` instead.
+"""
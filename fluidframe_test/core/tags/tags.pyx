@@ -2,6 +2,8 @@ from functools import lru_cache
 from libc.string cimport memcpy
 from cpython.mem cimport PyMem_Malloc, PyMem_Free
 from cpython.string cimport PyString_InternFromString
+from cpython.contextvars cimport get_value
+from contextvars import ContextVar
 
 
 __all__ = [
@@ -13,59 +15,563 @@ __all__ = [
 ]
 
 
+# Context variables rather than globals, so a request or a library changing a mode
+# never affects renders running concurrently in other tasks or threads.
+cdef object NODE_MODE = ContextVar("fluidframe_node_mode", default=False)
+cdef object AUTOESCAPE = ContextVar("fluidframe_autoescape", default=True)
+
+
+def set_node_mode(bint enabled):
+    """Make tag calls in the current context return a lazy `Node` instead of a `str`.
+
+    Returns a token for `reset_node_mode`.
+    """
+    return NODE_MODE.set(enabled)
+
+
+def reset_node_mode(token):
+    NODE_MODE.reset(token)
+
+
+def get_node_mode():
+    return <bint>get_value(NODE_MODE)
+
+
+def set_autoescape(bint enabled):
+    """Escape attribute values and text content passed to tags in the current context (on by default).
+
+    Returns a token for `reset_autoescape`.
+    """
+    return AUTOESCAPE.set(enabled)
+
+
+def reset_autoescape(token):
+    AUTOESCAPE.reset(token)
+
+
+def get_autoescape():
+    return <bint>get_value(AUTOESCAPE)
+
+
+class Markup(str):
+    """A string of HTML that tags insert as is instead of escaping it.
+
+    Every tag returns `Markup`, so rendered fragments nest without being escaped twice.
+    """
+    __slots__ = ()
+
+    def __html__(self):
+        return self
+
+    def __add__(self, other):
+        if isinstance(other, str):
+            return Markup(str.__add__(self, escape(other)))
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, str):
+            return Markup(str.__add__(escape(other), self))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Markup({str.__repr__(self)})"
+
+
+cdef inline bint needs_escape(str text):
+    cdef Py_UCS4 ch
+    for ch in text:
+        if ch == u'<' or ch == u'>' or ch == u'&' or ch == u'"' or ch == u"'":
+            return True
+    return False
+
+
+cdef inline str escape_str(str text):
+    if not needs_escape(text):
+        return text
+    return (text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+                .replace('"', '&quot;').replace("'", '&#x27;'))
+
+
+cpdef escape(object value):
+    """Escape `<>&"'` for use in HTML text or attribute values.
+
+    Strings without any of those characters are returned unchanged (the same object),
+    `Markup` is returned as is and objects with `__html__` are trusted.
+    """
+    if type(value) is str:
+        return escape_str(<str>value)
+    if isinstance(value, Markup):
+        return value
+    if hasattr(value, '__html__'):
+        return value.__html__()
+    return escape_str(str(value))
+
+
+cdef inline object text_of(object item, bint escape_text):
+    if type(item) is str:
+        return escape_str(<str>item) if escape_text else item
+    if type(item) is int or type(item) is float:
+        # Numbers never contain characters that need escaping.
+        return str(item)
+    if isinstance(item, Markup):
+        return item
+    if isinstance(item, Node):
+        return (<Node>item).render()
+    if escape_text:
+        return escape(item)
+    return str(item)
+
+
+cdef class Node:
+    """A lazily serialized element: a pre-rendered start tag, its children and an end tag.
+
+    Children may be strings or other nodes; the whole tree is serialized exactly once,
+    iteratively, so deeply nested pages render in linear time and without recursion.
+    """
+    cdef readonly str start
+    cdef readonly list children
+    cdef readonly str end
+
+    def __init__(self, str start='', list children=None, str end=''):
+        self.start = start
+        self.children = children if children is not None else []
+        self.end = end
+
+    def __iter__(self):
+        cdef Node node
+        cdef object item
+        cdef list stack = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, Node):
+                node = <Node>item
+                if node.start:
+                    yield node.start
+                if node.end:
+                    stack.append(node.end)
+                stack.extend(reversed(node.children))
+            else:
+                yield item if type(item) is str else str(item)
+
+    def render(self):
+        cdef Node node
+        cdef object item
+        cdef list buffer = []
+        cdef list stack = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, Node):
+                node = <Node>item
+                buffer.append(node.start)
+                if node.end:
+                    stack.append(node.end)
+                stack.extend(reversed(node.children))
+            else:
+                buffer.append(item if type(item) is str else str(item))
+        return ''.join(buffer)
+
+    def write_to(self, buffer, indent=None):
+        """Write the HTML chunk by chunk to `buffer`, pretty-printed on the fly when `indent` is set."""
+        cdef Prettifier prettifier
+        write = buffer.write
+        if indent is None:
+            for chunk in self:
+                write(chunk)
+            return
+        prettifier = Prettifier(indent)
+        for chunk in self:
+            write(prettifier.feed(chunk))
+        write(prettifier.close())
+
+    def pretty(self, int indent=2):
+        cdef Prettifier prettifier = Prettifier(indent)
+        cdef list buffer = [prettifier.feed(chunk) for chunk in self]
+        buffer.append(prettifier.close())
+        return ''.join(buffer)
+
+    def __html__(self):
+        return Markup(self.render())
+
+    def __str__(self):
+        return self.render()
+
+
+cdef frozenset VOID_TAGS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr', 'menuitem',
+))
+# Content of these is never tokenized; <pre> and <textarea> also keep their whitespace.
+cdef frozenset RAW_TAGS = frozenset(('script', 'style', 'pre', 'textarea'))
+cdef frozenset PREFORMATTED_TAGS = frozenset(('pre', 'textarea'))
+
+
+cdef Py_ssize_t find_tag_end(str html, Py_ssize_t pos):
+    # `>` inside quoted attribute values does not end the tag.
+    cdef Py_UCS4 ch, quote = 0
+    cdef Py_ssize_t index, length = len(html)
+    for index in range(pos, length):
+        ch = html[index]
+        if quote:
+            if ch == quote:
+                quote = 0
+        elif ch == u'"' or ch == u"'":
+            quote = ch
+        elif ch == u'>':
+            return index
+    return -1
+
+
+cdef class Prettifier:
+    """Single-pass, streaming HTML indenter.
+
+    Every tag, comment and text run goes on its own line, indented by nesting depth,
+    with the content of `<pre>`/`<textarea>` kept verbatim. Input may arrive in
+    arbitrary chunks: `feed` returns whatever output is complete so far and `close`
+    flushes the rest.
+
+    Tag names are lowercased and elements are nested the way `html.parser` trees
+    nest them: an end tag also closes the elements still open inside it, a stray end
+    tag is dropped and elements left open are closed at the end.
+    """
+    cdef str pending
+    cdef list lines
+    cdef list prefixes
+    cdef list open_tags
+    cdef str indent
+    cdef Py_ssize_t depth
+    cdef object raw_tag
+    cdef object raw_open
+
+    def __init__(self, int indent=2):
+        self.pending = ''
+        self.lines = []
+        self.prefixes = ['']
+        self.open_tags = []
+        self.indent = ' ' * indent
+        self.depth = 0
+        self.raw_tag = None
+        self.raw_open = None
+
+    cdef void emit(self, str line):
+        while len(self.prefixes) <= self.depth:
+            self.prefixes.append(self.prefixes[-1] + self.indent)
+        self.lines.append(<str>self.prefixes[self.depth] + line)
+
+    cdef void emit_text(self, str text):
+        cdef str line
+        for line in text.split('\n'):
+            line = line.strip()
+            if line:
+                self.emit(line)
+
+    cdef void start_tag(self, str tag):
+        cdef str inner = tag[1:-1].strip()
+        cdef bint self_closing = inner.endswith('/')
+        cdef list parts
+        cdef str name = ''
+        if self_closing:
+            inner = inner[:-1].rstrip()
+        parts = inner.split(None, 1)
+        if parts:
+            # Only the name is normalized, attribute text is kept exactly as written.
+            name = (<str>parts[0]).lower()
+            inner = name + inner[len(<str>parts[0]):]
+        if self_closing or name in VOID_TAGS:
+            # Right after an unquoted value, `/` would become part of the value.
+            self.emit(f"<{inner}/>" if inner == name or inner.endswith(('"', "'")) else f"<{inner} />")
+            return
+        if name in PREFORMATTED_TAGS:
+            self.raw_tag, self.raw_open = name, f"<{inner}>"
+            return
+        self.emit(f"<{inner}>")
+        self.depth += 1
+        if name in RAW_TAGS:
+            self.raw_tag = name
+        else:
+            self.open_tags.append(name)
+
+    cdef void end_tag(self, str tag):
+        cdef list parts = tag[2:-1].split(None, 1)
+        cdef str name = (<str>parts[0]).lower() if parts else ''
+        cdef str open_name = ''
+        if name not in self.open_tags:
+            return
+        while open_name != name:
+            open_name = self.open_tags.pop()
+            self.depth -= 1
+            self.emit(f"</{open_name}>")
+
+    cdef Py_ssize_t raw_content(self, str html, Py_ssize_t pos, bint final):
+        cdef str name = <str>self.raw_tag
+        cdef Py_ssize_t end = html.find('</' + name, pos)
+        cdef Py_ssize_t upper = html.find('</' + name.upper(), pos)
+        cdef Py_ssize_t close
+        cdef str content, closing
+        if upper >= 0 and (end < 0 or upper < end):
+            end = upper
+        close = find_tag_end(html, end) if end >= 0 else -1
+        if close < 0:
+            if not final:
+                return -1
+            end = close = len(html)
+        closing = f"</{name}>"
+        content = html[pos:end]
+        if self.raw_open is not None:
+            self.emit(<str>self.raw_open + content + closing)
+        else:
+            self.emit_text(content)
+            self.depth -= 1
+            self.emit(closing)
+        self.raw_tag = self.raw_open = None
+        return close + 1
+
+    cdef void process(self, bint final):
+        cdef str html = self.pending
+        cdef Py_ssize_t length = len(html), pos = 0, text_start = 0, lt, gt
+        cdef Py_UCS4 following
+        while pos < length:
+            if self.raw_tag is not None:
+                gt = self.raw_content(html, pos, final)
+                if gt < 0:
+                    break
+                pos = text_start = gt
+                continue
+            lt = html.find('<', pos)
+            if lt < 0 or lt + 1 >= length:
+                if final:
+                    self.emit_text(html[text_start:])
+                    pos = text_start = length
+                break
+            following = html[lt + 1]
+            if not (following.isalpha() or following == u'/' or following == u'!' or following == u'?'):
+                # A stray `<` is just text.
+                pos = lt + 1
+                continue
+            if html.startswith('<!--', lt):
+                gt = html.find('-->', lt + 4)
+                if gt >= 0:
+                    gt += 2
+            else:
+                gt = find_tag_end(html, lt)
+            if gt < 0:
+                if final:
+                    self.emit_text(html[text_start:])
+                    pos = text_start = length
+                break
+            self.emit_text(html[text_start:lt])
+            if following == u'/':
+                self.end_tag(html[lt:gt + 1])
+            elif following == u'!' or following == u'?':
+                self.emit(html[lt:gt + 1])
+            else:
+                self.start_tag(html[lt:gt + 1])
+            pos = text_start = gt + 1
+        self.pending = html[text_start:]
+
+    cdef str flush(self):
+        cdef str output
+        if not self.lines:
+            return ''
+        output = '\n'.join(self.lines) + '\n'
+        self.lines = []
+        return output
+
+    def feed(self, chunk):
+        # `Markup` and other `str` subclasses are accepted as well.
+        self.pending += chunk if type(chunk) is str else str(chunk)
+        self.process(False)
+        return self.flush()
+
+    def close(self):
+        self.process(True)
+        while self.open_tags:
+            self.depth -= 1
+            self.emit(f"</{self.open_tags.pop()}>")
+        return self.flush()
+
+
+def prettify(html, int indent=2):
+    """Indent `html` with one tag or text run per line; see `Prettifier`.
+
+    The nesting matches what BeautifulSoup's `html.parser` tree gives, but nothing
+    is re-serialized: attributes and entities stay as written (`<input disabled>`
+    is not turned into `disabled=""`) and `<pre>`/`<textarea>` content is copied
+    byte for byte, including any tags inside it.
+    """
+    cdef Prettifier prettifier = Prettifier(indent)
+    return prettifier.feed(html) + prettifier.close()
+
+
+def fragment(*children):
+    """Group children into a tag-less `Node`, e.g. a doctype followed by `<html>`."""
+    cdef list items = []
+    cdef bint escape_text = get_value(AUTOESCAPE)
+    for child in children:
+        append_content(items, child, True, escape_text)
+    return Node('', items, '')
+
+
 cdef class Element:
-    cdef str tag
-    cdef bint closing_tag
+    cdef readonly str tag
+    cdef readonly bint closing_tag
+    cdef readonly bint raw_text
     cdef public str end_tag
     cdef public str starting_tag
+    cdef dict attribute_names
 
     def __init__(self, str tag, bint closing_tag=True):
         self.tag = tag
         self.closing_tag = closing_tag
+        # The content of <script> and <style> is raw text that browsers never unescape.
+        self.raw_text = tag in ('script', 'style')
         self.end_tag = f"</{tag}>"
         self.starting_tag = f"<{tag} "
+        self.attribute_names = {}
 
-    def __call__(self, *args, **kwargs):
-        cdef list attributes = []
-        cdef list content_items = []
-        cdef object arg
-        cdef str key, value
+    cdef str attribute_prefix(self, str key):
+        # Normalized `name="` prefixes are computed once per keyword and reused.
+        cdef object prefix = self.attribute_names.get(key)
+        if prefix is None:
+            prefix = ('class' if key == 'cls' else key.replace('_', '-')) + '="'
+            self.attribute_names[key] = prefix
+        return <str>prefix
+
+    cdef void append_attribute(self, list buffer, object key, object value, bint autoescape):
+        # Boolean attributes: `True` writes the bare name, `False` and `None` leave it out.
+        if value is True:
+            buffer.append((<str>self.attribute_prefix(key))[:-2])
+            buffer.append(' ')
+        elif value is not False and value is not None:
+            buffer.append(self.attribute_prefix(key))
+            buffer.append(text_of(value, autoescape))
+            buffer.append('" ')
+
+    cdef str start_tag(self, dict attributes, bint autoescape):
+        cdef list buffer = [self.starting_tag]
+        cdef object key, value
+        if attributes:
+            for key, value in attributes.items():
+                self.append_attribute(buffer, key, value, autoescape)
+        buffer.append('>')
+        return ''.join(buffer)
+
+    cdef object build(self, tuple args, dict kwargs, bint as_node):
+        cdef list buffer = [self.starting_tag]
+        cdef list children
+        cdef str html
+        cdef bint autoescape = get_value(AUTOESCAPE)
+        cdef bint escape_text = autoescape and not self.raw_text
+        cdef object key, value, content = None, i = None
+
+        for key, value in kwargs.items():
+            if key == 'i':
+                i = value
+            elif key == 'content':
+                content = value
+            else:
+                self.append_attribute(buffer, key, value, autoescape)
+
+        if not self.closing_tag:
+            buffer.append(' />')
+            html = ''.join(buffer)
+            return Node(html) if as_node else (Markup(html) if autoescape else html)
 
-        i = kwargs.pop('i', None)
-        content = kwargs.pop('content', None)
+        buffer.append('>')
         content = i or content
+        if as_node:
+            children = []
+            if content is not None:
+                append_content(children, content, True, escape_text)
+            for value in args:
+                append_content(children, value, True, escape_text)
+            return Node(''.join(buffer), children, self.end_tag)
+
         if content is not None:
-            if isinstance(content, list):
-                content_items.extend([str(c) for c in content])
-            else:
-                content_items.append(str(content))
+            append_content(buffer, content, False, escape_text)
+        for value in args:
+            append_content(buffer, value, False, escape_text)
+        buffer.append(self.end_tag)
+        html = ''.join(buffer)
+        return Markup(html) if autoescape else html
 
-        for arg in args:
-            if isinstance(arg, list):
-                content_items.extend([str(ar) for ar in arg])  
-            else: 
-                content_items.append(str(arg))
+    def __call__(self, *args, **kwargs):
+        return self.build(args, kwargs, get_value(NODE_MODE))
 
-        for key, value in kwargs.items():
-            key = 'class' if key == 'cls' else key
-            attributes.extend([key.replace('_', '-'), '="', value, '" '])
+    def node(self, *args, **kwargs):
+        """Like calling the element, but always returns a lazy `Node`."""
+        return self.build(args, kwargs, True)
+
+    def map(self, items, row, cell=None, dict row_attrs=None, dict cell_attrs=None, **kwargs):
+        """Render every item as a `row` element inside this element in a single loop.
 
-        attr_str = ''.join(attributes)
-        content_str = ''.join(content_items)
+        With a `cell` element each item is itself iterated and every value becomes a cell,
+        e.g. `tbody.map(rows, tr, td)`. `row` may also be any callable returning HTML,
+        which is then called once per item.
+        """
+        cdef list buffer
+        cdef Element row_element, cell_element
+        cdef str html, row_start, row_end, cell_start, cell_end
+        cdef bint escape_row, escape_cell
+        cdef bint autoescape = get_value(AUTOESCAPE)
+        cdef object item, value
 
         if not self.closing_tag:
-            return ''.join([self.starting_tag, attr_str, ' />'])
+            raise ValueError(f"<{self.tag}> is a void element and cannot contain rows")
+        buffer = [self.start_tag(kwargs, autoescape)]
+        if isinstance(row, Element):
+            row_element = <Element>row
+            if not row_element.closing_tag:
+                raise ValueError(f"<{row_element.tag}> is a void element and cannot be used as a row")
+            row_start, row_end = row_element.start_tag(row_attrs, autoescape), row_element.end_tag
+            if cell is None:
+                escape_row = autoescape and not row_element.raw_text
+                for item in items:
+                    buffer.append(row_start)
+                    buffer.append(text_of(item, escape_row))
+                    buffer.append(row_end)
+            else:
+                cell_element = <Element?>cell
+                cell_start, cell_end = cell_element.start_tag(cell_attrs, autoescape), cell_element.end_tag
+                escape_cell = autoescape and not cell_element.raw_text
+                for item in items:
+                    buffer.append(row_start)
+                    for value in item:
+                        buffer.append(cell_start)
+                        buffer.append(text_of(value, escape_cell))
+                        buffer.append(cell_end)
+                    buffer.append(row_end)
+        else:
+            escape_row = autoescape and not self.raw_text
+            for item in items:
+                buffer.append(text_of(row(item), escape_row))
 
-        return ''.join([self.starting_tag, attr_str, ">", content_str, self.end_tag])
+        if get_value(NODE_MODE):
+            return Node(buffer[0], buffer[1:], self.end_tag)
+        buffer.append(self.end_tag)
+        html = ''.join(buffer)
+        return Markup(html) if autoescape else html
 
     def __str__(self):
-        return self()
+        return self.build((), {}, False)
+
+
+cdef inline void append_content(list buffer, object content, bint keep_nodes, bint escape_text):
+    cdef object item
+    if type(content) is str:
+        buffer.append(escape_str(<str>content) if escape_text else content)
+    elif isinstance(content, list):
+        for item in <list>content:
+            if keep_nodes and isinstance(item, Node):
+                buffer.append(item)
+            else:
+                buffer.append(text_of(item, escape_text))
+    elif keep_nodes and isinstance(content, Node):
+        buffer.append(content)
+    else:
+        buffer.append(text_of(content, escape_text))
+
 
 def create_element(str tag, bint closing_tag=True):
-    cdef Element element = Element(tag, closing_tag)
-    def element_factory(*args, **kwargs):
-        return element(*args, **kwargs)
-    return element_factory
+    return Element(tag, closing_tag)
 
 
 
@@ -134,7 +640,7 @@ meter = create_element("meter")
 tfoot = create_element("tfoot")
 thead = create_element("thead")
 title = create_element("title")
-hgroup = create_element("hroup")
+hgroup = create_element("hgroup")
 script = create_element("script")
 select = create_element("select")
 strong = create_element("strong")
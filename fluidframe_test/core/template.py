@@ -0,0 +1,47 @@
+import re
+from typing import Any, Callable, Iterable, List, Sequence
+from fluidframe_test.core import Markup, Node, escape
+
+MARKER = re.compile("\x00(\\d+)\x00")
+
+
+class Template:
+    """A render traced once with placeholder values.
+
+    The static HTML is kept as constant `chunks` and `slots[n]` is the index of the
+    value spliced in between `chunks[n]` and `chunks[n + 1]`, so rendering only has
+    to escape the dynamic values and splice them in with a single C-level format.
+    """
+    def __init__(self, chunks: List[str], slots: List[int]) -> None:
+        self.chunks = chunks
+        self.slots = slots
+        pattern = [chunks[0].replace("{", "{{").replace("}", "}}")]
+        for slot, chunk in zip(slots, chunks[1:]):
+            pattern.append(f"{{{slot}}}")
+            pattern.append(chunk.replace("{", "{{").replace("}", "}}"))
+        self.pattern = ''.join(pattern)
+
+    @classmethod
+    def compile(cls, render: Callable[..., str], names: Sequence[str]) -> 'Template':
+        """Call `render` with one marker per slot name and split its output on the markers.
+
+        The render must place each value in the output verbatim; branching on a value
+        or transforming it cannot be traced.
+        """
+        html = render(**{name: f"\x00{n}\x00" for n, name in enumerate(names)})
+        if isinstance(html, Node):
+            html = html.render()
+        parts = MARKER.split(html)
+        chunks, slots = parts[0::2], [int(index) for index in parts[1::2]]
+        missing = set(range(len(names))) - set(slots)
+        if missing:
+            raise ValueError(f"Template slots {sorted(names[n] for n in missing)} do not appear verbatim in the rendered output")
+        return cls(chunks, slots)
+
+    def render(self, values: Sequence[Any]) -> Markup:
+        return Markup(self.pattern.format(*map(escape, values)))
+
+    def render_many(self, rows: Iterable[Sequence[Any]]) -> Markup:
+        """Render one row per value sequence with a single join over the prebuilt chunks."""
+        pattern = self.pattern.format
+        return Markup(''.join([pattern(*map(escape, values)) for values in rows]))
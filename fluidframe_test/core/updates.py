@@ -0,0 +1,57 @@
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Optional
+from fluidframe_test.config import FRAGMENT_TRACKER_SIZE
+
+# Id the page's scripts generate on every load, set by `ClientMiddleware`. Tabs of one
+# browser share the client cookie but each shows its own copy of the page, so what was
+# sent is remembered per page load.
+PAGE_ID: ContextVar[Optional[str]] = ContextVar("fluidframe_page", default=None)
+
+
+class FragmentTracker:
+    """LRU of the hash of the last fragment sent to each page load for each component.
+
+    A forgotten entry only means the next update of that component is sent again.
+    """
+    def __init__(self, maxsize: int=FRAGMENT_TRACKER_SIZE) -> None:
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.hashes: 'OrderedDict[tuple[str, str], int]' = OrderedDict()
+
+    def update(self, page_id: str, component_id: str, fragment: str) -> bool:
+        """Record `fragment` as sent and return whether it differs from the previous one."""
+        key = (page_id, component_id)
+        # str caches its hash, so fragments reused from the render cache hash for free.
+        value = hash(fragment)
+        with self.lock:
+            changed = self.hashes.get(key) != value
+            self.hashes[key] = value
+            self.hashes.move_to_end(key)
+            if len(self.hashes) > self.maxsize:
+                self.hashes.popitem(last=False)
+        return changed
+
+    def forget_page(self, page_id: str) -> None:
+        with self.lock:
+            for key in [key for key in self.hashes if key[0] == page_id]:
+                del self.hashes[key]
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+
+
+SENT_FRAGMENTS = FragmentTracker()
+
+def swap_oob(fragment: str, component_id: str) -> str:
+    """Mark `fragment` to replace the element `#component_id` as an HTMX out-of-band swap."""
+    attribute = f' hx-swap-oob="outerHTML:#{component_id}"'
+    start = fragment.find("<")
+    if start == -1 or not fragment[start + 1:start + 2].isalpha() or fragment[:start].strip():
+        return f'<div id="{component_id}"{attribute}>{fragment}</div>'
+    end = start + 1
+    while end < len(fragment) and fragment[end] not in " \t\n\r/>":
+        end += 1
+    return f"{fragment[:end]}{attribute}{fragment[end:]}"
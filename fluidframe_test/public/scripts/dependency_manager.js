@@ -1,105 +1,100 @@
-// Track the loaded resources
-let loadedResources = JSON.parse(localStorage.getItem('loadedResources')) || {
-    scripts: [],
-    styles: []
-  };
-  let resourceContent = JSON.parse(localStorage.getItem('resourceContent')) || {
-    scripts: {},
-    styles: {}
-  };
-  
-  
-  // Set up Intersection Observer
-  const dependency_observer = new IntersectionObserver((entries) => {
-    entries.forEach(entry => {
-      if (entry.isIntersecting) {
-        const target = entry.target;
-        const dependencies = JSON.parse(target.getAttribute('data-dependencies'));
-        loadDependencies(dependencies);
-        dependency_observer.unobserve(target);  // Stop observing once dependencies are loaded
-      }
-    });
-  }, {
-    root: null,
-    rootMargin: '100px',  // Load when within 100px of viewport
-    threshold: 0.1
+// Id of this page load. Tabs share the client cookie, so the server keeps what it sent
+// per page load: htmx requests carry it in a header and the push socket in its URL.
+window.fluidPageId = window.crypto && crypto.randomUUID
+  ? crypto.randomUUID()
+  : Math.random().toString(36).slice(2) + Date.now().toString(36);
+
+document.addEventListener('htmx:configRequest', (event) => {
+  event.detail.headers['X-Fluid-Page'] = window.fluidPageId;
+});
+
+// URLs already loaded or requested in this page, including those inside page bundles.
+const loadedResources = new Map();
+const scannedBundles = new WeakSet();
+
+// This script runs in the head, before the bundle tags exist, so bundles are read when a resource is requested.
+function scanBundles() {
+  document.querySelectorAll('[data-bundled]').forEach(el => {
+    if (scannedBundles.has(el)) {
+      return;
+    }
+    scannedBundles.add(el);
+    JSON.parse(el.getAttribute('data-bundled')).forEach(src => loadedResources.set(src, Promise.resolve()));
+  });
+}
+
+
+// Set up Intersection Observer
+const dependency_observer = new IntersectionObserver((entries) => {
+  entries.forEach(entry => {
+    if (entry.isIntersecting) {
+      const target = entry.target;
+      const dependencies = JSON.parse(target.getAttribute('data-dependencies'));
+      loadDependencies(dependencies);
+      dependency_observer.unobserve(target);  // Stop observing once dependencies are loaded
+    }
   });
-  
-  // Observe all elements with data-dependencies attribute
-  document.querySelectorAll('[data-dependencies]').forEach(el => {
-    dependency_observer.observe(el);
+}, {
+  root: null,
+  rootMargin: '100px',  // Load when within 100px of viewport
+  threshold: 0.1
+});
+
+// Observe all elements with data-dependencies attribute
+document.querySelectorAll('[data-dependencies]').forEach(el => {
+  dependency_observer.observe(el);
+});
+
+
+function loadResource(src, type) {
+  scanBundles();
+  if (loadedResources.has(src)) {
+    return loadedResources.get(src);
+  }
+  const selector = type === 'script' ? `script[src="${src}"]` : `link[href="${src}"]`;
+  if (document.querySelector(selector)) {
+    const loaded = Promise.resolve();
+    loadedResources.set(src, loaded);
+    return loaded;
+  }
+
+  const loaded = new Promise((resolve) => {
+    let element;
+    if (type === 'script') {
+      element = document.createElement('script');
+      // Dynamic scripts download in parallel; async=false keeps them executing in the order they were added.
+      element.async = false;
+      element.src = src;
+    } else {
+      element = document.createElement('link');
+      element.rel = 'stylesheet';
+      element.href = src;
+    }
+    element.onload = () => resolve();
+    element.onerror = () => {
+      console.error(`Failed to load ${type}:`, src);
+      loadedResources.delete(src);
+      resolve();
+    };
+    document.head.appendChild(element);
   });
-  
-  
-  function loadDependencies(dependencies) {
-    return new Promise((resolve) => {
-      const scripts = dependencies.scripts || [];
-      const styles = dependencies.styles || [];
-  
-      const loadResource = (src, type) => {
-        return new Promise((resolveResource) => {
-          // Check if the resource is already loaded in the DOM
-          let element = document.querySelector(`${type === 'script' ? 'script[src' : 'link[href'}="${src}"]`);
-          if (element) {
-            console.log(`${type} already loaded in the DOM:`, src);
-            resolveResource();
-            return;
-          }
-  
-          // Check if the resource is already loaded in the array
-          if (loadedResources[type + 's'].includes(src)) {
-            console.log(`${type} already loaded:`, src);
-            if (!element) {
-              element = document.createElement(type === 'script' ? 'script' : 'link');
-              if (type === 'script') {
-                element.src = src;
-                element.textContent = resourceContent.scripts[src];
-              } else {
-                element.rel = 'stylesheet';
-                element.href = src;
-                element.textContent = resourceContent.styles[src];
-              }
-              document.head.appendChild(element);
-            }
-            resolveResource();
-            return;
-          }
-  
-          // Load the resource
-          element = document.createElement(type === 'script' ? 'script' : 'link');
-          if (type === 'script') {
-            element.src = src;
-          } else {
-            element.rel = 'stylesheet';
-            element.href = src;
-          }
-  
-          element.onload = () => {
-            loadedResources[type + 's'].push(src);
-            if (type === 'script') {
-              resourceContent.scripts[src] = element.textContent;
-            } else {
-              resourceContent.styles[src] = element.sheet.cssRules[0].cssText;
-            }
-            localStorage.setItem('loadedResources', JSON.stringify(loadedResources));
-            localStorage.setItem('resourceContent', JSON.stringify(resourceContent));
-            console.log(`Loaded ${type}:`, src);
-            resolveResource();
-          };
-  
-          document.head.appendChild(element);
-        });
-      };
-  
-      const loadSequentially = async (resources, type) => {
-        for (const resource of resources) {
-          await loadResource(resource, type);
-        }
-      };
-  
-      Promise.all([
-        loadSequentially(styles, 'style'),
-        loadSequentially(scripts, 'script')
-      ]).then(() => resolve());
+  loadedResources.set(src, loaded);
+  return loaded;
+}
+
+function loadDependencies(dependencies) {
+  // Streamed pages link their bundles at the end of the body, after the fragments
+  // asking for dependencies, so those wait until the whole page is parsed.
+  if (document.readyState === 'loading') {
+    return new Promise(resolve => {
+      document.addEventListener('DOMContentLoaded', () => resolve(loadDependencies(dependencies)), {once: true});
     });
-  }
\ No newline at end of file
+  }
+  const scripts = dependencies.scripts || [];
+  const styles = dependencies.styles || [];
+  // Everything is requested at once; only the scripts of one declaration run in their declared order.
+  return Promise.all([
+    ...styles.map(src => loadResource(src, 'style')),
+    ...scripts.map(src => loadResource(src, 'script')),
+  ]);
+}
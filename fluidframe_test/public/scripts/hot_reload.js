@@ -13,7 +13,8 @@ class WebSocketManager {
       const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
       const host = window.location.host;
       const wsEndpoint = '/ws';
-      return `${protocol}//${host}${wsEndpoint}`;
+      const page = window.fluidPageId ? `?page=${encodeURIComponent(window.fluidPageId)}` : '';
+      return `${protocol}//${host}${wsEndpoint}${page}`;
   }
 
   connect() {
@@ -51,6 +52,30 @@ class WebSocketManager {
   onMessage(event) {
       if (event.data === "pong") {
           console.log('Received pong from server');
+          return;
+      }
+      const message = JSON.parse(event.data);
+      if (message.type === "swap") {
+          this.swap(message.id, message.html);
+      } else if (message.type === "reload") {
+          window.location.reload();
+      }
+  }
+
+  swap(id, html) {
+      const target = document.getElementById(id);
+      if (!target) {
+          return;
+      }
+      const template = document.createElement('template');
+      template.innerHTML = html.trim();
+      const replacement = template.content.firstElementChild;
+      if (!replacement) {
+          return;
+      }
+      target.replaceWith(replacement);
+      if (window.htmx) {
+          htmx.process(replacement);
       }
   }
 
@@ -1,30 +1,153 @@
-import hashlib, re
+import hashlib
 import string, json
-from typing import List
-from bs4 import BeautifulSoup
-from markdown_it import MarkdownIt
-from mdit_py_plugins.anchors import anchors_plugin
-from mdit_py_plugins.footnote import footnote_plugin
-from mdit_py_plugins.tasklists import tasklists_plugin
-from mdit_py_plugins.front_matter import front_matter_plugin
+import os, threading, time
+from functools import lru_cache
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+from fluidframe_test.core.tags.tags import Markup, prettify as prettify_html
+from fluidframe_test.config import MARKDOWN_CACHE_SIZE, MARKDOWN_PARALLEL_THRESHOLD
 
+# markdown-it, its plugins and the process pool are imported on first use, so apps
+# that never render markdown don't pay for them at startup.
+if TYPE_CHECKING:
+    from markdown_it import MarkdownIt
+    from concurrent.futures import ProcessPoolExecutor
 
 
 MARKDOWNER = None
+MARKDOWN_POOL: Optional['ProcessPoolExecutor'] = None
+MARKDOWN_POOL_WORKERS = 0
+MARKDOWN_LOCK = threading.Lock()
+MARKDOWN_CACHE: 'OrderedDict[bytes, Markup]' = OrderedDict()
+MARKDOWN_STATS = {"hits": 0, "misses": 0, "render_seconds": 0.0}
 
-def markdown_to_html(markdown_text: str) -> str:
+def create_markdowner() -> 'MarkdownIt':
+    from markdown_it import MarkdownIt
+    from mdit_py_plugins.anchors import anchors_plugin
+    from mdit_py_plugins.footnote import footnote_plugin
+    from mdit_py_plugins.tasklists import tasklists_plugin
+    from mdit_py_plugins.front_matter import front_matter_plugin
+    markdowner = MarkdownIt('commonmark', {'linkify': True, 'break': True, 'html': True})
+    return markdowner.use(footnote_plugin).use(front_matter_plugin).use(anchors_plugin).use(tasklists_plugin).enable('table')
+
+def get_markdowner() -> 'MarkdownIt':
     global MARKDOWNER
     if MARKDOWNER is None:
-        MARKDOWNER = MarkdownIt('commonmark', {'linkify': True, 'break': True, 'html': True})
-        MARKDOWNER = MARKDOWNER.use(footnote_plugin).use(front_matter_plugin).use(anchors_plugin).use(tasklists_plugin).enable('table')
-    return MARKDOWNER.render(markdown_text)
+        MARKDOWNER = create_markdowner()
+    return MARKDOWNER
+
+def markdown_key(markdown_text: str) -> bytes:
+    return hashlib.blake2b(markdown_text.encode(), digest_size=16).digest()
+
+def cached_markdown(key: bytes) -> Optional[Markup]:
+    with MARKDOWN_LOCK:
+        html = MARKDOWN_CACHE.get(key)
+        if html is None:
+            MARKDOWN_STATS["misses"] += 1
+            return None
+        MARKDOWN_CACHE.move_to_end(key)
+        MARKDOWN_STATS["hits"] += 1
+        return html
+
+def cache_markdown(key: bytes, html: Markup, seconds: float) -> None:
+    with MARKDOWN_LOCK:
+        MARKDOWN_CACHE[key] = html
+        MARKDOWN_CACHE.move_to_end(key)
+        MARKDOWN_STATS["render_seconds"] += seconds
+        while len(MARKDOWN_CACHE) > MARKDOWN_CACHE_SIZE:
+            MARKDOWN_CACHE.popitem(last=False)
+
+def markdown_to_html(markdown_text: str) -> Markup:
+    key = markdown_key(markdown_text)
+    html = cached_markdown(key)
+    if html is None:
+        start = time.perf_counter()
+        html = Markup(get_markdowner().render(markdown_text))
+        cache_markdown(key, html, time.perf_counter() - start)
+    return html
+
+def render_markdown_batch(texts: List[str]) -> List[str]:
+    # Runs inside a pool worker, which builds its own MarkdownIt on first use.
+    markdowner = get_markdowner()
+    return [markdowner.render(text) for text in texts]
+
+def get_markdown_pool(workers: int) -> 'ProcessPoolExecutor':
+    """Return the shared markdown pool, recreated if it was started with a different number of workers."""
+    global MARKDOWN_POOL, MARKDOWN_POOL_WORKERS
+    if MARKDOWN_POOL is not None and MARKDOWN_POOL_WORKERS != workers:
+        close_markdown_pool()
+    if MARKDOWN_POOL is None:
+        from concurrent.futures import ProcessPoolExecutor
+        MARKDOWN_POOL = ProcessPoolExecutor(max_workers=workers)
+        MARKDOWN_POOL_WORKERS = workers
+    return MARKDOWN_POOL
+
+def markdown_to_html_many(texts: Iterable[str], workers: Optional[int] = None, parallel_threshold: int = MARKDOWN_PARALLEL_THRESHOLD) -> List[Markup]:
+    """Render many markdown texts, fanning large batches of cache misses out to worker processes.
+
+    `workers` defaults to the number of CPUs. Calling with a different value than the
+    running pool was started with replaces the pool.
+    """
+    texts = list(texts)
+    results: List[Optional[Markup]] = [None] * len(texts)
+    pending: Dict[bytes, List[int]] = {}
+    for index, text in enumerate(texts):
+        key = markdown_key(text)
+        if key in pending:
+            pending[key].append(index)
+            continue
+        html = cached_markdown(key)
+        if html is None:
+            pending[key] = [index]
+        else:
+            results[index] = html
+    if not pending:
+        return results
+
+    keys = list(pending)
+    sources = [texts[pending[key][0]] for key in keys]
+    start = time.perf_counter()
+    if len(sources) < parallel_threshold:
+        rendered = render_markdown_batch(sources)
+    else:
+        workers = workers or os.cpu_count() or 1
+        pool = get_markdown_pool(workers)
+        # A few batches per worker keeps them busy without paying IPC per document.
+        size = max(1, len(sources) // (workers * 4))
+        batches = [sources[n:n + size] for n in range(0, len(sources), size)]
+        rendered = [html for batch in pool.map(render_markdown_batch, batches) for html in batch]
+    seconds = (time.perf_counter() - start) / len(sources)
+
+    for key, html in zip(keys, rendered):
+        html = Markup(html)
+        cache_markdown(key, html, seconds)
+        for index in pending[key]:
+            results[index] = html
+    return results
 
-def prettify(html: str) -> str:
-    soup = BeautifulSoup(html, 'html.parser')
-    html_string = soup.prettify()
-    lines = html_string.split('\n')
-    html_string = '\n'.join(' ' * (len(line) - len(line.lstrip())) * 2 + line.lstrip() for line in lines)
-    return re.sub(r'\n\s*\n', '\n\n', html_string)
+def close_markdown_pool() -> None:
+    global MARKDOWN_POOL, MARKDOWN_POOL_WORKERS
+    if MARKDOWN_POOL is not None:
+        MARKDOWN_POOL.shutdown()
+        MARKDOWN_POOL = None
+        MARKDOWN_POOL_WORKERS = 0
+
+def markdown_stats() -> Dict[str, float]:
+    with MARKDOWN_LOCK:
+        hits, misses, seconds = MARKDOWN_STATS["hits"], MARKDOWN_STATS["misses"], MARKDOWN_STATS["render_seconds"]
+        size = len(MARKDOWN_CACHE)
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "size": size,
+        "hit_rate": hits / lookups if lookups else 0.0,
+        "render_seconds": seconds,
+        "mean_render_ms": seconds / misses * 1e3 if misses else 0.0,
+    }
+
+def prettify(html: str, indent: int = 2) -> str:
+    return prettify_html(html, indent)
 
 def save_as_html(file_path, html_string):
     with open(file_path, 'w') as file:
@@ -68,10 +191,25 @@ class FixedLengthIDGenerator:
     
 
 
+BASE36_CHARS = string.ascii_lowercase + string.digits
+
+@lru_cache(maxsize=65536)
+def segment_code(name: str, length: int = 4) -> str:
+    # `length` base-36 digits need far fewer bits than the 160-bit digest, so a 64-bit
+    # prefix is reduced instead of converting the whole digest to base 36.
+    number = int.from_bytes(hashlib.sha1(name.encode()).digest()[:8], 'big') % (36 ** length)
+    encoded = []
+    for _ in range(length):
+        number, rem = divmod(number, 36)
+        encoded.append(BASE36_CHARS[rem])
+    return ''.join(reversed(encoded))
+
+
 class UniqueIDGenerator:
     def __init__(self):
         self.generated_ids = set()
-        self.base_chars = string.ascii_lowercase + string.digits
+        self.base_chars = BASE36_CHARS
+        self.counters: Dict[str, int] = {}
 
     def base_encode(self, number, base_chars):
         if number == 0:
@@ -84,22 +222,22 @@ class UniqueIDGenerator:
         return ''.join(reversed(encoded))
     
     def generate_base_code(self, name, length=4):
-        hash_object = hashlib.sha1(name.encode())
-        hash_code = int(hash_object.hexdigest(), 16)
-        return self.base_encode(hash_code, self.base_chars)[:length]
+        return segment_code(name, length)
     
     def generate_unique_id(self, component_path):
         if len(component_path)==1:
-            unique_id=component_path[0]
+            base_id = unique_id = component_path[0]
         else:
-            base_codes = [self.generate_base_code(name) for name in component_path]
-            base_id = '-'.join(base_codes)
+            base_id = '-'.join([segment_code(name) for name in component_path])
             unique_id = f'{base_id}-{component_path[-1]}'
-        extra_index = 0
-        while unique_id in self.generated_ids:
-            extra_code = self.base_encode(extra_index, self.base_chars)
-            unique_id = f"{base_id}-{extra_code}"
-            extra_index += 1
+        if unique_id in self.generated_ids:
+            # Resume from the last suffix handed out for this base id instead of probing from 0.
+            extra_index = self.counters.get(base_id, 0)
+            unique_id = f"{base_id}-{self.base_encode(extra_index, self.base_chars)}"
+            while unique_id in self.generated_ids:
+                extra_index += 1
+                unique_id = f"{base_id}-{self.base_encode(extra_index, self.base_chars)}"
+            self.counters[base_id] = extra_index + 1
         self.generated_ids.add(unique_id)
         return unique_id
     
@@ -3,7 +3,7 @@ from starlette.applications import Starlette
 from starlette.responses import HTMLResponse
 from starlette.routing import Route, WebSocketRoute
 from starlette.websockets import WebSocketDisconnect
-from fluidframe_test.core import div, head, body, html, button, script, link, span
+from fluidframe_test.core import Markup, div, head, body, html, button, script, link, span
 
 
 contacts = [
@@ -17,7 +17,7 @@ async def homepage(request):
             head(
                 script(src="https://cdnjs.cloudflare.com/ajax/libs/htmx/2.0.2/htmx.min.js"),
                 link(href="https://cdnjs.cloudflare.com/ajax/libs/tailwindcss/2.2.19/tailwind.min.css", rel="stylesheet"),
-                """
+                Markup("""
                 <style>
                     .tooltip {
                         display: none; /* Hide by default */
@@ -36,7 +36,7 @@ async def homepage(request):
                         border: 1px solid #ccc;
                     }
                 </style>
-                """
+                """)
             ),
             body(
                 div(
@@ -46,7 +46,7 @@ async def homepage(request):
                     span(id="tooltip", cls="tooltip"),
                     cls="hover-div", hx_get="/tooltip-content", hx_trigger="mouseenter", hx_target="#tooltip", hx_swap="innerHTML",
                 ),
-                """
+                Markup("""
                 <script>
                     const hoverDiv = document.querySelector('.hover-div');
                     const tooltip = document.getElementById('tooltip');
@@ -64,7 +64,7 @@ async def homepage(request):
                         tooltip.style.top = e.pageY + 10 + 'px';
                     });
                 </script>
-                """,
+                """),
                 cls="dark:bg-gray-700 bg-white dark:text-white flex justify-content h-full w-full"
             )
         )
@@ -0,0 +1,54 @@
+from fluidframe_test.core import p
+from fluidframe_test.core.cache import RENDER_CACHE, RenderCache
+from fluidframe_test.core.components import Root, StatelessComponent, render_component
+
+
+class Value(StatelessComponent):
+    def render(self):
+        return p(str(self.value), id=self.id)
+
+
+def make_value(value):
+    root = Root(reload=False)
+    component = Value(root, key="value", value=value)
+    root.add_child(component)
+    return component
+
+
+def test_inputs_with_colliding_hashes_do_not_share_entries():
+    RENDER_CACHE.clear()
+    assert hash(-1) == hash(-2)
+    component = make_value(-1)
+    assert render_component(component) == '<p id="value" >-1</p>'
+    component.value = -2
+    assert render_component(component) == '<p id="value" >-2</p>'
+
+
+def test_equal_inputs_of_different_types_do_not_share_entries():
+    RENDER_CACHE.clear()
+    component = make_value(1)
+    assert render_component(component) == '<p id="value" >1</p>'
+    component.value = True
+    assert render_component(component) == '<p id="value" >True</p>'
+
+
+def test_unhashable_inputs_are_cached_by_value():
+    RENDER_CACHE.clear()
+    component = make_value([1, 2])
+    render_component(component)
+    render_component(component)
+    assert RENDER_CACHE.hits == 1
+    component.value = [1, 3]
+    assert render_component(component) == '<p id="value" >[1, 3]</p>'
+
+
+def test_cache_evicts_least_recently_used():
+    cache = RenderCache(maxsize=2)
+    cache.set("a", (), "a")
+    cache.set("b", (), "b")
+    cache.get("a", ())
+    cache.set("c", (), "c")
+    assert cache.get("b", ()) is None
+    assert cache.get("a", ()) == "a"
+    cache.invalidate("a")
+    assert cache.get("a", ()) is None
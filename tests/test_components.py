@@ -0,0 +1,43 @@
+import asyncio
+from starlette.testclient import TestClient
+from fluidframe_test.core import p, div
+from fluidframe_test.config import WINDOW_PREFIX
+from fluidframe_test.core.fluidframe import FluidFrame
+from fluidframe_test.core.components import LayoutComponent, StatelessComponent
+
+
+class AsyncText(StatelessComponent):
+    async def render(self):
+        await asyncio.sleep(0)
+        return p(self.text, id=self.id)
+
+
+class Column(LayoutComponent):
+    def render(self):
+        return div(self.render_children(), id=self.id)
+
+
+def make_app(window=None):
+    app = FluidFrame(reload=False)
+    column = Column(app, key="column", window=window)
+    column.children = [AsyncText(column, text=f"row {n}") for n in range(5)]
+    app.child(column)
+    return app
+
+
+def test_layout_renders_async_children():
+    with TestClient(make_app()) as client:
+        response = client.get("/")
+    assert response.status_code == 200
+    assert all(f"row {n}</p>" in response.text for n in range(5))
+
+
+def test_windowed_layout_renders_async_children():
+    with TestClient(make_app(window=2)) as client:
+        page = client.get("/")
+        assert page.status_code == 200
+        assert "row 1</p>" in page.text and "row 2</p>" not in page.text
+        assert f'hx-get="{WINDOW_PREFIX}/column?start=2"' in page.text
+        window = client.get(f"{WINDOW_PREFIX}/column?start=2")
+    assert window.status_code == 200
+    assert "row 3</p>" in window.text and "start=4" in window.text
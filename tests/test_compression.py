@@ -0,0 +1,119 @@
+import gzip
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import HTMLResponse
+from starlette.routing import Mount, Route
+from starlette.testclient import TestClient
+from fluidframe_test.core.compression import CompressionMiddleware, negotiate, share
+from fluidframe_test.core.static import HashedStaticFiles
+
+SCRIPT = b"console.log('fluidframe');\n" * 100
+
+
+@pytest.mark.parametrize("header, encoding", [
+    ("gzip, deflate, br", "gzip"),
+    ("deflate", "deflate"),
+    ("gzip;q=0, deflate", "deflate"),
+    ("gzip; q=0.5, deflate; q=0.8", "deflate"),
+    ("GZIP;Q=1", "gzip"),
+    ("*", "gzip"),
+    ("*;q=0, deflate;q=0.1", "deflate"),
+    ("gzip;q=0", None),
+    ("identity", None),
+    ("", None),
+])
+def test_negotiate_honours_q_values(header, encoding):
+    assert negotiate(header) == encoding
+
+
+@pytest.fixture
+def static_client(tmp_path):
+    (tmp_path / "app.js").write_bytes(SCRIPT)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(SCRIPT))
+    app = Starlette(routes=[Mount("/static", HashedStaticFiles(directory=tmp_path))])
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("header", ["gzip", "deflate, gzip;q=0.5", "*"])
+def test_static_files_serve_precompressed_gzip(static_client, header):
+    response = static_client.get("/static/app.js", headers={"Accept-Encoding": header})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == SCRIPT
+
+
+@pytest.mark.parametrize("header", ["gzip;q=0", "identity", "*;q=0", "gzip; q=0.0, deflate"])
+def test_static_files_skip_refused_gzip(static_client, header):
+    response = static_client.get("/static/app.js", headers={"Accept-Encoding": header})
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == SCRIPT
+
+
+async def shared_page(request):
+    share(request.scope)
+    return HTMLResponse(f"<p>{request.path_params['name']}</p>" * 200, headers={"ETag": '"v1"'})
+
+async def private_page(request):
+    return HTMLResponse(f"<p>{request.path_params['name']}</p>" * 200)
+
+async def small_page(request):
+    return HTMLResponse("<p>small</p>")
+
+
+@pytest.fixture
+def compression():
+    app = Starlette(routes=[
+        Route("/shared/{name}", shared_page),
+        Route("/private/{name}", private_page),
+        Route("/small", small_page),
+    ])
+    return CompressionMiddleware(app, cache_bytes=1024)
+
+
+@pytest.mark.parametrize("header, encoding", [("gzip", "gzip"), ("gzip;q=0, deflate", "deflate")])
+def test_middleware_compresses_and_varies(compression, header, encoding):
+    response = TestClient(compression).get("/shared/a", headers={"Accept-Encoding": header})
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert response.text == "<p>a</p>" * 200
+
+
+@pytest.mark.parametrize("path, header", [("/shared/a", "gzip;q=0"), ("/shared/a", "identity"), ("/small", "gzip")])
+def test_middleware_leaves_bodies_alone(compression, path, header):
+    response = TestClient(compression).get(path, headers={"Accept-Encoding": header})
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+def test_middleware_caches_only_shared_bodies(compression):
+    client = TestClient(compression)
+    for _ in range(2):
+        client.get("/shared/a", headers={"Accept-Encoding": "gzip"})
+        response = client.get("/private/a", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+    assert (compression.hits, compression.misses) == (1, 1)
+    assert len(compression.cache) == 1
+
+
+def test_middleware_keeps_the_cache_under_its_byte_cap(compression):
+    client = TestClient(compression)
+    for name in range(40):
+        client.get(f"/shared/{name}", headers={"Accept-Encoding": "gzip"})
+    assert compression.size == sum(len(body) for body in compression.cache.values())
+    assert 0 < compression.size <= compression.cache_bytes
+    assert len(compression.cache) < 40
+
+
+def test_middleware_caches_static_files(tmp_path):
+    (tmp_path / "app.js").write_bytes(SCRIPT)
+    middleware = CompressionMiddleware(Starlette(routes=[Mount("/static", HashedStaticFiles(directory=tmp_path))]))
+    client = TestClient(middleware)
+    for _ in range(2):
+        response = client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(SCRIPT)
+        assert response.content == SCRIPT
+    assert (middleware.hits, middleware.misses) == (1, 1)
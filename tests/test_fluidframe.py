@@ -0,0 +1,61 @@
+from starlette.testclient import TestClient
+from fluidframe_test.core import p
+from fluidframe_test.config import EVENT_PREFIX
+from fluidframe_test.core.fluidframe import FluidFrame
+from fluidframe_test.core.components import StatefulComponent, StatelessComponent
+
+
+class Text(StatelessComponent):
+    def render(self):
+        return p(self.text, id=self.id)
+
+
+def make_app(**kwargs):
+    app = FluidFrame(reload=False, **kwargs)
+    app.child(Text(app, text="hello"))
+    return app
+
+
+def test_streamed_page_starts_with_html_tags():
+    with TestClient(make_app(stream=True)) as client:
+        page = client.get("/").text
+    assert page.startswith('<!DOCTYPE html><html lang="eng" ><head ')
+    assert "&lt;" not in page
+    assert "<p" in page and "hello</p>" in page
+
+
+def test_streamed_page_matches_rendered_page():
+    with TestClient(make_app(stream=True)) as client:
+        streamed = client.get("/").text
+    with TestClient(make_app()) as client:
+        rendered = client.get("/").text
+    assert streamed == rendered
+
+
+class Counter(StatefulComponent):
+    def render(self):
+        return p(str(self.get_state("count", 0)), id=self.id)
+
+    def handle_update(self, new_data):
+        pass
+
+
+def test_state_changes_through_state_invalidate_the_page_etag():
+    app = FluidFrame(reload=False, etag=True)
+    counter = app.child(Counter(app, key="counter"))
+
+    @counter.on_change("click", counter, "outerHTML")
+    def increment():
+        counter.state.set_state("count", counter.get_state("count", 0) + 1)
+        return counter
+
+    with TestClient(app) as client:
+        first = client.get("/")
+        etag = first.headers["ETag"]
+        assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+        client.get(f"{EVENT_PREFIX}/counter/click")
+        second = client.get("/", headers={"If-None-Match": etag})
+        assert second.status_code == 200
+        assert ">1</p>" in second.text
+        counter.state.remove_state("count")
+        assert client.get("/", headers={"If-None-Match": second.headers["ETag"]}).status_code == 200
@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+from fluidframe_test.core.metrics import Metrics
+
+
+def component(type="card", id="card-1"):
+    return SimpleNamespace(type=type, id=id)
+
+
+def lines(metrics, prefix):
+    return [line for line in metrics.render().splitlines() if line.startswith(prefix)]
+
+
+def test_component_renders_are_added_when_read():
+    metrics = Metrics()
+    metrics.observe_component(component(), 0.00005, 10, False)
+    metrics.observe_component(component(id="card-2"), 0.003, 20, True)
+    assert not metrics.series
+    assert lines(metrics, "fluidframe_render_seconds_count") == ['fluidframe_render_seconds_count{kind="component",type="card"} 2']
+    assert 'fluidframe_render_seconds_bucket{kind="component",type="card",le="0.0001"} 1' in lines(metrics, "fluidframe_render_seconds_bucket")
+    assert 'fluidframe_render_seconds_bucket{kind="component",type="card",le="0.005"} 2' in lines(metrics, "fluidframe_render_seconds_bucket")
+    assert lines(metrics, "fluidframe_render_output_size_total") == ['fluidframe_render_output_size_total{kind="component",type="card"} 30']
+    assert lines(metrics, "fluidframe_render_cache_total") == [
+        'fluidframe_render_cache_total{kind="component",type="card",result="hit"} 1',
+        'fluidframe_render_cache_total{kind="component",type="card",result="miss"} 1',
+    ]
+
+
+def test_pending_renders_are_added_every_batch():
+    metrics = Metrics(batch=3)
+    for _ in range(7):
+        metrics.observe_component(component(), 0.001, 1)
+    assert len(metrics.pending) == 1
+    assert sum(metrics.series[("component", "card", None)].buckets) == 6
+
+
+def test_per_id_series():
+    metrics = Metrics(per_id=True)
+    metrics.observe_component(component(), 0.001, 1)
+    metrics.observe("event", "card", "card-1", 0.001, 1)
+    assert lines(metrics, "fluidframe_render_seconds_count") == [
+        'fluidframe_render_seconds_count{kind="event",type="card",id="card-1"} 1',
+        'fluidframe_render_seconds_count{kind="component",type="card",id="card-1"} 1',
+    ]
@@ -0,0 +1,129 @@
+"""Every event route and page bundle resolves on every prefork worker.
+
+`serve` runs with several workers in a child process and every component's event
+route is requested over fresh connections, so the kernel spreads them across the
+workers. The routes are taken from an app built here, which also checks that ids
+come out the same in separate processes. Each handler answers with its worker's
+pid. The bundle URLs of one rendered page are then requested the same way.
+"""
+import os, re, sys, time
+import socket, subprocess
+import html, httpx
+import pytest
+from fluidframe_test.config import EVENT_PREFIX, BUNDLE_PREFIX, PUBLIC_DIR
+from fluidframe_test.core import div
+from fluidframe_test.core.dependency import requires
+from fluidframe_test.core.fluidframe import FluidFrame
+from fluidframe_test.core.components import StatelessComponent, LayoutComponent
+
+WORKERS = 3
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="the prefork server needs os.fork")
+
+
+class Label(StatelessComponent):
+    def __init__(self, parent, text, key=None):
+        super().__init__(parent, key, text=text)
+
+    def render(self):
+        return div(self.text, id=self.id)
+
+
+class Column(LayoutComponent):
+    def render(self):
+        return div(requires(f"{PUBLIC_DIR}/scripts/hot_reload.js"), [child.render() for child in self.children], id=self.id)
+
+
+def build_app(components: int = 50) -> FluidFrame:
+    app = FluidFrame(reload=False)
+    for n in range(components):
+        column = app.child(Column(app))
+        column.add_child(Label(column, f"label {n}"))
+        for component in (column, *column.children):
+            component.on_change("click", component, "outerHTML")(lambda: str(os.getpid()))
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_up(url: str, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server at {url} did not start")
+
+
+# Without keep-alive every request opens a new connection, which any worker can accept.
+CLIENT = httpx.Client(limits=httpx.Limits(max_keepalive_connections=0))
+
+def get(url: str) -> httpx.Response:
+    return CLIENT.get(url)
+
+
+def python_env() -> dict:
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")]))}
+
+
+@pytest.fixture(scope="module")
+def server():
+    port = free_port()
+    process = subprocess.Popen([sys.executable, __file__, str(port)], env=python_env())
+    base = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_up(base + "/")
+        yield base
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def test_every_event_route_resolves_on_every_worker(server):
+    pids = set()
+    for _ in range(2):
+        for component_id, trigger in build_app().event_handlers:
+            response = get(f"{server}{EVENT_PREFIX}/{component_id}/{trigger}")
+            assert response.status_code == 200, f"{component_id}/{trigger}"
+            pids.add(response.text)
+    assert len(pids) == WORKERS
+
+
+def test_page_bundles_resolve_on_every_worker(server):
+    # Bundles are named by the worker rendering the page and may be fetched from any other.
+    page = get(server + "/").text
+    bundles = [html.unescape(url) for url in re.findall(f'"({BUNDLE_PREFIX}/[^"]+)"', page)]
+    assert bundles
+    for _ in range(10 * WORKERS):
+        for url in bundles:
+            assert get(server + url).status_code == 200, url
+
+
+if __name__ == '__main__':
+    from fluidframe_test.core.server import serve
+    serve(build_app, port=int(sys.argv[1]), workers=WORKERS, log_level="warning")
+
+
+def test_workers_failing_on_startup_restart_with_backoff():
+    # A missing key file makes every worker fail as it starts.
+    code = (
+        "import logging; logging.basicConfig(level=logging.WARNING, format='%(message)s')\n"
+        "from fluidframe_test.core.fluidframe import FluidFrame\n"
+        "from fluidframe_test.core.server import serve\n"
+        f"serve(FluidFrame(reload=False), port={free_port()}, workers=1, ssl_keyfile='/nonexistent.key', ssl_certfile='/nonexistent.crt')\n"
+    )
+    process = subprocess.Popen([sys.executable, "-c", code], env=python_env(), stderr=subprocess.PIPE, text=True)
+    time.sleep(2.5)
+    process.terminate()
+    _, log = process.communicate(timeout=10)
+    delays = re.findall(r"Worker \d+ exited with code 1, restarting in ([\d.]+)s", log)
+    # 0.5s, then 1s: two restarts fit in the time a tight loop would have made hundreds.
+    assert delays[:2] == ["0.5", "1.0"]
+    assert len(delays) <= 3
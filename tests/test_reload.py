@@ -0,0 +1,73 @@
+import sys, types, asyncio
+import pytest
+from starlette.testclient import TestClient
+from fluidframe_test.core.reload import FRAMEWORK_DIR, FileWatcher, HotReloader
+
+APP_SOURCE = """
+from fluidframe_test.core import p
+from fluidframe_test.core.fluidframe import FluidFrame
+from fluidframe_test.core.components import StatelessComponent
+
+class Text(StatelessComponent):
+    def render(self):
+        return p("{text}", id=self.id)
+
+app = FluidFrame(reload=False)
+app.child(Text(app, key="text"))
+
+if __name__ == "__main__":
+    raise SystemExit("the main block must not run on reload")
+"""
+
+
+@pytest.fixture
+def app_file(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    path = tmp_path / "reload_demo_app.py"
+    path.write_text(APP_SOURCE.format(text="before"))
+    yield path
+    sys.modules.pop("reload_demo_app", None)
+
+
+def edit(path, text):
+    path.write_text(APP_SOURCE.format(text=text))
+
+
+def test_app_module_change_rebuilds_the_served_app(app_file):
+    import reload_demo_app
+    app = reload_demo_app.app
+    reloader = HotReloader(app, paths=[str(app_file.parent)])
+    with TestClient(app) as client:
+        assert "before</p>" in client.get("/").text
+        edit(app_file, "after")
+        asyncio.run(reloader.apply([str(app_file)]))
+        assert "after</p>" in client.get("/").text
+        assert reloader.app.hub is app.hub
+        edit(app_file, "edited again")
+        asyncio.run(reloader.apply([str(app_file)]))
+        assert "edited again</p>" in client.get("/").text
+
+
+def test_main_module_change_rebuilds_without_running_the_main_block(app_file):
+    import reload_demo_app
+    app = reload_demo_app.app
+    main = types.ModuleType("__main__")
+    main.__file__ = str(app_file)
+    reloader = HotReloader(app, paths=[str(app_file.parent)])
+    edit(app_file, "after")
+    reloader.rebuild(main)
+    with TestClient(app) as client:
+        assert "after</p>" in client.get("/").text
+
+
+def test_watcher_skips_virtual_environments(tmp_path):
+    for name in ("src", "venv", ".venv", "lib/site-packages", "custom-env"):
+        (tmp_path / name).mkdir(parents=True)
+        (tmp_path / name / "module.py").write_text("")
+    (tmp_path / "custom-env" / "pyvenv.cfg").write_text("")
+    assert list(FileWatcher([str(tmp_path)]).mtimes) == [str(tmp_path / "src" / "module.py")]
+
+
+def test_framework_dir_does_not_match_sibling_directories():
+    assert FRAMEWORK_DIR.endswith(("/", "\\"))
+    assert not (FRAMEWORK_DIR.rstrip("/\\") + "_extras/module.py").startswith(FRAMEWORK_DIR)
@@ -0,0 +1,139 @@
+import os
+import pytest
+from starlette.responses import PlainTextResponse
+from starlette.testclient import TestClient
+from fluidframe_test.config import PAGE_HEADER, STATE_COOKIE
+from fluidframe_test.core import state
+from fluidframe_test.core.state import CLIENT_ID, ClientMiddleware, MemoryStateStore, SQLiteStateStore
+from fluidframe_test.core.updates import PAGE_ID
+
+
+class Clock:
+    def __init__(self, now: float=1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(state.time, "monotonic", clock)
+    monkeypatch.setattr(state.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    store = SQLiteStateStore(str(tmp_path / "state.sqlite3"), ttl=100)
+    yield store
+    store.close()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStateStore(ttl=100)
+    else:
+        yield request.getfixturevalue("sqlite_store")
+
+
+def test_store_round_trip(store):
+    assert store.get("client", "counter") is None
+    store.set("client", "counter", {"count": 1})
+    assert store.get("client", "counter") == {"count": 1}
+    assert store.get("other", "counter") is None
+    store.delete("client", "counter")
+    assert store.get("client", "counter") is None
+
+
+def test_reads_renew_the_expiry(store, clock):
+    store.set("client", "counter", {"count": 1})
+    for _ in range(3):
+        clock.now += 60
+        assert store.get("client", "counter") == {"count": 1}
+    clock.now += 101
+    assert store.get("client", "counter") is None
+
+
+def test_memory_store_evicts_least_recently_used():
+    store = MemoryStateStore(max_entries=2)
+    store.set("a", "c", {"n": 1})
+    store.set("b", "c", {"n": 1})
+    store.get("a", "c")
+    store.set("c", "c", {"n": 1})
+    assert store.get("b", "c") is None
+    assert store.get("a", "c") == {"n": 1}
+    assert len(store) == 2
+
+
+def test_memory_store_keeps_under_its_byte_cap():
+    values = {"text": "x" * 1000}
+    store = MemoryStateStore(max_bytes=3500)
+    for client in "abcde":
+        store.set(client, "c", values)
+    assert len(store) == 3
+    assert store.size <= 3500
+    assert store.get("a", "c") is None and store.get("e", "c") == values
+
+
+def test_sqlite_store_versions_changes(sqlite_store):
+    assert sqlite_store.version() == 0
+    sqlite_store.set("client", "counter", {"count": 1})
+    sqlite_store.get("client", "counter")
+    sqlite_store.delete("client", "counter")
+    assert sqlite_store.version() == 2
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_sqlite_store_is_shared_across_fork(sqlite_store):
+    sqlite_store.set("client", "counter", {"count": 1})
+    pid = os.fork()
+    if pid == 0:
+        # The child opens its own connection and sees the parent's records.
+        code = 1
+        try:
+            if sqlite_store.get("client", "counter") == {"count": 1}:
+                sqlite_store.set("client", "counter", {"count": 2})
+                code = 0
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert sqlite_store.get("client", "counter") == {"count": 2}
+
+
+async def whoami(scope, receive, send):
+    response = PlainTextResponse(f"{CLIENT_ID.get()} {PAGE_ID.get()}")
+    await response(scope, receive, send)
+
+
+async def whoami_socket(scope, receive, send):
+    if scope["type"] == "http":
+        await whoami(scope, receive, send)
+        return
+    await receive()
+    await send({"type": "websocket.accept"})
+    await send({"type": "websocket.send", "text": f"{CLIENT_ID.get()} {PAGE_ID.get()}"})
+    await send({"type": "websocket.close"})
+
+
+def test_client_middleware_assigns_and_keeps_the_client_id():
+    client = TestClient(ClientMiddleware(whoami))
+    first = client.get("/")
+    client_id = first.cookies[STATE_COOKIE]
+    assert first.text == f"{client_id} None"
+    assert "HttpOnly" in first.headers["set-cookie"]
+    second = client.get("/", headers={PAGE_HEADER: "tab-1"})
+    assert second.text == f"{client_id} tab-1"
+    assert "set-cookie" not in second.headers
+
+
+def test_client_middleware_reads_the_page_of_sockets():
+    client = TestClient(ClientMiddleware(whoami_socket))
+    client.get("/")
+    with client.websocket_connect("/ws?page=tab-2") as socket:
+        client_id, page_id = socket.receive_text().split()
+    assert client_id == client.cookies[STATE_COOKIE]
+    assert page_id == "tab-2"
@@ -0,0 +1,77 @@
+import pytest
+from starlette.testclient import TestClient
+from fluidframe_test.core import div
+from fluidframe_test.config import EVENT_PREFIX, PAGE_HEADER
+from fluidframe_test.core.fluidframe import FluidFrame
+from fluidframe_test.core.components import StatefulComponent
+from fluidframe_test.core.updates import SENT_FRAGMENTS, FragmentTracker, swap_oob
+
+
+class Counter(StatefulComponent):
+    def render(self):
+        return div(str(self.get_state("count", 0)), id=self.id)
+
+    def handle_update(self, new_data):
+        pass
+
+
+@pytest.fixture
+def client():
+    SENT_FRAGMENTS.hashes.clear()
+    app = FluidFrame(reload=False)
+    counter = app.child(Counter(None, key="counter"))
+
+    @counter.on_change("click", counter, "outerHTML")
+    def increment():
+        counter.set_state({"count": 1})
+        return counter
+
+    with TestClient(app) as client:
+        client.get("/")
+        yield client
+
+
+def click(client, page=None):
+    headers = {PAGE_HEADER: page} if page else {}
+    return client.get(f"{EVENT_PREFIX}/counter/click", headers=headers)
+
+
+def test_tracker_reports_changes_per_page():
+    tracker = FragmentTracker()
+    assert tracker.update("page-a", "c", "<p>1</p>")
+    assert not tracker.update("page-a", "c", "<p>1</p>")
+    assert tracker.update("page-b", "c", "<p>1</p>")
+    assert tracker.update("page-a", "c", "<p>2</p>")
+
+
+def test_tracker_forgets_oldest_entries():
+    tracker = FragmentTracker(maxsize=2)
+    for page in ("a", "b", "c"):
+        tracker.update(page, "c", "<p>1</p>")
+    assert len(tracker) == 2
+    assert tracker.update("a", "c", "<p>1</p>")
+
+
+def test_unchanged_fragment_answers_no_content(client):
+    first = click(client, "tab-a")
+    assert first.status_code == 200
+    assert first.headers["HX-Reswap"] == "none"
+    assert 'hx-swap-oob="outerHTML:#counter"' in first.text
+    assert click(client, "tab-a").status_code == 204
+
+
+def test_each_tab_of_a_browser_gets_its_update(client):
+    assert click(client, "tab-a").status_code == 200
+    second_tab = click(client, "tab-b")
+    assert second_tab.status_code == 200
+    assert ">1</div>" in second_tab.text
+
+
+def test_requests_without_page_id_always_get_the_fragment(client):
+    assert click(client).status_code == 200
+    assert click(client).status_code == 200
+
+
+def test_swap_oob_marks_root_element_or_wraps_text():
+    assert swap_oob('<div id="x">a</div>', "x") == '<div hx-swap-oob="outerHTML:#x" id="x">a</div>'
+    assert swap_oob("text", "x") == '<div id="x" hx-swap-oob="outerHTML:#x">text</div>'